@@ -0,0 +1,327 @@
+"""
+Binary, memory-mappable dataset format for sorting benchmarks.
+
+A dataset file (.bin) is a 16-byte header followed by the values packed as
+little-endian signed 64-bit integers:
+
+    offset  size  field
+    0       4     magic b'SRTD'
+    4       2     format version (1)
+    6       1     typecode of the payload (b'q')
+    7       1     reserved (0)
+    8       8     number of values
+
+Loading maps the file with mmap and exposes the payload as a memoryview (or a NumPy
+array) without copying it or creating a Python int per value. The map is copy-on-write,
+so a loaded dataset can be sorted in-place without modifying the file.
+
+Usage:
+    python data/dataset_format.py convert datasets/*.json   # writes datasets/*.bin
+    python data/dataset_format.py info datasets/random_1000.bin
+"""
+
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+MAGIC = b'SRTD'
+VERSION = 1
+TYPECODE = 'q'
+HEADER = struct.Struct('<4sHcxQ')
+HEADER_SIZE = HEADER.size
+ITEM_SIZE = array(TYPECODE).itemsize
+
+# The payload is little-endian; big-endian hosts must byte-swap (and therefore copy)
+NATIVE_LITTLE_ENDIAN = sys.byteorder == 'little'
+
+# Values written per block by the incremental writer
+WRITE_BLOCK_SIZE = 1 << 16
+
+
+class DatasetFormatError(ValueError):
+    """Raised when a file is not a valid binary dataset."""
+
+
+def read_header(f):
+    """
+    Read and validate the header at the start of an open binary file.
+
+    Args:
+        f: File object opened in binary mode, positioned at offset 0
+
+    Returns:
+        The number of values in the dataset
+    """
+    raw = f.read(HEADER_SIZE)
+    if len(raw) != HEADER_SIZE:
+        raise DatasetFormatError("File is too short to be a binary dataset")
+    magic, version, typecode, count = HEADER.unpack(raw)
+    if magic != MAGIC:
+        raise DatasetFormatError(f"Bad magic {magic!r}; not a binary dataset")
+    if version != VERSION:
+        raise DatasetFormatError(f"Unsupported dataset format version {version}")
+    if typecode != TYPECODE.encode():
+        raise DatasetFormatError(f"Unsupported payload typecode {typecode!r}")
+    return count
+
+
+class BinaryDatasetWriter:
+    """
+    Write a binary dataset incrementally, one value or one block at a time.
+
+    The header is written with a count of 0 and patched on close(), so the total does
+    not need to be known up front and the full dataset never has to be in memory.
+    """
+
+    def __init__(self, path, block_size=WRITE_BLOCK_SIZE):
+        """
+        Args:
+            path: Destination file
+            block_size: Number of values buffered by write() before they are written out
+        """
+        self.file = open(path, 'wb')
+        self.file.write(HEADER.pack(MAGIC, VERSION, TYPECODE.encode(), 0))
+        self.block_size = block_size
+        self.buffer = array(TYPECODE)
+        self.count = 0
+
+    def write(self, value):
+        """Append a single value."""
+        self.buffer.append(value)
+        if len(self.buffer) >= self.block_size:
+            self.flush()
+
+    def write_block(self, values):
+        """Append a sequence of values (list, array('q') or NumPy int64 array)."""
+        self.flush()
+        block = values if isinstance(values, array) and values.typecode == TYPECODE else array(TYPECODE, values)
+        self.write_packed(block)
+
+    def flush(self):
+        """Write out any buffered values."""
+        if self.buffer:
+            self.write_packed(self.buffer)
+            self.buffer = array(TYPECODE)
+
+    def write_packed(self, block):
+        if not NATIVE_LITTLE_ENDIAN:
+            block = array(TYPECODE, block)
+            block.byteswap()
+        block.tofile(self.file)
+        self.count += len(block)
+
+    def close(self):
+        """Flush remaining values and record the final count in the header."""
+        self.flush()
+        self.file.seek(0)
+        self.file.write(HEADER.pack(MAGIC, VERSION, TYPECODE.encode(), self.count))
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class JsonDatasetWriter:
+    """
+    Write a JSON array of integers incrementally, with the BinaryDatasetWriter interface.
+    """
+
+    def __init__(self, path):
+        self.file = open(path, 'w')
+        self.file.write('[')
+        self.count = 0
+
+    def write(self, value):
+        """Append a single value."""
+        self.write_block([value])
+
+    def write_block(self, values):
+        """Append a sequence of values."""
+        if len(values) == 0:
+            return
+        text = ', '.join(map(str, values))
+        self.file.write(text if self.count == 0 else ', ' + text)
+        self.count += len(values)
+
+    def close(self):
+        """Close the array and the file."""
+        self.file.write(']')
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def open_dataset_writer(path):
+    """Return an incremental writer for path: binary for .bin, JSON for .json."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.bin':
+        return BinaryDatasetWriter(path)
+    if extension == '.json':
+        return JsonDatasetWriter(path)
+    raise ValueError(f"Unsupported dataset format: '{extension}' (use .bin or .json)")
+
+
+def save_binary_dataset(dataset, path):
+    """
+    Save a sequence of integers as a binary dataset.
+
+    Args:
+        dataset: A list, array('q') or NumPy int64 array of integers
+        path: Destination file
+    """
+    with BinaryDatasetWriter(path) as writer:
+        writer.write_block(dataset)
+
+
+class BinaryDataset:
+    """
+    A memory-mapped binary dataset.
+
+    view is a memoryview of 'q' values over the mapped payload; it is writable
+    (copy-on-write), so sorting it in-place leaves the file untouched. Call close() or
+    use the object as a context manager once no array derived from it is in use.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, 'rb')
+        try:
+            self.count = read_header(self.file)
+        except DatasetFormatError:
+            self.file.close()
+            raise
+
+        expected_size = HEADER_SIZE + self.count * ITEM_SIZE
+        actual_size = os.fstat(self.file.fileno()).st_size
+        if actual_size < expected_size:
+            self.file.close()
+            raise DatasetFormatError(f"Truncated dataset: expected {expected_size} bytes, found {actual_size}")
+
+        if self.count == 0:
+            # mmap cannot map an empty payload; an empty array behaves the same
+            self.map = None
+            self.view = memoryview(array(TYPECODE))
+        else:
+            self.map = mmap.mmap(self.file.fileno(), expected_size, access=mmap.ACCESS_COPY)
+            raw = memoryview(self.map)[HEADER_SIZE:expected_size]
+            if NATIVE_LITTLE_ENDIAN:
+                self.view = raw.cast(TYPECODE)
+            else:
+                swapped = array(TYPECODE, raw.tobytes())
+                swapped.byteswap()
+                raw.release()
+                self.view = memoryview(swapped)
+
+    def __len__(self):
+        return self.count
+
+    def to_array(self):
+        """Return a copy of the values as array('q')."""
+        return array(TYPECODE, self.view)
+
+    def to_list(self):
+        """Return the values as a list of Python ints (materializes every value)."""
+        return self.view.tolist()
+
+    def to_numpy(self):
+        """Return a NumPy int64 array that shares memory with the mapping (no copy)."""
+        import numpy as np
+        return np.frombuffer(self.view, dtype=np.int64)
+
+    def close(self):
+        """Release the view and unmap the file."""
+        self.view.release()
+        if self.map is not None:
+            self.map.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def open_binary_dataset(path):
+    """Memory-map a binary dataset; see BinaryDataset."""
+    return BinaryDataset(path)
+
+
+def load_binary_dataset(path):
+    """
+    Read a whole binary dataset into an array('q') without going through mmap.
+
+    Args:
+        path: Binary dataset file
+
+    Returns:
+        An array('q') with the values
+    """
+    with open(path, 'rb') as f:
+        count = read_header(f)
+        values = array(TYPECODE)
+        try:
+            values.fromfile(f, count)
+        except EOFError:
+            raise DatasetFormatError(f"Truncated dataset: expected {count} values, found {len(values)}") from None
+    if not NATIVE_LITTLE_ENDIAN:
+        values.byteswap()
+    return values
+
+
+def convert_json_dataset(json_path, bin_path=None):
+    """
+    Convert a JSON dataset (a list of integers) into a binary dataset.
+
+    Args:
+        json_path: Source .json file
+        bin_path: Destination file (default: json_path with a .bin extension)
+
+    Returns:
+        The path of the binary dataset
+    """
+    if bin_path is None:
+        bin_path = os.path.splitext(json_path)[0] + '.bin'
+    with open(json_path, 'r') as f:
+        dataset = json.load(f)
+    save_binary_dataset(dataset, bin_path)
+    return bin_path
+
+
+def main():
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Binary dataset utilities.")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    convert_parser = subparsers.add_parser('convert', help="convert JSON datasets to binary")
+    convert_parser.add_argument('files', nargs='+', help="JSON dataset files")
+
+    info_parser = subparsers.add_parser('info', help="print the header of binary datasets")
+    info_parser.add_argument('files', nargs='+', help="binary dataset files")
+
+    args = parser.parse_args()
+
+    if args.command == 'convert':
+        for json_path in args.files:
+            bin_path = convert_json_dataset(json_path)
+            print(f"Converted {json_path} -> {bin_path}")
+    else:
+        for path in args.files:
+            with open(path, 'rb') as f:
+                count = read_header(f)
+            print(f"{path}: {count} values")
+
+
+if __name__ == "__main__":
+    main()
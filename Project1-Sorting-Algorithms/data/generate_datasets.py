@@ -7,18 +7,35 @@ This script creates various types of datasets as described in the design documen
 3. Reverse Sorted Arrays
 4. Arrays with Duplicate Values
 5. Constant Arrays
+
+Each dataset is written both as JSON and in the binary format of data/dataset_format.py,
+which the benchmarks load through mmap without parsing. For sizes too large to build as
+a list, use data/stream_datasets.py.
+
+Usage:
+    python data/generate_datasets.py [--sizes 100 1000 10000 100000]
 """
 
+import argparse
 import random
 import os
+import sys
 import json
 
-# Create data directory if it doesn't exist
-os.makedirs('datasets', exist_ok=True)
+# Add the parent directory to the path so we can import the dataset format
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.dataset_format import save_binary_dataset
 
 def generate_random_array(size, min_val=-10000, max_val=10000):
-    """Generate an array of random integers."""
-    return random.sample(range(min_val, max_val+1), min(size, max_val-min_val+1))
+    """Generate an array of random integers.
+    
+    Values are distinct while the range allows it; larger arrays draw with replacement
+    instead of being silently truncated to the size of the range.
+    """
+    if size <= max_val - min_val + 1:
+        return random.sample(range(min_val, max_val+1), size)
+    return [random.randint(min_val, max_val) for _ in range(size)]
 
 def generate_nearly_sorted_array(size, percent_unsorted=10):
     """Generate a nearly sorted array (only a small percentage is out of order)."""
@@ -28,9 +45,12 @@ def generate_nearly_sorted_array(size, percent_unsorted=10):
     # Calculate how many elements to swap
     num_swaps = int(size * percent_unsorted / 100)
     
-    # Perform random swaps
-    for _ in range(num_swaps):
-        i, j = random.sample(range(size), 2)
+    # Perform random swaps (randrange avoids building a range sample per swap)
+    for _ in range(num_swaps if size > 1 else 0):
+        i = random.randrange(size)
+        j = random.randrange(size - 1)
+        if j >= i:
+            j += 1
         arr[i], arr[j] = arr[j], arr[i]
     
     return arr
@@ -54,37 +74,59 @@ def generate_array_with_duplicates(size, unique_percent=20):
     
     return arr
 
+def generate_skewed_duplicates_array(size, num_unique=1000, skew=1.2, min_val=-1000):
+    """Generate an array of duplicates whose frequencies follow a Zipf distribution.
+    
+    The k-th most common value appears roughly 1/k**skew times as often as the most
+    common one, so a few keys dominate the array.
+    """
+    values = random.sample(range(min_val, min_val + 2 * num_unique), num_unique)
+    weights = [1 / (rank ** skew) for rank in range(1, num_unique + 1)]
+    return random.choices(values, weights=weights, k=size)
+
 def generate_constant_array(size, value=42):
     """Generate an array where all elements have the same value."""
     return [value] * size
 
 def save_dataset(dataset, filename):
-    """Save a dataset to a JSON file."""
+    """Save a dataset to datasets/filename as JSON, plus a binary copy with a .bin extension."""
     with open(f'datasets/{filename}', 'w') as f:
         json.dump(dataset, f)
     print(f"Saved {len(dataset)} elements to datasets/{filename}")
+    
+    binary_filename = os.path.splitext(filename)[0] + '.bin'
+    save_binary_dataset(dataset, f'datasets/{binary_filename}')
+    print(f"Saved {len(dataset)} elements to datasets/{binary_filename}")
 
-# Generate datasets of various sizes
-sizes = [100, 1000, 10000]
-for size in sizes:
-    # Random arrays
-    save_dataset(generate_random_array(size), f'random_{size}.json')
+if __name__ == "__main__":
+    # Create data directory if it doesn't exist
+    os.makedirs('datasets', exist_ok=True)
+    
+    parser = argparse.ArgumentParser(description="Generate the standard benchmark datasets.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 10000],
+                        help="dataset sizes (default: 100 1000 10000)")
+    args = parser.parse_args()
+    
+    # Generate datasets of various sizes
+    for size in args.sizes:
+        # Random arrays
+        save_dataset(generate_random_array(size), f'random_{size}.json')
     
-    # Nearly sorted arrays
-    save_dataset(generate_nearly_sorted_array(size), f'nearly_sorted_{size}.json')
+        # Nearly sorted arrays
+        save_dataset(generate_nearly_sorted_array(size), f'nearly_sorted_{size}.json')
     
-    # Reverse sorted arrays
-    save_dataset(generate_reverse_sorted_array(size), f'reverse_sorted_{size}.json')
+        # Reverse sorted arrays
+        save_dataset(generate_reverse_sorted_array(size), f'reverse_sorted_{size}.json')
     
-    # Arrays with duplicates
-    save_dataset(generate_array_with_duplicates(size), f'duplicates_{size}.json')
+        # Arrays with duplicates
+        save_dataset(generate_array_with_duplicates(size), f'duplicates_{size}.json')
     
-    # Constant arrays
-    save_dataset(generate_constant_array(size), f'constant_{size}.json')
+        # Constant arrays
+        save_dataset(generate_constant_array(size), f'constant_{size}.json')
 
-# Special test cases
-save_dataset([], 'empty.json')  # Empty array
-save_dataset([42], 'single.json')  # Single element
-save_dataset([7, 3], 'two_elements.json')  # Two elements
+    # Special test cases
+    save_dataset([], 'empty.json')  # Empty array
+    save_dataset([42], 'single.json')  # Single element
+    save_dataset([7, 3], 'two_elements.json')  # Two elements
 
-print("All datasets generated successfully!")
\ No newline at end of file
+    print("All datasets generated successfully!")
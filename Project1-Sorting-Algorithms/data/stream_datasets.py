@@ -0,0 +1,245 @@
+"""
+Streaming, seedable generator for large synthetic datasets.
+
+generate_datasets.py builds every dataset as one list, which limits it to sizes that
+fit comfortably in memory. This module produces a dataset block by block and writes
+each block out before generating the next, so sizes up to 10^8 need only a few
+megabytes. It has separate controls for:
+1. Order: 'random' (independent draws), 'sorted' or 'reverse'
+2. Runs: the sorted/reverse data is made of this many independently sorted runs
+3. Inversions: approximately this many inversions are added inside the runs by
+   reversing evenly spread windows of equal length
+4. Duplicate ratio: the values come from a pool of (1 - ratio) * size distinct keys
+5. Zipf skew: frequencies of the distinct values follow 1/rank**skew
+6. Value range: every value lies in [min_val, max_val]
+
+Sorted runs are built by stratified sampling: each block draws its values from its own
+slice of the value distribution and sorts only that block.
+
+Usage:
+    python data/stream_datasets.py datasets/random_100000000.bin --size 1e8 --seed 1
+    python data/stream_datasets.py datasets/runs.bin --size 1e6 --order sorted --runs 16
+    python data/stream_datasets.py datasets/zipf.json --size 1e5 --duplicates 0.99 --zipf 1.2
+"""
+
+import argparse
+import os
+import random
+import sys
+from array import array
+
+# Add the parent directory to the path so we can import the dataset format
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.dataset_format import open_dataset_writer
+
+# Elements generated per block
+BLOCK_SIZE = 1 << 16
+
+# Longest window reversed when adding inversions (bounds the memory of one block)
+MAX_WINDOW = 1 << 20
+
+ORDERS = ['random', 'sorted', 'reverse']
+
+
+def make_quantile(size, duplicates=None, zipf=0.0, min_val=-10000, max_val=10000):
+    """
+    Build the quantile function of the value distribution.
+
+    Without duplicates or skew, values are uniform over [min_val, max_val]. Otherwise
+    values come from a pool of distinct keys, spread evenly over the range, whose
+    frequencies follow a Zipf law with exponent zipf (uniform for zipf=0). Smaller keys
+    are the more frequent ones. The function is non-decreasing, so sorted inputs give
+    sorted values.
+
+    Args:
+        size: Number of elements in the dataset
+        duplicates: Duplicate ratio, setting the pool to (1 - duplicates) * size keys
+            (None: no pool)
+        zipf: Zipf exponent of the key frequencies
+        min_val: Smallest value
+        max_val: Largest value
+
+    Returns:
+        A function mapping u in [0, 1) to an integer value
+    """
+    if min_val > max_val:
+        raise ValueError("min_val must not exceed max_val")
+    span = max_val - min_val + 1
+
+    if duplicates is None and zipf == 0:
+        return lambda u: min(max_val, min_val + int(u * span))
+
+    if duplicates is None:
+        pool = min(span, max(1, size))
+    else:
+        if not 0 <= duplicates < 1:
+            raise ValueError("duplicates must be in [0, 1)")
+        pool = min(span, max(1, round(size * (1 - duplicates))))
+
+    if zipf == 0:
+        def rank(u):
+            return int(u * pool)
+    elif zipf == 1:
+        # Inverse CDF of the continuous 1/x law on [1, pool + 1)
+        def rank(u):
+            return int((pool + 1) ** u) - 1
+    else:
+        exponent = 1 - zipf
+        top = (pool + 1) ** exponent - 1
+
+        def rank(u):
+            return int((1 + u * top) ** (1 / exponent)) - 1
+
+    return lambda u: min_val + min(pool - 1, rank(u)) * span // pool
+
+
+def window_plan(run_length, inversions):
+    """
+    Choose how to add inversions to one sorted run of distinct values.
+
+    Reversing a window of L sorted values adds L * (L - 1) / 2 inversions; disjoint
+    windows add up. The window is the shortest one that can reach the target, which
+    keeps the count as close to it as possible.
+
+    Args:
+        run_length: Number of elements in the run
+        inversions: Target number of inversions
+
+    Returns:
+        (window length, number of windows to reverse, inversions added)
+    """
+    if inversions <= 0 or run_length < 2:
+        return 0, 0, 0
+    longest = min(run_length, MAX_WINDOW)
+    window = min(longest, max(2, 2 * inversions // run_length + 1))
+    while window < longest and (run_length // window) * window * (window - 1) // 2 < inversions:
+        window += 1
+
+    per_window = window * (window - 1) // 2
+    count = max(1, min(run_length // window, round(inversions / per_window)))
+    return window, count, count * per_window
+
+
+def stream_dataset(size, order='random', runs=1, inversions=0, duplicates=None, zipf=0.0,
+                   min_val=-10000, max_val=10000, seed=None, stats=None):
+    """
+    Generate a dataset as a sequence of array('q') blocks.
+
+    Args:
+        size: Number of elements
+        order: 'random', 'sorted' or 'reverse'
+        runs: Number of independently sorted runs (sorted and reverse order only)
+        inversions: Approximate number of inversions added inside the runs (sorted and
+            reverse order only; reverse order loses them instead). Exact for distinct
+            values; equal values swapped by a reversal add none.
+        duplicates: Duplicate ratio; values are drawn from (1 - duplicates) * size
+            distinct keys (None: no pool)
+        zipf: Zipf exponent of the value frequencies (0: uniform)
+        min_val: Smallest value
+        max_val: Largest value
+        seed: Seed for the random generator (optional)
+        stats: Dictionary to record the generated 'elements', 'runs' and
+            'window_inversions' in (optional)
+
+    Returns:
+        A generator of array('q') blocks
+    """
+    if order not in ORDERS:
+        raise ValueError(f"Unknown order: '{order}' (use one of {', '.join(ORDERS)})")
+    if order == 'random' and (runs != 1 or inversions):
+        raise ValueError("runs and inversions apply to sorted and reverse order only")
+
+    rng = random.Random(seed)
+    quantile = make_quantile(size, duplicates, zipf, min_val, max_val)
+    added = 0
+
+    if order == 'random':
+        for start in range(0, size, BLOCK_SIZE):
+            count = min(BLOCK_SIZE, size - start)
+            yield array('q', [quantile(rng.random()) for _ in range(count)])
+    else:
+        runs = max(1, min(runs, size)) if size else 1
+        for run in range(runs):
+            # Runs and their share of the inversions differ in length by at most one
+            run_length = size // runs + (1 if run < size % runs else 0)
+            run_inversions = inversions // runs + (1 if run < inversions % runs else 0)
+            window, window_count, run_added = window_plan(run_length, run_inversions)
+            added += run_added
+            total_windows = run_length // window if window else 0
+
+            # Blocks hold whole windows so no window spans two blocks
+            block_length = window * max(1, BLOCK_SIZE // window) if window else BLOCK_SIZE
+            for start in range(0, run_length, block_length):
+                end = min(run_length, start + block_length)
+                low, high = start / run_length, end / run_length
+                values = sorted(quantile(low + (high - low) * rng.random()) for _ in range(end - start))
+
+                if window:
+                    for index in range(start // window, end // window):
+                        # Reverse window_count of the total_windows windows, evenly spread
+                        if (index * window_count) // total_windows != ((index + 1) * window_count) // total_windows:
+                            offset = index * window - start
+                            values[offset:offset + window] = values[offset:offset + window][::-1]
+
+                if order == 'reverse':
+                    # Mirror the values so the run descends
+                    values = [min_val + max_val - value for value in values]
+                yield array('q', values)
+
+    if stats is not None:
+        stats['elements'] = size
+        stats['runs'] = 1 if order == 'random' else runs
+        stats['window_inversions'] = added
+
+
+def write_dataset(path, size, **options):
+    """
+    Generate a dataset with stream_dataset() and write it to path block by block.
+
+    Args:
+        path: Output file; .bin writes the binary format, .json a JSON array
+        size: Number of elements
+        **options: Keyword arguments of stream_dataset()
+
+    Returns:
+        The stats recorded by stream_dataset()
+    """
+    stats = {}
+    with open_dataset_writer(path) as writer:
+        for block in stream_dataset(size, stats=stats, **options):
+            writer.write_block(block)
+    return stats
+
+
+def parse_count(text):
+    """Parse an element count such as '100000' or '1e8'."""
+    return int(float(text))
+
+
+def main():
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Generate a large synthetic dataset incrementally.")
+    parser.add_argument('output', help="output file (.bin or .json)")
+    parser.add_argument('--size', type=parse_count, required=True, help="number of elements, e.g. 1e8")
+    parser.add_argument('--order', choices=ORDERS, default='random', help="element order (default: random)")
+    parser.add_argument('--runs', type=int, default=1, help="number of sorted runs (sorted/reverse order)")
+    parser.add_argument('--inversions', type=parse_count, default=0,
+                        help="approximate inversions added inside the runs (sorted/reverse order)")
+    parser.add_argument('--duplicates', type=float, default=None,
+                        help="duplicate ratio in [0, 1): draw from (1 - ratio) * size distinct values")
+    parser.add_argument('--zipf', type=float, default=0.0, help="Zipf exponent of value frequencies")
+    parser.add_argument('--min', dest='min_val', type=int, default=-10000, help="smallest value")
+    parser.add_argument('--max', dest='max_val', type=int, default=10000, help="largest value")
+    parser.add_argument('--seed', type=int, default=None, help="random seed")
+    args = parser.parse_args()
+
+    stats = write_dataset(args.output, args.size, order=args.order, runs=args.runs,
+                          inversions=args.inversions, duplicates=args.duplicates, zipf=args.zipf,
+                          min_val=args.min_val, max_val=args.max_val, seed=args.seed)
+    print(f"Wrote {stats['elements']} elements to {args.output} ({stats['runs']} run(s), "
+          f"{stats['window_inversions']} inversions added by window reversal)")
+
+
+if __name__ == "__main__":
+    main()
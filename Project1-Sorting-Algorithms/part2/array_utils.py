@@ -0,0 +1,62 @@
+"""
+Helpers that let the sorters work on lists, array.array objects and memoryviews alike.
+
+Indexing and element assignment behave the same on all three, but slices do not:
+slicing a memoryview returns a view (not a copy), and array.array and memoryview slices
+can only be assigned from objects of the same kind. The sorters use these helpers
+wherever they copy or bulk-assign slices.
+"""
+
+from array import array
+
+
+def copy_slice(arr, start, end):
+    """
+    Return an independent list holding arr[start:end].
+
+    Args:
+        arr: A list, array.array, memoryview or other sequence
+        start: First index
+        end: End index (exclusive)
+
+    Returns:
+        A new list
+    """
+    segment = arr[start:end]
+    if isinstance(segment, list):
+        return segment
+    return list(segment)
+
+
+def assign_slice(arr, start, end, values):
+    """
+    Perform arr[start:end] = values for lists, array.array objects and memoryviews.
+
+    Args:
+        arr: The sequence to write into
+        start: First index
+        end: End index (exclusive); end - start must equal len(values) unless arr is a list
+        values: Sequence of new values
+
+    Returns:
+        None (arr is modified in-place)
+    """
+    if isinstance(arr, list):
+        arr[start:end] = values
+    elif isinstance(arr, array):
+        arr[start:end] = values if isinstance(values, array) else array(arr.typecode, values)
+    elif isinstance(arr, memoryview):
+        try:
+            arr[start:end] = array(arr.format, values)
+        except (ValueError, TypeError):
+            # Formats without an array.array equivalent: copy one element at a time
+            for offset, value in enumerate(values):
+                arr[start + offset] = value
+    else:
+        # NumPy arrays and other sequences accept any iterable of the right length
+        arr[start:end] = values
+
+
+def is_sorted(arr):
+    """Return True if arr is in non-descending order."""
+    return all(not arr[i + 1] < arr[i] for i in range(len(arr) - 1))
@@ -0,0 +1,237 @@
+"""
+Sortedness profiling and automatic algorithm selection.
+
+performance_analysis.md concludes that the best algorithm depends on the shape of the
+input. auto_sort() applies that at runtime: it profiles a small sample of the input and
+routes it to the sorter that wins on inputs of that shape:
+1. Insertion Sort (binary search) for tiny inputs
+2. The adaptive Timsort-style Merge Sort when the input is made of long ascending or
+   descending runs
+3. Counting/Radix Sort (integer_sort) for integers drawn from a small range
+4. Three-way Quick Sort when most values repeat many times, or all sampled values are equal
+5. Introsort otherwise. Heap Sort is not routed to directly: it did not win on any
+   dataset family, and Introsort already falls back to it on adversarial inputs.
+
+The profile looks at O(SAMPLE_SIZE) positions, so its cost does not grow with n except
+for one type scan over the input before an integer sort. The thresholds below were
+calibrated with run_auto_sort_benchmarks() in performance_test.py.
+"""
+
+import math
+import os
+import random
+import sys
+import time
+
+# Add the parent directory to the path so we can import the sorting modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from part2.insertionsort import insertionsort_with_binary_search
+from part2.introsort import introsort
+from part2.key_sort import key_sort
+from part2.quicksort import quicksort_three_way
+from part2.radixsort import integer_sort, all_integers, COUNTING_RANGE_FACTOR
+from part2.timsort import timsort, MIN_MERGE
+
+# Number of adjacent pairs, random pairs and values examined by profile_input()
+SAMPLE_SIZE = 256
+
+# At most one sampled pair or value per this many elements
+SAMPLE_FRACTION = 8
+
+# Inputs whose sampled adjacent pairs are all but this fraction ascending (or all but
+# this fraction strictly descending) are treated as presorted runs
+RUN_DESCENT_FRACTION = 0.05
+
+# Values must repeat this many times on average before three-way partitioning pays off
+DUPLICATE_MULTIPLICITY = 16
+
+
+def profile_input(arr, sample_size=SAMPLE_SIZE, stats=None):
+    """
+    Estimate the shape of arr from a sample of its elements.
+
+    Args:
+        arr: The array to profile (not modified)
+        sample_size: Number of pairs and values to examine
+        stats: Dictionary to track performance statistics (optional); the comparisons
+            made while profiling are added to it
+
+    Returns:
+        A dictionary with:
+        - descent_fraction: fraction of adjacent pairs with arr[i] > arr[i + 1]
+        - ascent_fraction: fraction of adjacent pairs with arr[i] < arr[i + 1]
+        - inversion_fraction: fraction of pairs i < j with arr[i] > arr[j]
+        - estimated_runs: descents extrapolated to the whole array, plus one
+        - estimated_distinct: estimated number of distinct values
+        - integers: whether the sampled values are all ints
+        - sample_min, sample_max: smallest and largest sampled values, for integers
+    """
+    n = len(arr)
+    # Small arrays get a proportionally smaller sample, so profiling stays cheap
+    sample_size = max(1, min(sample_size, n // SAMPLE_FRACTION))
+    # Seeded by n so that the same input always gets the same decision;
+    # int(random() * n) is several times faster than randrange(n)
+    rng = random.Random(n)
+    draw = rng.random
+    comparisons = 0
+
+    # Local order: adjacent pairs
+    positions = [int(draw() * (n - 1)) for _ in range(sample_size)]
+    descents = ascents = 0
+    for i in positions:
+        comparisons += 1
+        if arr[i + 1] < arr[i]:
+            descents += 1
+        else:
+            comparisons += 1
+            if arr[i] < arr[i + 1]:
+                ascents += 1
+    pairs = sample_size
+
+    # Global order: random pairs i < j
+    inversions = 0
+    for _ in range(sample_size):
+        i, j = int(draw() * n), int(draw() * n)
+        if i > j:
+            i, j = j, i
+        comparisons += 1
+        if arr[j] < arr[i]:
+            inversions += 1
+
+    # Values drawn with replacement; repeats within the sample reveal repeats in arr
+    values = [arr[int(draw() * n)] for _ in range(sample_size)]
+    integers = all(type(value) is int for value in values)
+
+    if stats is not None:
+        stats['comparisons'] += comparisons
+
+    return {
+        'descent_fraction': descents / pairs,
+        'ascent_fraction': ascents / pairs,
+        'inversion_fraction': inversions / sample_size,
+        'estimated_runs': 1 + round(descents / pairs * (n - 1)),
+        'estimated_distinct': estimate_distinct(len(set(values)), sample_size, n),
+        'integers': integers,
+        'sample_min': min(values) if integers else None,
+        'sample_max': max(values) if integers else None,
+    }
+
+
+def estimate_distinct(seen, sample_size, n):
+    """
+    Estimate how many distinct values an array of n elements holds.
+
+    Drawing s values with replacement from D equally frequent values shows
+    D * (1 - exp(-s / D)) distinct values on average; this solves that for D.
+
+    Args:
+        seen: Number of distinct values in the sample
+        sample_size: Number of values drawn
+        n: Length of the array
+
+    Returns:
+        The estimate, between seen and n
+    """
+    if seen >= sample_size:
+        return n
+    low, high = seen, n
+    while high - low > 1:
+        middle = (low + high) // 2
+        if middle * -math.expm1(-sample_size / middle) < seen:
+            low = middle
+        else:
+            high = middle
+    return high
+
+
+def choose_algorithm(arr, profile):
+    """
+    Pick the sorter for arr from its profile.
+
+    Args:
+        arr: The array to sort
+        profile: The result of profile_input(arr)
+
+    Returns:
+        A sorter taking (arr, stats=None)
+    """
+    n = len(arr)
+
+    # Every sampled neighbour equal: one three-way partition finishes (near-)constant input
+    if profile['descent_fraction'] == profile['ascent_fraction'] == 0:
+        return quicksort_three_way
+
+    # Long ascending or strictly descending runs: Timsort merges (or reverses) them
+    if profile['descent_fraction'] <= RUN_DESCENT_FRACTION:
+        return timsort
+    if profile['descent_fraction'] >= 1 - RUN_DESCENT_FRACTION:
+        return timsort
+
+    # Small integer range: Counting Sort. The sample only bounds the range from below,
+    # so integer_sort() checks the true range before choosing its method.
+    if profile['integers'] and profile['sample_max'] - profile['sample_min'] + 1 <= COUNTING_RANGE_FACTOR * n:
+        if all_integers(arr):
+            return integer_sort
+
+    if n / profile['estimated_distinct'] >= DUPLICATE_MULTIPLICITY:
+        return quicksort_three_way
+    return introsort
+
+
+def auto_sort(arr, stats=None, key=None, reverse=False):
+    """
+    Sort an array with the algorithm best suited to its shape.
+
+    Args:
+        arr: The array to be sorted
+        stats: Dictionary to track performance statistics (optional). The chosen
+            sorter is recorded under 'algorithm', the profile under 'profile' and the
+            time spent profiling and choosing under 'profile_ns'; the comparisons
+            made while profiling are included in 'comparisons'.
+        key: Function computing the sort key of each element, called once
+            per element (optional)
+        reverse: Sort in descending order; equal keys keep their original order
+
+    Returns:
+        The stats dictionary, or None when stats is not provided
+        (the array is sorted in-place)
+    """
+    # Sort decorated keys instead of the elements (see part2/key_sort.py)
+    if key is not None or reverse:
+        return key_sort(arr, auto_sort, key, reverse, stats)
+
+    start = time.perf_counter_ns()
+    n = len(arr)
+    if n < MIN_MERGE:
+        profile = None
+        algorithm = insertionsort_with_binary_search
+    else:
+        profile = profile_input(arr, stats=stats)
+        algorithm = choose_algorithm(arr, profile)
+
+    if stats is not None:
+        stats['profile_ns'] = time.perf_counter_ns() - start
+        stats['profile'] = profile
+        stats['algorithm'] = algorithm.__name__
+
+    algorithm(arr, stats=stats)
+    return stats
+
+
+if __name__ == "__main__":
+    # Example usage: the same call on differently shaped inputs
+    from data.generate_datasets import (generate_random_array, generate_nearly_sorted_array,
+                                        generate_array_with_duplicates)
+
+    inputs = {
+        'random': generate_random_array(10000),
+        'nearly sorted (1%)': generate_nearly_sorted_array(10000, 1),
+        'duplicates': generate_array_with_duplicates(10000, 1),
+        'floats': [random.random() for _ in range(10000)],
+        'few distinct strings': [random.choice(['low', 'medium', 'high']) for _ in range(10000)],
+    }
+    for name, data in inputs.items():
+        stats = auto_sort(data, {'comparisons': 0, 'swaps': 0})
+        print(f"{name}: {stats['algorithm']} (profiled in {stats['profile_ns'] / 1e6:.2f} ms), "
+              f"sorted: {data == sorted(data)}")
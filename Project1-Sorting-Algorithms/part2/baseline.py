@@ -0,0 +1,251 @@
+"""
+Benchmark baselines and a regression gate.
+
+performance_test.py overwrites results/performance_results.csv on every run. This module
+keeps earlier runs and compares against them:
+1. save: store the rows of a results CSV as a baseline, keyed by algorithm, dataset,
+   size and git revision
+2. compare: compare a results CSV against a stored baseline and exit non-zero when an
+   algorithm became significantly slower, its comparison count changed, or one of its
+   cells failed or timed out
+3. list: show the stored revisions
+
+A slowdown counts as significant only when the median grew by more than the time
+threshold and the 95% confidence intervals of the two medians do not overlap, so one
+noisy run does not fail the gate. Comparison counts are deterministic for a fixed
+dataset, so any change beyond the count threshold is reported. A cell whose status
+(written by matrix_runner.py) is 'error' or 'timeout' has no metrics to compare; it is
+always reported and always fails the gate, and it is never stored in a baseline.
+
+Usage:
+    python part2/performance_test.py
+    python part2/baseline.py save
+    ... change a sorter, rerun performance_test.py ...
+    python part2/baseline.py compare --time-threshold 10
+"""
+
+import argparse
+import csv
+import json
+import os
+import subprocess
+import sys
+import time
+
+# Default locations, relative to the repository root like performance_test.py
+RESULTS_DIR = os.path.join('Project1-Sorting-Algorithms', 'results')
+DEFAULT_RESULTS_CSV = os.path.join(RESULTS_DIR, 'performance_results.csv')
+DEFAULT_BASELINE_FILE = os.path.join(RESULTS_DIR, 'baselines.json')
+
+# Relative increase (in percent) beyond which a change is reported
+DEFAULT_TIME_THRESHOLD = 10.0
+DEFAULT_COUNT_THRESHOLD = 1.0
+
+# Columns copied from the results CSV into a baseline entry
+METRIC_COLUMNS = ['time_uninstrumented_ms', 'time_uninstrumented_min_ms',
+                  'time_uninstrumented_ci_low_ms', 'time_uninstrumented_ci_high_ms',
+                  'time_uninstrumented_p95_ms', 'repeats', 'comparisons', 'swaps']
+
+
+def git_revision():
+    """
+    Return the short hash of HEAD, with a '-dirty' suffix for uncommitted changes.
+
+    Returns:
+        The revision string, or 'unknown' outside a git checkout
+    """
+    try:
+        revision = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                                  text=True, check=True).stdout.strip()
+        status = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'],
+                                capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+    return revision + '-dirty' if status else revision
+
+
+def entry_key(algorithm, dataset, size):
+    """Return the key identifying one benchmark cell within a revision."""
+    return f'{algorithm}|{dataset}|{size}'
+
+
+def read_results(path):
+    """
+    Read a results CSV written by performance_test.py.
+
+    Args:
+        path: CSV file
+
+    Returns:
+        A dictionary mapping entry_key() to a dictionary of float metrics, plus the
+        cell's 'status' ('ok' for CSVs written before statuses were recorded) and its
+        'error' message (None when it has none)
+    """
+    entries = {}
+    with open(path, newline='') as f:
+        for row in csv.DictReader(f):
+            metrics = {}
+            for column in METRIC_COLUMNS:
+                value = row.get(column)
+                metrics[column] = float(value) if value not in (None, '') else None
+            metrics['status'] = row.get('status') or 'ok'
+            metrics['error'] = row.get('error') or None
+            entries[entry_key(row['algorithm'], row['dataset'], row['size'])] = metrics
+    return entries
+
+
+def load_baselines(path):
+    """Return the stored baselines as {revision: {'saved_at': ..., 'entries': {...}}}."""
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def save_baseline(results_csv, baseline_file, revision=None):
+    """
+    Store the successful rows of results_csv as the baseline for revision.
+
+    Rows that failed or timed out have no metrics, so they are left out.
+
+    Args:
+        results_csv: Results CSV written by performance_test.py
+        baseline_file: JSON file holding every stored baseline
+        revision: Revision label (default: the current git revision)
+
+    Returns:
+        The revision the baseline was stored under
+    """
+    revision = revision or git_revision()
+    baselines = load_baselines(baseline_file)
+    entries = {key: metrics for key, metrics in read_results(results_csv).items()
+               if metrics['status'] == 'ok'}
+    baselines[revision] = {'saved_at': time.strftime('%Y-%m-%dT%H:%M:%S'), 'entries': entries}
+    with open(baseline_file, 'w') as f:
+        json.dump(baselines, f, indent=1, sort_keys=True)
+    return revision
+
+
+def latest_revision(baselines, exclude=None):
+    """Return the most recently saved revision other than exclude, or None."""
+    candidates = [(entry['saved_at'], revision) for revision, entry in baselines.items()
+                  if revision != exclude]
+    return max(candidates)[1] if candidates else None
+
+
+def percent_change(old, new):
+    """Return the change from old to new in percent (0 when old is 0 or missing)."""
+    if not old or new is None:
+        return 0.0
+    return (new - old) / old * 100
+
+
+def compare_entries(baseline, current, time_threshold=DEFAULT_TIME_THRESHOLD,
+                    count_threshold=DEFAULT_COUNT_THRESHOLD):
+    """
+    Compare current results with a baseline.
+
+    Args:
+        baseline: Entries of the baseline (entry_key() -> metrics)
+        current: Entries of the current run
+        time_threshold: Minimum median slowdown in percent to report
+        count_threshold: Minimum change of the comparison count in percent to report
+
+    Returns:
+        A list of (key, kind, message) tuples, where kind is 'error' or 'timeout' (for
+        current cells that did not finish, whether or not the baseline has them),
+        'slowdown', 'comparisons' or 'missing'
+    """
+    findings = []
+    for key in sorted(current):
+        status = current[key].get('status', 'ok')
+        if status != 'ok':
+            findings.append((key, status, current[key].get('error') or "cell did not finish"))
+
+    for key in sorted(baseline):
+        if key not in current:
+            findings.append((key, 'missing', "not present in the current results"))
+            continue
+        old, new = baseline[key], current[key]
+        if new.get('status', 'ok') != 'ok':
+            # Already reported above; there are no metrics to compare
+            continue
+
+        slowdown = percent_change(old['time_uninstrumented_ms'], new['time_uninstrumented_ms'])
+        # Significant only if the confidence intervals of the medians are disjoint
+        # (results without intervals fall back to the threshold alone)
+        new_low, old_high = new['time_uninstrumented_ci_low_ms'], old['time_uninstrumented_ci_high_ms']
+        disjoint = new_low is None or old_high is None or new_low > old_high
+        if slowdown > time_threshold and disjoint:
+            findings.append((key, 'slowdown',
+                             f"median {old['time_uninstrumented_ms']:.3f} ms -> "
+                             f"{new['time_uninstrumented_ms']:.3f} ms (+{slowdown:.1f}%)"))
+
+        comparison_change = percent_change(old['comparisons'], new['comparisons'])
+        if abs(comparison_change) > count_threshold:
+            findings.append((key, 'comparisons',
+                             f"comparisons {old['comparisons']:.0f} -> {new['comparisons']:.0f} "
+                             f"({comparison_change:+.1f}%)"))
+    return findings
+
+
+def main():
+    """Command-line entry point; compare exits with status 1 when it finds a regression."""
+    parser = argparse.ArgumentParser(description="Store benchmark baselines and gate regressions.")
+    parser.add_argument('--baseline-file', default=DEFAULT_BASELINE_FILE,
+                        help=f"baseline store (default: {DEFAULT_BASELINE_FILE})")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    save_parser = subparsers.add_parser('save', help="store a results CSV as a baseline")
+    save_parser.add_argument('--results', default=DEFAULT_RESULTS_CSV, help="results CSV to store")
+    save_parser.add_argument('--revision', help="label to store it under (default: git revision)")
+
+    compare_parser = subparsers.add_parser('compare', help="compare a results CSV with a baseline")
+    compare_parser.add_argument('--results', default=DEFAULT_RESULTS_CSV, help="results CSV to check")
+    compare_parser.add_argument('--baseline',
+                                help="revision to compare against (default: the latest one "
+                                     "stored for a different revision)")
+    compare_parser.add_argument('--time-threshold', type=float, default=DEFAULT_TIME_THRESHOLD,
+                                help="median slowdown in percent that fails the gate")
+    compare_parser.add_argument('--count-threshold', type=float, default=DEFAULT_COUNT_THRESHOLD,
+                                help="comparison count change in percent that fails the gate")
+    compare_parser.add_argument('--allow-missing', action='store_true',
+                                help="do not fail when baseline cells are missing from the results")
+
+    subparsers.add_parser('list', help="list the stored baselines")
+
+    args = parser.parse_args()
+    baselines = load_baselines(args.baseline_file)
+
+    if args.command == 'save':
+        revision = save_baseline(args.results, args.baseline_file, args.revision)
+        print(f"Stored baseline for revision {revision} in {args.baseline_file}")
+        return 0
+
+    if args.command == 'list':
+        for revision, entry in sorted(baselines.items(), key=lambda item: item[1]['saved_at']):
+            print(f"{revision}  saved {entry['saved_at']}  {len(entry['entries'])} cells")
+        return 0
+
+    revision = args.baseline or latest_revision(baselines, exclude=git_revision())
+    if revision not in baselines:
+        print(f"No baseline found (looked for {revision!r}); run 'save' first")
+        return 2
+
+    findings = compare_entries(baselines[revision]['entries'], read_results(args.results),
+                               args.time_threshold, args.count_threshold)
+    failures = [finding for finding in findings
+                if finding[1] != 'missing' or not args.allow_missing]
+
+    print(f"Compared {args.results} with baseline {revision}")
+    for key, kind, message in findings:
+        print(f"  [{kind}] {key.replace('|', ' / ')}: {message}")
+    if failures:
+        print(f"{len(failures)} regression(s) found")
+        return 1
+    print("No regressions found")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
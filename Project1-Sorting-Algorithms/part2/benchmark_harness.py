@@ -0,0 +1,267 @@
+"""
+Repeatable timing of sorting algorithms.
+
+A single wall-clock reading of one run is dominated by noise at small sizes and says
+nothing about its own spread. This module times a sorter the way a regression check
+needs it:
+1. time.perf_counter_ns() around the call only (copying the input is not timed)
+2. Warmup runs that are discarded, then a configurable number of measured repeats
+3. The garbage collector is run before and disabled during every measured call
+4. Median, p95 and min of the samples, with distribution-free confidence intervals for
+   the median and p95
+5. Optional CPU affinity pinning, and an option to take each measurement in a freshly
+   spawned interpreter so caches and heap state do not leak between tests
+
+measure_memory() profiles memory separately from the timed runs, because tracemalloc
+slows every allocation down.
+
+Usage:
+    options = dict(DEFAULT_OPTIONS, repeats=20)
+    measurement = measure(introsort, data, options)
+    print(summarize(measurement['samples_ns']))
+"""
+
+import gc
+import math
+import multiprocessing
+import os
+import sys
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # resource is Unix-only; peak RSS is then not reported
+    resource = None
+
+# Add the parent directory to the path so we can import the sorting modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from part2.array_utils import is_sorted
+from part2.numpy_backend import is_numpy_array, is_sorted_vectorized
+
+# warmup: discarded runs before measuring; repeats: measured runs;
+# disable_gc: collect before and disable the collector during each run;
+# subprocess: take the whole measurement in a freshly spawned interpreter
+DEFAULT_OPTIONS = {'warmup': 1, 'repeats': 5, 'disable_gc': True, 'subprocess': False}
+
+# Two-sided z value for 95% confidence intervals
+Z_95 = 1.959963984540054
+
+
+def measure(algorithm, dataset, options=None, instrumented=False):
+    """
+    Time algorithm on fresh copies of dataset.
+
+    Args:
+        algorithm: A sorter taking (arr, stats=None); it must be picklable (a module-level
+            function or a functools.partial of one) when options['subprocess'] is set
+        dataset: The input; it is copied before every run and never modified
+        options: Harness options (see DEFAULT_OPTIONS); missing keys take the defaults
+        instrumented: Pass a fresh stats dictionary to every run
+
+    Returns:
+        A dictionary with 'samples_ns' (one entry per measured repeat), 'stats' (from the
+        last run, or None) and 'verified' (whether the last run's output is sorted)
+    """
+    options = dict(DEFAULT_OPTIONS, **(options or {}))
+    if options['subprocess']:
+        options['subprocess'] = False
+        context = multiprocessing.get_context('spawn')
+        with context.Pool(1) as pool:
+            return pool.apply(measure, (algorithm, dataset, options, instrumented))
+
+    samples = []
+    stats = None
+    verified = False
+    gc_was_enabled = gc.isenabled()
+
+    for run in range(options['warmup'] + options['repeats']):
+        data = dataset.copy()
+        stats = {'comparisons': 0, 'swaps': 0} if instrumented else None
+        if options['disable_gc']:
+            gc.collect()
+            gc.disable()
+        try:
+            start = time.perf_counter_ns()
+            returned = algorithm(data, stats=stats)
+            elapsed = time.perf_counter_ns() - start
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        if run >= options['warmup']:
+            samples.append(elapsed)
+
+    # Merge Sort returns a new array; the in-place sorters return None or their stats
+    if options['warmup'] + options['repeats'] > 0:
+        sorted_data = data if returned is None or isinstance(returned, dict) else returned
+        verified = is_sorted_vectorized(sorted_data) if is_numpy_array(sorted_data) else is_sorted(sorted_data)
+
+    return {'samples_ns': samples, 'stats': stats, 'verified': verified}
+
+
+def measure_memory(algorithm, dataset):
+    """
+    Measure the memory one run of algorithm allocates, with tracemalloc.
+
+    Tracing starts after the input is copied, so only memory allocated by the sort itself
+    is counted. CPython does not count allocations as they happen, so the number of
+    blocks is those allocated during the sort and still live when it returns (the
+    output array of Merge Sort, for example); the temporary slices and buffers show up
+    in the peak instead.
+
+    Args:
+        algorithm: A sorter taking (arr, stats=None)
+        dataset: The input; it is copied and never modified
+
+    Returns:
+        A dictionary with 'peak_alloc_bytes' (highest traced memory during the run) and
+        'alloc_blocks_retained' (traced blocks still allocated when the run returns)
+    """
+    data = dataset.copy()
+    gc.collect()
+    was_tracing = tracemalloc.is_tracing()
+    if was_tracing:
+        tracemalloc.stop()
+    tracemalloc.start()
+    try:
+        returned = algorithm(data, stats=None)
+        _, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+        if was_tracing:
+            tracemalloc.start()
+    del returned
+
+    return {
+        'peak_alloc_bytes': peak,
+        'alloc_blocks_retained': sum(stat.count for stat in snapshot.statistics('filename'))
+    }
+
+
+def peak_rss_kb():
+    """
+    Return the peak resident set size of this process so far, in KiB.
+
+    Each benchmark cell runs in its own process (see part2/matrix_runner.py), so this
+    is the high-water mark of the cell: interpreter, dataset and sort together.
+
+    Returns:
+        The peak RSS in KiB, or None where the resource module is unavailable
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in KiB elsewhere
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def percentile(sorted_samples, q):
+    """
+    Return the q-th quantile (0 <= q <= 1) of sorted_samples by linear interpolation.
+
+    Args:
+        sorted_samples: Samples in ascending order
+        q: Quantile
+
+    Returns:
+        The interpolated value, or 0.0 for no samples
+    """
+    if not sorted_samples:
+        return 0.0
+    position = q * (len(sorted_samples) - 1)
+    below = math.floor(position)
+    above = math.ceil(position)
+    fraction = position - below
+    return sorted_samples[below] + (sorted_samples[above] - sorted_samples[below]) * fraction
+
+
+def quantile_interval(sorted_samples, q, z=Z_95):
+    """
+    Return a distribution-free confidence interval for the q-th quantile.
+
+    The ranks bounding the interval come from the normal approximation to the binomial
+    count of samples below the quantile, so no assumption is made about the shape of
+    the timing distribution. With few samples the interval widens to the sample range.
+
+    Args:
+        sorted_samples: Samples in ascending order
+        q: Quantile
+        z: Two-sided z value of the confidence level
+
+    Returns:
+        A (low, high) tuple
+    """
+    n = len(sorted_samples)
+    if n == 0:
+        return 0.0, 0.0
+    spread = z * math.sqrt(n * q * (1 - q))
+    low_rank = max(0, math.floor(n * q - spread) - 1)
+    high_rank = min(n - 1, math.ceil(n * q + spread) - 1)
+    return sorted_samples[low_rank], sorted_samples[max(low_rank, high_rank)]
+
+
+def summarize(samples_ns):
+    """
+    Summarize timing samples in milliseconds.
+
+    Args:
+        samples_ns: Samples in nanoseconds
+
+    Returns:
+        A dictionary with min_ms, median_ms, p95_ms, their confidence intervals
+        (median_ci_low_ms, median_ci_high_ms, p95_ci_low_ms, p95_ci_high_ms), mean_ms,
+        stdev_ms and repeats. The minimum has no interval: it is a bound, not an estimate
+        of a central value.
+    """
+    samples = sorted(sample / 1e6 for sample in samples_ns)
+    n = len(samples)
+    mean = sum(samples) / n if n else 0.0
+    variance = sum((sample - mean) ** 2 for sample in samples) / (n - 1) if n > 1 else 0.0
+    median_low, median_high = quantile_interval(samples, 0.5)
+    p95_low, p95_high = quantile_interval(samples, 0.95)
+
+    return {
+        'min_ms': samples[0] if samples else 0.0,
+        'median_ms': percentile(samples, 0.5),
+        'median_ci_low_ms': median_low,
+        'median_ci_high_ms': median_high,
+        'p95_ms': percentile(samples, 0.95),
+        'p95_ci_low_ms': p95_low,
+        'p95_ci_high_ms': p95_high,
+        'mean_ms': mean,
+        'stdev_ms': math.sqrt(variance),
+        'repeats': n
+    }
+
+
+def pin_cpu(cpus):
+    """
+    Restrict this process (and the processes it starts) to the given CPUs.
+
+    Args:
+        cpus: Iterable of CPU indices
+
+    Returns:
+        The previous affinity set, or None if the platform does not support pinning
+    """
+    if not hasattr(os, 'sched_setaffinity'):
+        print("CPU pinning is not supported on this platform; continuing unpinned")
+        return None
+    previous = os.sched_getaffinity(0)
+    os.sched_setaffinity(0, set(cpus))
+    return previous
+
+
+if __name__ == "__main__":
+    # Example usage
+    import random
+    from part2.introsort import introsort
+
+    data = [random.randint(-10000, 10000) for _ in range(10000)]
+    measurement = measure(introsort, data, {'warmup': 2, 'repeats': 15})
+    print(f"Verified: {measurement['verified']}")
+    print(f"Memory: {measure_memory(introsort, data)}, peak RSS: {peak_rss_kb()} KiB")
+    for name, value in summarize(measurement['samples_ns']).items():
+        print(f"{name}: {value:.3f}" if isinstance(value, float) else f"{name}: {value}")
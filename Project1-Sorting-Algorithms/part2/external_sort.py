@@ -0,0 +1,434 @@
+"""
+External-memory Merge Sort for integer datasets larger than RAM.
+
+This module sorts a file of integers without ever holding more than a configurable
+memory budget of it in memory:
+1. The input is streamed in chunks that fit the budget, each chunk is sorted with the
+   in-memory Introsort and spilled to a temporary file as a run of packed signed
+   64-bit integers (without a header; run files never leave the sort).
+2. The runs are combined with a k-way merge driven by a min-heap of run heads, reading
+   every run and writing the output through fixed-size buffers. If there are more
+   runs than the fan-in limit, the merge is repeated in passes.
+
+Supported file formats (chosen by extension):
+- .bin   binary dataset of data/dataset_format.py (16-byte header plus packed int64
+         values); .bin output is always written in this format, and input may also be
+         headerless packed native signed 64-bit integers (array('q') layout)
+- .txt   one integer per line
+- .json  a JSON array of integers (parsed incrementally, never loaded whole)
+
+Usage:
+    python part2/external_sort.py INPUT OUTPUT [--memory-budget 64M] [--fan-in 64]
+"""
+
+import argparse
+import heapq
+import os
+import re
+import sys
+import tempfile
+from array import array
+
+# Add the parent directory to the path so we can import the sorting modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from part2.introsort import introsort
+from data.dataset_format import MAGIC, BinaryDatasetWriter, read_header
+
+# Default memory budget for one sort: 64 MiB
+DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024
+
+# Rough cost of one integer held in a Python list: an 8-byte slot plus the int object
+LIST_BYTES_PER_ELEMENT = 40
+
+# Size of one integer in a run file or a read/write buffer
+PACKED_BYTES_PER_ELEMENT = array('q').itemsize
+
+# Maximum number of runs merged at once; more runs are merged in several passes
+DEFAULT_FAN_IN = 64
+
+# Bytes read at a time when parsing text input
+TEXT_BLOCK_SIZE = 1024 * 1024
+
+# Text input: integers separated by whitespace, ',', '[' or ']'
+INTEGER_TOKEN = re.compile(rb'-?[0-9]+')
+TEXT_BYTES = b'0123456789-,[] \t\n\r\x0b\x0c'
+# A '-' that no digit follows, or that follows a digit. The lookbehind comes after
+# the '-' so the search can skip ahead to each '-' instead of testing every byte
+MISPLACED_MINUS = re.compile(rb'-(?:(?![0-9])|(?<=[0-9]-))')
+# The first invalid byte of either kind; slower, so only used to report an error
+INVALID_TEXT = re.compile(rb'[^0-9\s,\[\]-]|-(?![0-9])|(?<=[0-9])-')
+
+# Bytes that may belong to a number continuing in the next text block
+TOKEN_BYTES = b'0123456789-'
+
+
+def external_sort(input_path, output_path, memory_budget=DEFAULT_MEMORY_BUDGET,
+                  fan_in=DEFAULT_FAN_IN, temp_dir=None, stats=None):
+    """
+    Sort the integers in input_path into output_path using bounded memory.
+
+    Args:
+        input_path: File to sort (.bin, .txt or .json)
+        output_path: File to write the sorted integers to (.bin, .txt or .json)
+        memory_budget: Approximate number of bytes of data to hold in memory at once
+        fan_in: Maximum number of runs merged in a single pass
+        temp_dir: Directory for the temporary run files (default: system temp dir)
+        stats: Dictionary to track performance statistics (optional). The in-memory
+            sorts add their comparisons and swaps; 'elements', 'runs' and
+            'merge_passes' are also recorded.
+
+    Returns:
+        The stats dictionary, or None when stats is not provided
+    """
+    if fan_in < 2:
+        raise ValueError("fan_in must be at least 2")
+
+    chunk_size = max(1, memory_budget // LIST_BYTES_PER_ELEMENT)
+
+    with tempfile.TemporaryDirectory(dir=temp_dir, prefix='external_sort_') as work_dir:
+        # Phase 1: sorted runs
+        runs = []
+        elements = 0
+        for chunk in read_chunks(input_path, chunk_size):
+            introsort(chunk, stats)
+            run_path = os.path.join(work_dir, f'run_{len(runs)}.bin')
+            with open(run_path, 'wb') as run_file:
+                array('q', chunk).tofile(run_file)
+            runs.append(run_path)
+            elements += len(chunk)
+            del chunk
+
+        initial_runs = len(runs)
+
+        # Phase 2: merge passes until at most fan_in runs remain
+        merge_passes = 0
+        while len(runs) > fan_in:
+            merged_runs = []
+            for group_start in range(0, len(runs), fan_in):
+                group = runs[group_start:group_start + fan_in]
+                merged_path = os.path.join(work_dir, f'pass_{merge_passes}_{len(merged_runs)}.bin')
+                with RunWriter(merged_path, buffer_elements(memory_budget, len(group))) as writer:
+                    merge_runs(group, writer, memory_budget)
+                for run_path in group:
+                    os.remove(run_path)
+                merged_runs.append(merged_path)
+            runs = merged_runs
+            merge_passes += 1
+
+        # Final pass straight into the output file
+        with open_writer(output_path, buffer_elements(memory_budget, len(runs))) as writer:
+            merge_runs(runs, writer, memory_budget)
+        merge_passes += 1
+
+    if stats is not None:
+        stats['elements'] = elements
+        stats['runs'] = initial_runs
+        stats['merge_passes'] = merge_passes
+    return stats
+
+
+def buffer_elements(memory_budget, run_count):
+    """Return how many packed integers each of run_count readers plus one writer may buffer."""
+    return max(1, memory_budget // ((run_count + 1) * PACKED_BYTES_PER_ELEMENT))
+
+
+def merge_runs(run_paths, writer, memory_budget):
+    """
+    Merge sorted run files into writer with a min-heap of run heads.
+
+    Args:
+        run_paths: Paths of the sorted run files
+        writer: Object with a write(value) method receiving the merged output
+        memory_budget: Byte budget shared by the read buffers and the writer
+    """
+    readers = [RunReader(path, buffer_elements(memory_budget, len(run_paths))) for path in run_paths]
+    try:
+        heap = MinHeap()
+        for index, reader in enumerate(readers):
+            value = reader.next()
+            if value is not None:
+                heap.insert((value, index))
+
+        # Ties go to the lower run index, which keeps the merge stable
+        while not heap.is_empty():
+            value, index = heap.peek_min()
+            writer.write(value)
+            following = readers[index].next()
+            if following is None:
+                heap.remove_min()
+            else:
+                heap.replace_min((following, index))
+    finally:
+        for reader in readers:
+            reader.close()
+
+
+class MinHeap:
+    """
+    Binary min-heap of (value, run index) entries backed by heapq.
+
+    Same interface as the Lab 11 MinHeap, plus replace_min() which pops and pushes in a
+    single sift (the common step of a k-way merge).
+    """
+
+    def __init__(self):
+        self.heap = []
+
+    def insert(self, item):
+        # heapq maintains the min-heap property automatically
+        heapq.heappush(self.heap, item)
+
+    def remove_min(self):
+        # Returns None if heap is empty
+        if not self.heap:
+            return None
+        return heapq.heappop(self.heap)
+
+    def replace_min(self, item):
+        # Remove the smallest item and insert item in one step
+        return heapq.heapreplace(self.heap, item)
+
+    def peek_min(self):
+        # Returns None if heap is empty
+        if not self.heap:
+            return None
+        return self.heap[0]
+
+    def size(self):
+        return len(self.heap)
+
+    def is_empty(self):
+        return len(self.heap) == 0
+
+
+class RunReader:
+    """Buffered sequential reader of a file of packed signed 64-bit integers."""
+
+    def __init__(self, path, buffer_size):
+        self.file = open(path, 'rb')
+        self.buffer_size = buffer_size
+        self.buffer = array('q')
+        self.position = 0
+
+    def next(self):
+        """Return the next integer, or None at the end of the run."""
+        if self.position == len(self.buffer):
+            self.buffer = array('q')
+            try:
+                self.buffer.fromfile(self.file, self.buffer_size)
+            except EOFError:
+                # Short final read: fromfile() keeps what it could read
+                pass
+            self.position = 0
+            if not self.buffer:
+                return None
+        value = self.buffer[self.position]
+        self.position += 1
+        return value
+
+    def close(self):
+        self.file.close()
+
+
+class RunWriter:
+    """Buffered writer of packed signed 64-bit integers without a header (temporary runs)."""
+
+    def __init__(self, path, buffer_size):
+        self.file = open(path, 'wb')
+        self.buffer_size = buffer_size
+        self.buffer = array('q')
+
+    def write(self, value):
+        self.buffer.append(value)
+        if len(self.buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        self.buffer.tofile(self.file)
+        self.buffer = array('q')
+
+    def close(self):
+        self.flush()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class TextWriter(RunWriter):
+    """Buffered writer of one integer per line, or of a JSON array when as_json is set."""
+
+    def __init__(self, path, buffer_size, as_json=False):
+        self.file = open(path, 'w')
+        self.buffer_size = buffer_size
+        self.buffer = []
+        self.as_json = as_json
+        self.first = True
+        if as_json:
+            self.file.write('[')
+
+    def flush(self):
+        if not self.buffer:
+            return
+        separator = ', ' if self.as_json else '\n'
+        text = separator.join(map(str, self.buffer))
+        if self.as_json:
+            self.file.write(text if self.first else ', ' + text)
+        else:
+            self.file.write(text + '\n')
+        self.first = False
+        self.buffer = []
+
+    def close(self):
+        self.flush()
+        if self.as_json:
+            self.file.write(']')
+        self.file.close()
+
+
+def open_writer(path, buffer_size):
+    """
+    Return a buffered writer for path, picking the format from its extension.
+
+    .bin output is a binary dataset with a header, so it can be loaded with
+    data/dataset_format.py and used as a benchmark dataset.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.bin':
+        return BinaryDatasetWriter(path, buffer_size)
+    if extension in ('.txt', '.json'):
+        return TextWriter(path, buffer_size, as_json=extension == '.json')
+    raise ValueError(f"Unsupported output format: '{extension}' (use .bin, .txt or .json)")
+
+
+def read_chunks(path, chunk_size):
+    """
+    Yield the integers of path as lists of at most chunk_size elements.
+
+    Args:
+        path: Input file (.bin, .txt or .json)
+        chunk_size: Maximum number of integers per chunk
+
+    Returns:
+        A generator of lists
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.bin':
+        with open(path, 'rb') as f:
+            # Skip the header of a binary dataset and stop after its payload
+            remaining = None
+            if f.read(len(MAGIC)) == MAGIC:
+                f.seek(0)
+                remaining = read_header(f)
+            else:
+                f.seek(0)
+            while remaining is None or remaining > 0:
+                block = array('q')
+                try:
+                    block.fromfile(f, chunk_size if remaining is None else min(chunk_size, remaining))
+                except EOFError:
+                    pass
+                if not block:
+                    return
+                if remaining is not None:
+                    remaining -= len(block)
+                yield block.tolist()
+    elif extension in ('.txt', '.json'):
+        chunk = []
+        for values in read_text_blocks(path):
+            chunk.extend(values)
+            if len(chunk) >= chunk_size:
+                full = len(chunk) - len(chunk) % chunk_size
+                for start in range(0, full, chunk_size):
+                    yield chunk[start:start + chunk_size]
+                chunk = chunk[full:]
+        if chunk:
+            yield chunk
+    else:
+        raise ValueError(f"Unsupported input format: '{extension}' (use .bin, .txt or .json)")
+
+
+def read_text_blocks(path):
+    """
+    Yield the integers of a text file as one list per fixed-size block read.
+
+    The file must hold only integers separated by whitespace, ',', '[' or ']', which
+    covers both one integer per line and a JSON array of integers. Anything else, such
+    as '1.5' or '2e3', raises ValueError instead of being read as several integers.
+    A number split across two blocks is carried over to the next block.
+    """
+    with open(path, 'rb') as f:
+        carry = b''
+        offset = 0  # file offset of the start of carry
+        while True:
+            block = f.read(TEXT_BLOCK_SIZE)
+            if not block:
+                break
+            block = carry + block
+
+            # The last token may continue in the next block
+            end = len(block)
+            while end > 0 and block[end - 1] in TOKEN_BYTES:
+                end -= 1
+            carry = block[end:]
+
+            yield tokenize_integers(block[:end], offset)
+            offset += end
+        yield tokenize_integers(carry, offset)
+
+
+def tokenize_integers(text, offset=0):
+    """
+    Return the integers in text, checking that nothing else is in it.
+
+    A '-' is a minus sign and must start a token and be followed by a digit, so "1-2",
+    "--5" and a lone '-' are rejected along with any character that is neither a digit
+    nor a separator.
+
+    Args:
+        text: Bytes to parse; must not end in the middle of a number
+        offset: File offset of text[0], for error messages
+
+    Returns:
+        A list of ints
+    """
+    if text.translate(None, TEXT_BYTES) or MISPLACED_MINUS.search(text):
+        position = INVALID_TEXT.search(text).start()
+        raise ValueError(f"Invalid integer input at byte {offset + position}: "
+                         f"{text[position:position + 20]!r}")
+    return list(map(int, INTEGER_TOKEN.findall(text)))
+
+
+def parse_size(text):
+    """Parse a byte count such as '512K', '64M' or '2G'."""
+    units = {'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3}
+    text = text.strip().upper().rstrip('B')
+    if text and text[-1] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(text)
+
+
+def main():
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Sort a file of integers larger than RAM.")
+    parser.add_argument('input', help="input file (.bin, .txt or .json)")
+    parser.add_argument('output', help="output file (.bin, .txt or .json)")
+    parser.add_argument('--memory-budget', type=parse_size, default=DEFAULT_MEMORY_BUDGET,
+                        help="bytes of data held in memory at once, e.g. 64M (default: 64M)")
+    parser.add_argument('--fan-in', type=int, default=DEFAULT_FAN_IN,
+                        help=f"maximum runs merged per pass (default: {DEFAULT_FAN_IN})")
+    parser.add_argument('--temp-dir', default=None, help="directory for temporary run files")
+    args = parser.parse_args()
+
+    stats = {'comparisons': 0, 'swaps': 0}
+    external_sort(args.input, args.output, args.memory_budget, args.fan_in, args.temp_dir, stats)
+    print(f"Sorted {stats['elements']} integers: {stats['runs']} runs, "
+          f"{stats['merge_passes']} merge pass(es)")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,28 +2,69 @@
 Implementation of Heap Sort algorithm.
 
 This module provides functions to perform the Heap Sort algorithm on lists of comparable elements.
+Pass a stats dictionary to count comparisons and swaps, or leave stats as None to run a
+specialized loop with no counting at all.
+
+heapsort_bottom_up() is an optimized variant. Its sift-down is a loop that moves a hole
+instead of swapping, and it uses Floyd's leaf descent: the hole first follows the larger
+child all the way to a leaf, at one comparison per level, and the sifted value then
+climbs back up the few levels it needs. The displaced value almost always belongs near
+the bottom, so this takes about half the comparisons of the textbook sift-down, which
+compares with both children and the value at every level. A 4-ary layout
+(arity=4) halves the height of the heap again, trading more comparisons per level for
+fewer levels. The leaf descent does not stop early on equal keys, so on inputs with
+only a few distinct values the textbook sift-down can be faster.
 """
 
-def heapsort(arr, stats=None):
+import os
+import sys
+from functools import partial
+
+# Add the parent directory to the path so we can import the sorting modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from part2.key_sort import key_sort
+
+def heapsort(arr, stats=None, key=None, reverse=False):
     """
     Sort an array using the Heap Sort algorithm.
     
     Args:
         arr: The array to be sorted
-        stats: Dictionary to track performance statistics (optional)
+        stats: Dictionary to track performance statistics (optional). A PhaseTracer
+            under 'tracer' receives the 'build_heap' and 'extract' phases.
+        key: Function computing the sort key of each element, called once
+            per element (optional)
+        reverse: Sort in descending order; equal keys keep their original order
         
     Returns:
-        None (the array is sorted in-place)
+        The stats dictionary, or None when stats is not provided
+        (the array is sorted in-place)
     """
+    # Sort decorated keys instead of the elements (see part2/key_sort.py)
+    if key is not None or reverse:
+        return key_sort(arr, heapsort, key, reverse, stats)
+
+    # Without a stats dictionary, run the uninstrumented loop
     if stats is None:
-        stats = {'comparisons': 0, 'swaps': 0}
+        heapsort_fast(arr)
+        return None
     
     n = len(arr)
     
+    # Report phases to a tracer when one is attached (see part2/phase_tracer.py)
+    tracer = stats.get('tracer')
+    if tracer is not None:
+        tracer.enter('build_heap')
+    
     # Build a maxheap
     for i in range(n // 2 - 1, -1, -1):
         heapify(arr, n, i, stats)
     
+    if tracer is not None:
+        tracer.exit()
+        tracer.enter('extract')
+    
     # Extract elements one by one
     for i in range(n - 1, 0, -1):
         # Swap the root (maximum element) with the last element
@@ -33,6 +74,9 @@ def heapsort(arr, stats=None):
         # Call heapify on the reduced heap
         heapify(arr, i, 0, stats)
     
+    if tracer is not None:
+        tracer.exit()
+    
     return stats
 
 
@@ -74,12 +118,271 @@ def heapify(arr, n, i, stats):
         heapify(arr, n, largest, stats)
 
 
+def heapsort_fast(arr):
+    """
+    Uninstrumented Heap Sort (no statistics are collected).
+    
+    Args:
+        arr: The array to be sorted
+        
+    Returns:
+        None (the array is sorted in-place)
+    """
+    n = len(arr)
+    
+    for i in range(n // 2 - 1, -1, -1):
+        heapify_fast(arr, n, i)
+    
+    for i in range(n - 1, 0, -1):
+        arr[i], arr[0] = arr[0], arr[i]
+        heapify_fast(arr, i, 0)
+
+
+def heapify_fast(arr, n, i):
+    """
+    Uninstrumented heapify; same result as heapify().
+    
+    Args:
+        arr: The array representing the heap
+        n: Size of the heap
+        i: Index of the root of the subtree to heapify
+        
+    Returns:
+        None (the heap is modified in-place)
+    """
+    largest = i
+    left = 2 * i + 1
+    right = left + 1
+    
+    if left < n and arr[left] > arr[largest]:
+        largest = left
+    if right < n and arr[right] > arr[largest]:
+        largest = right
+    
+    if largest != i:
+        arr[i], arr[largest] = arr[largest], arr[i]
+        heapify_fast(arr, n, largest)
+
+
+def heapsort_bottom_up(arr, stats=None, key=None, reverse=False, arity=2):
+    """
+    Sort an array using Heap Sort with Floyd's leaf-descent sift-down.
+
+    Args:
+        arr: The array to be sorted
+        stats: Dictionary to track performance statistics (optional). 'swaps' counts
+            element moves; a move writes one element, where a swap writes two.
+            A PhaseTracer under 'tracer' receives the 'build_heap' and 'extract' phases.
+        key: Function computing the sort key of each element, called once
+            per element (optional)
+        reverse: Sort in descending order; equal keys keep their original order
+        arity: Number of children per heap node, at least 2 (2 for a binary heap, 4 for
+            a 4-ary one)
+
+    Returns:
+        The stats dictionary, or None when stats is not provided
+        (the array is sorted in-place)
+    """
+    # A unary heap is a list: sifting would walk it linearly and the sort turns quadratic
+    if arity < 2:
+        raise ValueError(f"arity must be at least 2, got {arity}")
+
+    # Sort decorated keys instead of the elements (see part2/key_sort.py)
+    if key is not None or reverse:
+        return key_sort(arr, partial(heapsort_bottom_up, arity=arity), key, reverse, stats)
+
+    n = len(arr)
+
+    # Without a stats dictionary, run the uninstrumented loops
+    if stats is None:
+        sift = {2: sift_to_leaf_binary_fast, 4: sift_to_leaf_quaternary_fast}.get(arity, sift_to_leaf_fast)
+        # Build a max-heap bottom-up (Floyd's construction), the last internal node first
+        for i in range((n - 2) // arity, -1, -1):
+            sift(arr, i, n, arr[i], arity)
+        # Move the maximum behind the heap and sift the displaced last element from the root
+        for end in range(n - 1, 0, -1):
+            value = arr[end]
+            arr[end] = arr[0]
+            sift(arr, 0, end, value, arity)
+        return None
+
+    # Report phases to a tracer when one is attached (see part2/phase_tracer.py)
+    tracer = stats.get('tracer')
+    if tracer is not None:
+        tracer.enter('build_heap')
+
+    comparisons = 0
+    moves = 0
+    for i in range((n - 2) // arity, -1, -1):
+        compared, moved = sift_to_leaf(arr, i, n, arr[i], arity)
+        comparisons += compared
+        moves += moved
+
+    if tracer is not None:
+        tracer.exit()
+        tracer.enter('extract')
+
+    for end in range(n - 1, 0, -1):
+        value = arr[end]
+        arr[end] = arr[0]
+        compared, moved = sift_to_leaf(arr, 0, end, value, arity)
+        comparisons += compared
+        moves += moved + 1
+
+    if tracer is not None:
+        tracer.exit()
+
+    stats['comparisons'] += comparisons
+    stats['swaps'] += moves
+    return stats
+
+
+def sift_to_leaf(arr, root, end, value, arity):
+    """
+    Place value in the hole at arr[root] of the heap arr[root:end] by leaf descent.
+
+    The hole moves down to a leaf, following the largest child, and value is then
+    sifted up from the leaf but never above root.
+
+    Args:
+        arr: The array representing the heap
+        root: Index of the hole
+        end: Size of the heap
+        value: The value to place
+        arity: Number of children per heap node
+
+    Returns:
+        (number of comparisons, number of moves)
+    """
+    comparisons = 0
+    moves = 0
+    hole = root
+
+    # Descend: one comparison per extra child, none against value
+    child = arity * hole + 1
+    while child < end:
+        largest = child
+        for sibling in range(child + 1, min(child + arity, end)):
+            comparisons += 1
+            if arr[largest] < arr[sibling]:
+                largest = sibling
+        arr[hole] = arr[largest]
+        moves += 1
+        hole = largest
+        child = arity * hole + 1
+
+    # Climb back up while the parent is smaller than value
+    while hole > root:
+        parent = (hole - 1) // arity
+        comparisons += 1
+        if not arr[parent] < value:
+            break
+        arr[hole] = arr[parent]
+        moves += 1
+        hole = parent
+
+    arr[hole] = value
+    return comparisons, moves + 1
+
+
+def sift_to_leaf_fast(arr, root, end, value, arity):
+    """
+    Uninstrumented sift_to_leaf() for any arity.
+
+    Returns:
+        None (the heap is modified in-place)
+    """
+    hole = root
+    child = arity * hole + 1
+    while child < end:
+        largest = child
+        for sibling in range(child + 1, min(child + arity, end)):
+            if arr[largest] < arr[sibling]:
+                largest = sibling
+        arr[hole] = arr[largest]
+        hole = largest
+        child = arity * hole + 1
+
+    while hole > root:
+        parent = (hole - 1) // arity
+        if not arr[parent] < value:
+            break
+        arr[hole] = arr[parent]
+        hole = parent
+    arr[hole] = value
+
+
+def sift_to_leaf_binary_fast(arr, root, end, value, arity=2):
+    """
+    Uninstrumented sift_to_leaf() specialized for binary heaps (no inner child loop).
+
+    Returns:
+        None (the heap is modified in-place)
+    """
+    hole = root
+    child = 2 * hole + 1
+    while child < end:
+        right = child + 1
+        if right < end and arr[child] < arr[right]:
+            child = right
+        arr[hole] = arr[child]
+        hole = child
+        child = 2 * hole + 1
+
+    while hole > root:
+        parent = (hole - 1) >> 1
+        if not arr[parent] < value:
+            break
+        arr[hole] = arr[parent]
+        hole = parent
+    arr[hole] = value
+
+
+def sift_to_leaf_quaternary_fast(arr, root, end, value, arity=4):
+    """
+    Uninstrumented sift_to_leaf() specialized for 4-ary heaps (children compared unrolled).
+
+    Returns:
+        None (the heap is modified in-place)
+    """
+    hole = root
+    child = 4 * hole + 1
+    # Nodes whose four children all exist
+    while child + 3 < end:
+        largest = child
+        if arr[largest] < arr[child + 1]:
+            largest = child + 1
+        if arr[largest] < arr[child + 2]:
+            largest = child + 2
+        if arr[largest] < arr[child + 3]:
+            largest = child + 3
+        arr[hole] = arr[largest]
+        hole = largest
+        child = 4 * hole + 1
+    # At most one node has fewer than four children
+    if child < end:
+        largest = child
+        for sibling in range(child + 1, end):
+            if arr[largest] < arr[sibling]:
+                largest = sibling
+        arr[hole] = arr[largest]
+        hole = largest
+
+    while hole > root:
+        parent = (hole - 1) >> 2
+        if not arr[parent] < value:
+            break
+        arr[hole] = arr[parent]
+        hole = parent
+    arr[hole] = value
+
+
 if __name__ == "__main__":
     # Example usage
     test_array = [12, 11, 13, 5, 6, 7]
     print(f"Original array: {test_array}")
     
-    stats = heapsort(test_array)
+    stats = heapsort(test_array, {'comparisons': 0, 'swaps': 0})
     print(f"Sorted array: {test_array}")
     print(f"Performance stats: {stats}")
     
@@ -87,5 +390,8 @@ if __name__ == "__main__":
     import random
     large_array = random.sample(range(1, 1001), 100)  # 100 random numbers
     print(f"\nSorting an array of {len(large_array)} random elements...")
-    stats = heapsort(large_array.copy())
-    print(f"Performance stats: {stats}")
\ No newline at end of file
+    stats = heapsort(large_array.copy(), {'comparisons': 0, 'swaps': 0})
+    print(f"Performance stats: {stats}")
+    for arity in (2, 4):
+        stats = heapsort_bottom_up(large_array.copy(), {'comparisons': 0, 'swaps': 0}, arity=arity)
+        print(f"Bottom-up, arity {arity}: {stats}")
\ No newline at end of file
@@ -2,21 +2,54 @@
 Implementation of Insertion Sort algorithm.
 
 This module provides functions to perform the Insertion Sort algorithm on lists of comparable elements.
+Pass a stats dictionary to count comparisons and swaps, or leave stats as None to run a
+specialized loop with no counting at all.
+
+insertionsort_block_move() keeps the binary search but moves the whole block of larger
+elements in one operation (del and insert on lists and array.array, which CPython does
+with a single memmove; slice assignment on memoryviews and NumPy arrays) instead of one
+interpreted assignment per element. It is the small-partition finisher of Introsort and
+Timsort.
 """
 
-def insertionsort(arr, stats=None):
+import os
+import sys
+from array import array
+from bisect import bisect_right
+
+# Add the parent directory to the path so we can import the sorting modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from part2.key_sort import key_sort
+
+# move_element() uses del and insert while the array beyond the insertion point is at
+# most this many times the moved block; a raw memmove is that much cheaper per element
+# than copying a slice of references
+TAIL_MOVE_FACTOR = 32
+
+def insertionsort(arr, stats=None, key=None, reverse=False):
     """
     Sort an array using the Insertion Sort algorithm.
     
     Args:
         arr: The array to be sorted
         stats: Dictionary to track performance statistics (optional)
+        key: Function computing the sort key of each element, called once
+            per element (optional)
+        reverse: Sort in descending order; equal keys keep their original order
         
     Returns:
-        None (the array is sorted in-place)
+        The stats dictionary, or None when stats is not provided
+        (the array is sorted in-place)
     """
+    # Sort decorated keys instead of the elements (see part2/key_sort.py)
+    if key is not None or reverse:
+        return key_sort(arr, insertionsort, key, reverse, stats)
+
+    # Without a stats dictionary, run the uninstrumented loop
     if stats is None:
-        stats = {'comparisons': 0, 'swaps': 0}
+        insertionsort_fast(arr)
+        return None
     
     # Traverse through 1 to len(arr)
     for i in range(1, len(arr)):
@@ -42,7 +75,7 @@ def insertionsort(arr, stats=None):
     return stats
 
 
-def insertionsort_with_binary_search(arr, stats=None):
+def insertionsort_with_binary_search(arr, stats=None, key=None, reverse=False):
     """
     Sort an array using the Insertion Sort algorithm with binary search optimization.
     This variant uses binary search to find the position where the element should be inserted,
@@ -51,12 +84,22 @@ def insertionsort_with_binary_search(arr, stats=None):
     Args:
         arr: The array to be sorted
         stats: Dictionary to track performance statistics (optional)
+        key: Function computing the sort key of each element, called once
+            per element (optional)
+        reverse: Sort in descending order; equal keys keep their original order
         
     Returns:
-        None (the array is sorted in-place)
+        The stats dictionary, or None when stats is not provided
+        (the array is sorted in-place)
     """
+    # Sort decorated keys instead of the elements (see part2/key_sort.py)
+    if key is not None or reverse:
+        return key_sort(arr, insertionsort_with_binary_search, key, reverse, stats)
+
+    # Without a stats dictionary, run the uninstrumented loop
     if stats is None:
-        stats = {'comparisons': 0, 'swaps': 0}
+        insertionsort_with_binary_search_fast(arr)
+        return None
     
     for i in range(1, len(arr)):
         key = arr[i]
@@ -90,28 +133,170 @@ def binary_search(arr, key, low, high, stats):
         stats: Dictionary to track performance statistics
         
     Returns:
-        The position where key should be inserted
+        The position where key should be inserted. This is always after any
+        elements equal to key, so inserting there keeps the sort stable.
     """
     while low <= high:
         mid = (low + high) // 2
         stats['comparisons'] += 1
         
-        if key == arr[mid]:
-            return mid + 1
-        elif key > arr[mid]:
-            low = mid + 1
-        else:
+        if key < arr[mid]:
             high = mid - 1
+        else:
+            low = mid + 1
     
     return low
 
 
+def insertionsort_fast(arr):
+    """
+    Uninstrumented Insertion Sort (no statistics are collected).
+    
+    Args:
+        arr: The array to be sorted
+        
+    Returns:
+        None (the array is sorted in-place)
+    """
+    for i in range(1, len(arr)):
+        key = arr[i]
+        j = i - 1
+        while j >= 0 and arr[j] > key:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = key
+
+
+def insertionsort_with_binary_search_fast(arr):
+    """
+    Uninstrumented Insertion Sort with binary search (no statistics are collected).
+    
+    Args:
+        arr: The array to be sorted
+        
+    Returns:
+        None (the array is sorted in-place)
+    """
+    for i in range(1, len(arr)):
+        key = arr[i]
+        
+        # Inline binary search for the insertion position
+        low = 0
+        high = i - 1
+        while low <= high:
+            mid = (low + high) // 2
+            if key < arr[mid]:
+                high = mid - 1
+            else:
+                low = mid + 1
+        
+        if low < i:
+            for j in range(i - 1, low - 1, -1):
+                arr[j + 1] = arr[j]
+            arr[low] = key
+
+
+def insertionsort_block_move(arr, stats=None, key=None, reverse=False):
+    """
+    Sort an array using binary Insertion Sort with block moves.
+
+    Works on lists, array.array objects, memoryviews and NumPy arrays.
+
+    Args:
+        arr: The array to be sorted
+        stats: Dictionary to track performance statistics (optional). 'swaps' counts
+            element moves, as for insertionsort_with_binary_search().
+        key: Function computing the sort key of each element, called once
+            per element (optional)
+        reverse: Sort in descending order; equal keys keep their original order
+
+    Returns:
+        The stats dictionary, or None when stats is not provided
+        (the array is sorted in-place)
+    """
+    # Sort decorated keys instead of the elements (see part2/key_sort.py)
+    if key is not None or reverse:
+        return key_sort(arr, insertionsort_block_move, key, reverse, stats)
+
+    insertionsort_block_move_range(arr, 0, len(arr) - 1, stats)
+    return stats
+
+
+def insertionsort_block_move_range(arr, low, high, stats=None, start=None):
+    """
+    Sort arr[low..high] in-place with binary Insertion Sort and block moves.
+
+    Args:
+        arr: The array to be sorted
+        low: Starting index
+        high: Ending index (inclusive)
+        stats: Dictionary to track performance statistics (None to skip counting)
+        start: First index not yet in sorted position, when arr[low:start] is already
+            sorted (default: low + 1)
+
+    Returns:
+        None (the array is sorted in-place)
+    """
+    if start is None:
+        start = low + 1
+
+    if stats is None:
+        # move_element() inlined: this loop finishes every small partition of Introsort
+        movable = isinstance(arr, (list, array))
+        n = len(arr)
+        for i in range(start, high + 1):
+            value = arr[i]
+            # bisect_right() keeps equal elements in order, like binary_search()
+            position = bisect_right(arr, value, low, i)
+            if position < i:
+                if movable and n - position <= TAIL_MOVE_FACTOR * (i - position):
+                    del arr[i]
+                    arr.insert(position, value)
+                else:
+                    arr[position + 1:i + 1] = arr[position:i]
+                    arr[position] = value
+        return
+
+    moves = 0
+    for i in range(start, high + 1):
+        value = arr[i]
+        position = binary_search(arr, value, low, i - 1, stats)
+        if position < i:
+            move_element(arr, i, position)
+            moves += i - position + 1
+    stats['swaps'] += moves
+
+
+def move_element(arr, source, target):
+    """
+    Move arr[source] to index target < source, shifting arr[target:source] right by one.
+
+    Args:
+        arr: A list, array.array, memoryview or NumPy array
+        source: Index of the element to move
+        target: Index it moves to
+
+    Returns:
+        None (arr is modified in-place)
+    """
+    value = arr[source]
+    if isinstance(arr, (list, array)) and len(arr) - target <= TAIL_MOVE_FACTOR * (source - target):
+        # del and insert each memmove everything after the index, so this only pays off
+        # when little of the array lies beyond the block
+        del arr[source]
+        arr.insert(target, value)
+    else:
+        # Slice assignment copies overlapping blocks correctly for every supported type
+        arr[target + 1:source + 1] = arr[target:source]
+        arr[target] = value
+
+
 if __name__ == "__main__":
     # Example usage of regular insertion sort
     test_array1 = [64, 34, 25, 12, 22, 11, 90]
     print(f"Original array: {test_array1}")
     
-    stats1 = insertionsort(test_array1.copy())
+    stats1 = insertionsort(test_array1, {'comparisons': 0, 'swaps': 0})
     print(f"Sorted array (regular insertion sort): {test_array1}")
     print(f"Performance stats (regular): {stats1}")
     
@@ -119,7 +304,7 @@ if __name__ == "__main__":
     test_array2 = [64, 34, 25, 12, 22, 11, 90]
     print(f"\nOriginal array: {test_array2}")
     
-    stats2 = insertionsort_with_binary_search(test_array2.copy())
+    stats2 = insertionsort_with_binary_search(test_array2, {'comparisons': 0, 'swaps': 0})
     print(f"Sorted array (insertion sort with binary search): {test_array2}")
     print(f"Performance stats (with binary search): {stats2}")
     
@@ -130,12 +315,20 @@ if __name__ == "__main__":
     # Regular insertion sort
     large_array_copy1 = large_array.copy()
     print(f"\nSorting an array of {len(large_array)} random elements with regular insertion sort...")
-    stats_reg = insertionsort(large_array_copy1)
+    stats_reg = insertionsort(large_array_copy1, {'comparisons': 0, 'swaps': 0})
     print(f"Performance stats: {stats_reg}")
     
     # Insertion sort with binary search
     large_array_copy2 = large_array.copy()
     print(f"\nSorting with binary search optimization...")
-    stats_bin = insertionsort_with_binary_search(large_array_copy2)
+    stats_bin = insertionsort_with_binary_search(large_array_copy2, {'comparisons': 0, 'swaps': 0})
     print(f"Performance stats: {stats_bin}")
-    print(f"Comparison reduction: {stats_reg['comparisons'] - stats_bin['comparisons']} comparisons")
\ No newline at end of file
+    print(f"Comparison reduction: {stats_reg['comparisons'] - stats_bin['comparisons']} comparisons")
+    
+    # Same comparisons as the binary search variant, with every shift done as one block move
+    import time
+    for sorter in (insertionsort_with_binary_search, insertionsort_block_move):
+        data = random.sample(range(100000), 4096)
+        start_time = time.perf_counter()
+        sorter(data)
+        print(f"{sorter.__name__} on 4096 elements: {(time.perf_counter() - start_time) * 1000:.1f} ms")
\ No newline at end of file
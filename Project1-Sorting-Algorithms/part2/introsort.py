@@ -0,0 +1,242 @@
+"""
+Implementation of Introsort (introspective sort).
+
+This module provides a hybrid sorting algorithm that starts out as Quick Sort,
+switches to Heap Sort when the recursion gets too deep and finishes small
+partitions with Insertion Sort. The result keeps Quick Sort's speed on typical
+inputs while guaranteeing O(n log n) comparisons in the worst case.
+Leave stats as None to run without any counting.
+"""
+
+import math
+import os
+import sys
+
+# Add the parent directory to the path so we can import the sorting modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from part2.quicksort import partition, partition_fast
+from part2.heapsort import heapsort_bottom_up
+from part2.insertionsort import insertionsort_block_move_range
+from part2.key_sort import key_sort
+
+# Partitions of this size or smaller are finished with insertion sort
+INSERTION_SORT_THRESHOLD = 16
+
+# Partitions larger than this use Tukey's ninther instead of median-of-three
+NINTHER_THRESHOLD = 128
+
+
+def introsort(arr, stats=None, key=None, reverse=False):
+    """
+    Sort an array using the Introsort algorithm.
+
+    Args:
+        arr: The array to be sorted
+        stats: Dictionary to track performance statistics (optional). A PhaseTracer
+            under 'tracer' receives the 'introsort' (one per introsort_loop() call),
+            'pivot', 'partition', 'heapsort' and 'insertion' phases.
+        key: Function computing the sort key of each element, called once
+            per element (optional)
+        reverse: Sort in descending order; equal keys keep their original order
+
+    Returns:
+        The stats dictionary, or None when stats is not provided
+        (the array is sorted in-place)
+    """
+    # Sort decorated keys instead of the elements (see part2/key_sort.py)
+    if key is not None or reverse:
+        return key_sort(arr, introsort, key, reverse, stats)
+
+    n = len(arr)
+    if n < 2:
+        return stats
+
+    # Quick Sort is allowed 2*log2(n) levels before falling back to Heap Sort
+    max_depth = 2 * int(math.log2(n))
+    introsort_loop(arr, 0, n - 1, max_depth, stats)
+
+    return stats
+
+
+def introsort_loop(arr, low, high, depth_limit, stats):
+    """
+    Sort arr[low..high] with depth-limited Quick Sort.
+
+    Only the smaller partition is sorted recursively; the larger one is handled
+    by the loop, so the Python call stack never grows beyond O(log n) frames.
+
+    Args:
+        arr: The array to be sorted
+        low: Starting index
+        high: Ending index
+        depth_limit: Remaining partitioning levels before switching to Heap Sort
+        stats: Dictionary to track performance statistics (None to skip counting)
+
+    Returns:
+        None (the array is sorted in-place)
+    """
+    # Report phases to a tracer when one is attached (see part2/phase_tracer.py)
+    tracer = stats.get('tracer') if stats is not None else None
+    if tracer is not None:
+        tracer.enter('introsort')
+
+    while high - low + 1 > INSERTION_SORT_THRESHOLD:
+        # Too many unbalanced partitions: fall back to the O(n log n) Heap Sort
+        if depth_limit == 0:
+            if tracer is None:
+                heapsort_range(arr, low, high, stats)
+                return
+            tracer.enter('heapsort')
+            heapsort_range(arr, low, high, stats)
+            tracer.exit()
+            tracer.exit()
+            return
+        depth_limit -= 1
+
+        if tracer is not None:
+            tracer.enter('pivot')
+
+        # Move the chosen pivot to arr[high] so the Lomuto partition can use it
+        pivot_index = choose_pivot(arr, low, high, stats)
+        if pivot_index != high:
+            arr[pivot_index], arr[high] = arr[high], arr[pivot_index]
+            if stats is not None:
+                stats['swaps'] += 1
+
+        if stats is None:
+            pivot_position = partition_fast(arr, low, high)
+        elif tracer is None:
+            pivot_position = partition(arr, low, high, stats)
+        else:
+            # Close the 'pivot' phase opened above
+            tracer.exit()
+            tracer.enter('partition')
+            pivot_position = partition(arr, low, high, stats)
+            tracer.exit()
+            tracer.record_partition(pivot_position - low, high - pivot_position)
+
+        # Recurse into the smaller side, loop on the larger one
+        if pivot_position - low < high - pivot_position:
+            introsort_loop(arr, low, pivot_position - 1, depth_limit, stats)
+            low = pivot_position + 1
+        else:
+            introsort_loop(arr, pivot_position + 1, high, depth_limit, stats)
+            high = pivot_position - 1
+
+    if tracer is None:
+        insertionsort_range(arr, low, high, stats)
+        return
+    tracer.enter('insertion')
+    insertionsort_range(arr, low, high, stats)
+    tracer.exit()
+    tracer.exit()
+
+
+def choose_pivot(arr, low, high, stats):
+    """
+    Choose a pivot index using median-of-three or Tukey's ninther.
+
+    Args:
+        arr: The array being sorted
+        low: Starting index
+        high: Ending index
+        stats: Dictionary to track performance statistics (None to skip counting)
+
+    Returns:
+        The index of the chosen pivot element
+    """
+    size = high - low + 1
+    mid = low + size // 2
+
+    if size <= NINTHER_THRESHOLD:
+        return median_of_three(arr, low, mid, high, stats)
+
+    # Median of the medians of three evenly spaced groups of three
+    step = size // 8
+    first = median_of_three(arr, low, low + step, low + 2 * step, stats)
+    middle = median_of_three(arr, mid - step, mid, mid + step, stats)
+    last = median_of_three(arr, high - 2 * step, high - step, high, stats)
+    return median_of_three(arr, first, middle, last, stats)
+
+
+def median_of_three(arr, a, b, c, stats):
+    """
+    Return the index of the median of arr[a], arr[b] and arr[c].
+
+    Args:
+        arr: The array being sorted
+        a: First candidate index
+        b: Second candidate index
+        c: Third candidate index
+        stats: Dictionary to track performance statistics (None to skip counting)
+
+    Returns:
+        The index holding the median value
+    """
+    if arr[a] < arr[b]:
+        if arr[b] < arr[c]:
+            median, comparisons = b, 2
+        else:
+            median, comparisons = (c if arr[a] < arr[c] else a), 3
+    elif arr[a] < arr[c]:
+        median, comparisons = a, 2
+    else:
+        median, comparisons = (c if arr[b] < arr[c] else b), 3
+
+    if stats is not None:
+        stats['comparisons'] += comparisons
+    return median
+
+
+def heapsort_range(arr, low, high, stats):
+    """
+    Sort arr[low..high] with the leaf-descent Heap Sort (see heapsort_bottom_up()).
+
+    Args:
+        arr: The array to be sorted
+        low: Starting index
+        high: Ending index
+        stats: Dictionary to track performance statistics (None to skip counting)
+
+    Returns:
+        None (the array is sorted in-place)
+    """
+    segment = arr[low:high + 1]
+    heapsort_bottom_up(segment, stats)
+    arr[low:high + 1] = segment
+
+
+def insertionsort_range(arr, low, high, stats):
+    """
+    Sort arr[low..high] in-place with binary Insertion Sort and block moves.
+
+    Args:
+        arr: The array to be sorted
+        low: Starting index
+        high: Ending index
+        stats: Dictionary to track performance statistics (None to skip counting)
+
+    Returns:
+        None (the array is sorted in-place)
+    """
+    if high <= low:
+        return
+    insertionsort_block_move_range(arr, low, high, stats)
+
+
+if __name__ == "__main__":
+    # Example usage
+    test_array = [10, 7, 8, 9, 1, 5]
+    print(f"Original array: {test_array}")
+
+    stats = introsort(test_array, {'comparisons': 0, 'swaps': 0})
+    print(f"Sorted array: {test_array}")
+    print(f"Performance stats: {stats}")
+
+    # Inputs that make the plain Quick Sort quadratic
+    for name, large_array in [("reverse sorted", list(range(10000, 0, -1))),
+                              ("constant", [42] * 10000)]:
+        print(f"\nSorting {len(large_array)} {name} elements...")
+        stats = introsort(large_array, {'comparisons': 0, 'swaps': 0})
+        print(f"Performance stats: {stats}")
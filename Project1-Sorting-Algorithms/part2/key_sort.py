@@ -0,0 +1,180 @@
+"""
+Key-function and record sorting for the part2 sorters (decorate-sort-undecorate).
+
+Every part2 sorter accepts key= and reverse= and hands them to this module, which:
+1. Computes key(element) once per element (a Schwartzian transform) rather than once
+   per comparison
+2. Decorates each key with the element's original index, so equal keys keep their
+   original order even under unstable sorters such as Quick Sort and Heap Sort
+3. Sorts the decorated keys with the chosen algorithm and rebuilds the element order
+
+When every key is an int, the key and index are packed into a single int
+(key * n + index) instead of a tuple. Comparisons are then plain int comparisons, and
+the integer-only sorters (Counting Sort, Radix Sort) can be used with keys too.
+
+Decorated keys that are equal on key() become runs in ascending index order, so inputs
+with many ties look partly sorted to the sorter. Quick Sort's last-element pivot is at
+its worst on such runs; prefer Introsort or Tim Sort for heavily tied keys.
+
+multi_key_sort() adds a stable multi-key mode, where every key can have its own direction.
+"""
+
+import os
+import sys
+
+# Add the parent directory to the path so we can import the sorting modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from part2.array_utils import assign_slice, copy_slice
+
+
+def decorate(arr, key, reverse):
+    """
+    Build the decorated keys of arr.
+
+    Indexes are stored in descending order when reverse is set, so that after the final
+    reversal equal keys are back in their original order.
+
+    Args:
+        arr: The elements
+        key: Function computing the sort key of an element (None: the element itself)
+        reverse: Whether the result will be reversed
+
+    Returns:
+        (decorated list, packed) where packed tells whether the entries are packed ints
+        rather than (key, index) tuples
+    """
+    n = len(arr)
+    keys = list(arr) if key is None else [key(element) for element in arr]
+    indexes = range(n - 1, -1, -1) if reverse else range(n)
+
+    if all(type(k) is int for k in keys):
+        return [k * n + index for k, index in zip(keys, indexes)], True
+    return list(zip(keys, indexes)), False
+
+
+def undecorate(arr, decorated, packed, reverse):
+    """
+    Return the elements of arr in the order given by the sorted decorated keys.
+
+    Args:
+        arr: The original elements
+        decorated: The sorted decorated keys
+        packed: Whether the entries are packed ints
+        reverse: Whether the order should be reversed
+
+    Returns:
+        A new list of the elements of arr
+    """
+    n = len(arr)
+    if packed:
+        indexes = [entry % n for entry in decorated]
+    else:
+        indexes = [entry[1] for entry in decorated]
+    if reverse:
+        indexes.reverse()
+        return [arr[n - 1 - index] for index in indexes]
+    return [arr[index] for index in indexes]
+
+
+def key_sorted(arr, algorithm, key=None, reverse=False, stats=None):
+    """
+    Return a new list with the elements of arr sorted by key.
+
+    Args:
+        arr: The elements to sort (not modified)
+        algorithm: A part2 sorter taking (arr, stats=None); it may sort in-place or
+            return a new list
+        key: Function computing the sort key of an element (default: the element)
+        reverse: Sort in descending order of key, keeping equal keys in original order
+        stats: Dictionary to track performance statistics (optional); the number of
+            key computations is recorded under 'key_calls'
+
+    Returns:
+        A new sorted list
+    """
+    if len(arr) < 2:
+        return list(arr)
+
+    decorated, packed = decorate(arr, key, reverse)
+    returned = algorithm(decorated, stats=stats)
+    # Merge Sort returns a new list; the in-place sorters return None or their stats
+    if isinstance(returned, list):
+        decorated = returned
+
+    if stats is not None:
+        stats['key_calls'] = stats.get('key_calls', 0) + (len(arr) if key is not None else 0)
+    return undecorate(arr, decorated, packed, reverse)
+
+
+def key_sort(arr, algorithm, key=None, reverse=False, stats=None, low=None, high=None):
+    """
+    Sort arr in-place by key; see key_sorted().
+
+    Args:
+        low: Starting index of the range to sort (default: 0)
+        high: Ending index of the range to sort (default: len(arr)-1); elements
+            outside arr[low..high] are left where they are
+
+    Returns:
+        The stats dictionary, or None when stats is not provided
+        (the array is sorted in-place)
+    """
+    if low is None:
+        low = 0
+    if high is None:
+        high = len(arr) - 1
+    if low == 0 and high == len(arr) - 1:
+        assign_slice(arr, 0, len(arr), key_sorted(arr, algorithm, key, reverse, stats))
+        return stats
+
+    segment = copy_slice(arr, low, high + 1)
+    assign_slice(arr, low, low + len(segment), key_sorted(segment, algorithm, key, reverse, stats))
+    return stats
+
+
+def multi_key_sort(arr, keys, algorithm=None, stats=None):
+    """
+    Stably sort arr in-place by several keys, each with its own direction.
+
+    The sort runs one stable pass per key, from the least significant key to the most
+    significant one, so ties on a key are ordered by the keys after it.
+
+    Args:
+        arr: The elements to sort
+        keys: List of key functions, or of (key function, reverse) pairs, most
+            significant first
+        algorithm: A part2 sorter taking (arr, stats=None) (default: Introsort)
+        stats: Dictionary to track performance statistics (optional)
+
+    Returns:
+        The stats dictionary, or None when stats is not provided
+        (the array is sorted in-place)
+    """
+    if algorithm is None:
+        from part2.introsort import introsort
+        algorithm = introsort
+
+    for spec in reversed(keys):
+        key, reverse = spec if isinstance(spec, tuple) else (spec, False)
+        key_sort(arr, algorithm, key, reverse, stats)
+    return stats
+
+
+if __name__ == "__main__":
+    # Example usage with records like the Lab 7 ticket cancellations
+    from operator import itemgetter
+    from part2.quicksort import quicksort
+
+    tickets = [
+        {"ticket_id": "T1003", "event": "Sports", "priority": 2},
+        {"ticket_id": "T1001", "event": "Concert", "priority": 1},
+        {"ticket_id": "T1004", "event": "Concert", "priority": 2},
+        {"ticket_id": "T1002", "event": "Theater", "priority": 1},
+    ]
+
+    stats = quicksort(tickets, key=itemgetter('priority'), reverse=True, stats={'comparisons': 0, 'swaps': 0})
+    print(f"By priority, highest first: {[t['ticket_id'] for t in tickets]}, stats: {stats}")
+
+    multi_key_sort(tickets, [itemgetter('event'), (itemgetter('ticket_id'), True)])
+    print(f"By event, then ticket id descending: {[t['ticket_id'] for t in tickets]}")
@@ -0,0 +1,228 @@
+"""
+Lazy k-way merge of sorted iterables with a loser tree.
+
+merge() in mergesort.py combines two lists into a new list, so merging k sorted shards
+with it means log2(k) passes that each copy every element (or k passes when the shards
+are folded in one at a time). kmerge() instead:
+1. Consumes any number of sorted iterables lazily and yields one merged stream, holding
+   only the current head of each input: O(k) memory however long the inputs are
+2. Picks every next element with a loser tree (tournament tree): the leaf of the input
+   that produced the last winner replays its path to the root, one comparison per
+   level, so each element costs about log2(k) comparisons
+3. Breaks ties by input position, so the merge is stable
+
+kmerge_chunks() yields the same stream as lists of a fixed size. A downstream writer
+pulls one chunk at a time and nothing is read ahead of what it asks for, so a slow
+consumer never causes the merge to buffer more than one chunk.
+"""
+
+import os
+import sys
+from itertools import islice
+
+# Add the parent directory to the path so we can import the sorting modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Elements per chunk yielded by kmerge_chunks()
+DEFAULT_CHUNK_SIZE = 4096
+
+
+class Exhausted:
+    """
+    Key of an exhausted input: greater than every other key, so it loses every match.
+
+    Comparisons with another type fall back to these reflected methods, which lets the
+    merge loop compare keys without first checking for exhausted inputs.
+    """
+
+    def __lt__(self, other):
+        return False
+
+    def __gt__(self, other):
+        return other is not self
+
+    def __le__(self, other):
+        return other is self
+
+    def __ge__(self, other):
+        return True
+
+
+# Marks an exhausted input
+EXHAUSTED = Exhausted()
+
+
+def kmerge(*iterables, key=None, stats=None):
+    """
+    Lazily merge sorted iterables into one sorted stream.
+
+    Args:
+        *iterables: Iterables, each sorted by key
+        key: Function computing the sort key of each element, called once
+            per element (optional)
+        stats: Dictionary to track performance statistics (optional). Counts are added
+            as the stream is consumed, and are complete once it is exhausted or closed.
+
+    Returns:
+        A generator of the merged elements
+    """
+    iterators = [iter(iterable) for iterable in iterables]
+    if stats is None:
+        return loser_tree_merge_fast(iterators, key)
+    return loser_tree_merge(iterators, key, stats)
+
+
+def kmerge_chunks(*iterables, chunk_size=DEFAULT_CHUNK_SIZE, key=None, stats=None):
+    """
+    Lazily merge sorted iterables, yielding the merged stream in chunks.
+
+    Args:
+        *iterables: Iterables, each sorted by key
+        chunk_size: Maximum number of elements per chunk
+        key: Function computing the sort key of each element (optional)
+        stats: Dictionary to track performance statistics (optional)
+
+    Returns:
+        A generator of lists of at most chunk_size elements; only the last may be shorter
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+    merged = kmerge(*iterables, key=key, stats=stats)
+    while True:
+        chunk = list(islice(merged, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def build_loser_tree(keys, k, beats):
+    """
+    Play the initial tournament between the inputs.
+
+    Leaves are the inputs 0..k-1 (leaf i sits at node k + i); internal node 1..k-1
+    stores the loser of the match played there.
+
+    Args:
+        keys: Current key of each input (EXHAUSTED when it has no more elements)
+        k: Number of inputs
+        beats: Function beats(a, b) telling whether input a wins against input b
+
+    Returns:
+        (tree, winner) where tree is the list of losers indexed by node
+    """
+    tree = [0] * k
+    winners = [0] * (2 * k)
+    for i in range(k):
+        winners[k + i] = i
+    for node in range(k - 1, 0, -1):
+        a = winners[2 * node]
+        b = winners[2 * node + 1]
+        if beats(b, a):
+            a, b = b, a
+        winners[node] = a
+        tree[node] = b
+    return tree, winners[1] if k > 1 else 0
+
+
+def loser_tree_merge(iterators, key, stats):
+    """
+    Instrumented loser-tree merge; see kmerge().
+
+    'comparisons' counts key comparisons and 'swaps' counts elements yielded.
+    """
+    k = len(iterators)
+    if k == 0:
+        return
+    values = [next(iterator, EXHAUSTED) for iterator in iterators]
+    keys = [value if key is None or value is EXHAUSTED else key(value) for value in values]
+    comparisons = 0
+    moves = 0
+
+    def beats(a, b):
+        # Exhausted inputs lose every match; equal keys go to the earlier input
+        nonlocal comparisons
+        if keys[b] is EXHAUSTED:
+            return True
+        if keys[a] is EXHAUSTED:
+            return False
+        comparisons += 1
+        if a < b:
+            return not keys[b] < keys[a]
+        return keys[a] < keys[b]
+
+    tree, winner = build_loser_tree(keys, k, beats)
+    try:
+        while values[winner] is not EXHAUSTED:
+            value = values[winner]
+            following = next(iterators[winner], EXHAUSTED)
+            values[winner] = following
+            keys[winner] = following if key is None or following is EXHAUSTED else key(following)
+            moves += 1
+
+            # Replay the winner's path: whoever wins each match continues upwards
+            node = (winner + k) >> 1
+            while node:
+                if beats(tree[node], winner):
+                    tree[node], winner = winner, tree[node]
+                node >>= 1
+            yield value
+    finally:
+        stats['comparisons'] += comparisons
+        stats['swaps'] += moves
+
+
+def loser_tree_merge_fast(iterators, key):
+    """
+    Uninstrumented loser-tree merge (no statistics are collected); see kmerge().
+    """
+    k = len(iterators)
+    if k == 0:
+        return
+    if k == 1:
+        yield from iterators[0]
+        return
+    values = [next(iterator, EXHAUSTED) for iterator in iterators]
+    keys = [value if key is None or value is EXHAUSTED else key(value) for value in values]
+
+    def beats(a, b):
+        if a < b:
+            return not keys[b] < keys[a]
+        return keys[a] < keys[b]
+
+    tree, winner = build_loser_tree(keys, k, beats)
+    while True:
+        value = values[winner]
+        if value is EXHAUSTED:
+            return
+        following = next(iterators[winner], EXHAUSTED)
+        values[winner] = following
+        if key is None or following is EXHAUSTED:
+            winner_key = following
+        else:
+            winner_key = key(following)
+        keys[winner] = winner_key
+
+        # The match logic of beats() is inlined here: this loop runs log2(k) times
+        # per element. EXHAUSTED keys lose through their comparison methods.
+        node = (winner + k) >> 1
+        while node:
+            opponent = tree[node]
+            opponent_key = keys[opponent]
+            if opponent_key < winner_key if opponent > winner else not winner_key < opponent_key:
+                tree[node] = winner
+                winner = opponent
+                winner_key = opponent_key
+            node >>= 1
+        yield value
+
+
+if __name__ == "__main__":
+    # Example usage: merge sorted shards, including a generator, as a stream
+    import random
+
+    shards = [sorted(random.sample(range(1000), 8)) for _ in range(4)]
+    shards.append(x * 100 for x in range(5))
+    stats = {'comparisons': 0, 'swaps': 0}
+    for chunk in kmerge_chunks(*shards, chunk_size=10, stats=stats):
+        print(chunk)
+    print(f"Performance stats: {stats}")
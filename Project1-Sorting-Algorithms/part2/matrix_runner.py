@@ -0,0 +1,104 @@
+"""
+Run a benchmark matrix with one process per cell.
+
+Running every (algorithm, dataset) pair in one process means a single slow cell (for
+example Insertion Sort on a large input) holds up the whole matrix, and a crash loses
+every result. run_matrix() instead:
+1. Runs each cell in its own process, with at most `jobs` processes at a time
+2. Terminates cells that exceed a per-cell timeout and records them as 'timeout'
+3. Appends every result to the CSV as soon as its cell finishes
+
+Concurrent cells compete for CPU time and memory bandwidth, so timings taken with
+jobs > 1 are not comparable with serial ones; keep jobs=1 for timing-sensitive runs.
+"""
+
+import csv
+import multiprocessing
+import time
+from multiprocessing.connection import wait
+
+# Seconds between checks for finished or overdue cells
+POLL_INTERVAL = 0.1
+
+
+def run_matrix(cells, worker, fieldnames, output_path, jobs=1, timeout=None):
+    """
+    Run worker once per cell, each call in a separate process.
+
+    Args:
+        cells: List of (row, args) pairs. args are passed to worker; row holds the
+            identifying columns (algorithm, dataset, ...) used when the cell fails.
+        worker: Module-level function returning a result row (a dictionary)
+        fieldnames: CSV columns, in order; 'status' and 'error' are added when missing
+        output_path: CSV file, rewritten with a header and then appended to
+        jobs: Maximum number of cells running at once (at least 1)
+        timeout: Seconds a cell may run before it is terminated (None for no limit)
+
+    Returns:
+        The result rows in completion order. Every row has a 'status' of 'ok',
+        'error' or 'timeout'.
+    """
+    # With no slot to start a cell in, the scheduling loop would never finish
+    if jobs < 1:
+        raise ValueError(f"jobs must be at least 1, got {jobs}")
+
+    fieldnames = list(fieldnames) + [name for name in ('status', 'error') if name not in fieldnames]
+    results = []
+    pending = list(enumerate(cells))
+    running = {}  # connection -> (process, index, start time)
+
+    with open(output_path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
+        writer.writeheader()
+        f.flush()
+
+        def finish(index, row):
+            results.append(row)
+            writer.writerow(row)
+            f.flush()
+            print(f"Finished cell {len(results)}/{len(cells)} [{row['status']}]: "
+                  f"{', '.join(str(value) for value in cells[index][0].values())}")
+
+        while pending or running:
+            # Start cells until the concurrency limit is reached
+            while pending and len(running) < jobs:
+                index, (row, args) = pending.pop(0)
+                receiver, sender = multiprocessing.Pipe(duplex=False)
+                process = multiprocessing.Process(target=run_cell, args=(worker, args, sender))
+                process.start()
+                sender.close()
+                running[receiver] = (process, index, time.monotonic())
+
+            ready = wait(list(running), timeout=POLL_INTERVAL)
+
+            for receiver in list(running):
+                process, index, start = running[receiver]
+                row = dict(cells[index][0])
+                if receiver in ready:
+                    try:
+                        row.update(receiver.recv())
+                    except EOFError:
+                        # The process died without sending a result
+                        process.join()
+                        row.update(status='error', error=f"process exited with code {process.exitcode}")
+                elif timeout is not None and time.monotonic() - start > timeout:
+                    process.terminate()
+                    row.update(status='timeout', error=f"exceeded {timeout} s")
+                else:
+                    continue
+                process.join()
+                receiver.close()
+                del running[receiver]
+                finish(index, row)
+
+    return results
+
+
+def run_cell(worker, args, sender):
+    """Process entry point: run worker(*args) and send its row (or the error) back."""
+    try:
+        row = dict(worker(*args), status='ok')
+    except Exception as e:
+        row = {'status': 'error', 'error': f"{type(e).__name__}: {e}"}
+    sender.send(row)
+    sender.close()
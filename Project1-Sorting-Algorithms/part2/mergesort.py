@@ -2,38 +2,71 @@
 Implementation of Merge Sort algorithm.
 
 This module provides functions to perform the Merge Sort algorithm on lists of comparable elements.
+Pass a stats dictionary to count comparisons and moves, or leave stats as None to run a
+specialized loop with no counting at all.
 """
 
-def mergesort(arr, stats=None):
+import os
+import sys
+
+# Add the parent directory to the path so we can import the sorting modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from part2.key_sort import key_sort, key_sorted
+
+def mergesort(arr, stats=None, key=None, reverse=False):
     """
     Sort an array using the Merge Sort algorithm.
     
     Args:
         arr: The array to be sorted
-        stats: Dictionary to track performance statistics (optional)
+        stats: Dictionary to track performance statistics (optional). A PhaseTracer
+            under 'tracer' receives the 'mergesort', 'split' and 'merge' phases.
+        key: Function computing the sort key of each element, called once
+            per element (optional)
+        reverse: Sort in descending order; equal keys keep their original order
         
     Returns:
         The sorted array
     """
-    # Initialize stats dictionary if not provided
+    # Sort decorated keys instead of the elements (see part2/key_sort.py)
+    if key is not None or reverse:
+        return key_sorted(arr, mergesort, key, reverse, stats)
+
+    # Without a stats dictionary, run the uninstrumented loop
     if stats is None:
-        stats = {'comparisons': 0, 'swaps': 0}
+        return mergesort_fast(arr)
     
     # Base case: arrays with 0 or 1 element are already sorted
     if len(arr) <= 1:
         return arr
     
+    # Report phases to a tracer when one is attached (see part2/phase_tracer.py)
+    tracer = stats.get('tracer')
+    if tracer is not None:
+        tracer.enter('mergesort')
+        tracer.enter('split')
+    
     # Split the array into two halves
     mid = len(arr) // 2
     left_half = arr[:mid]
     right_half = arr[mid:]
     
+    if tracer is not None:
+        tracer.exit()
+    
     # Recursively sort both halves
     left_half = mergesort(left_half, stats)
     right_half = mergesort(right_half, stats)
     
     # Merge the sorted halves
-    return merge(left_half, right_half, stats)
+    if tracer is None:
+        return merge(left_half, right_half, stats)
+    tracer.enter('merge')
+    result = merge(left_half, right_half, stats)
+    tracer.exit()
+    tracer.exit()
+    return result
 
 
 def merge(left, right, stats):
@@ -76,6 +109,197 @@ def merge(left, right, stats):
     return result
 
 
+def mergesort_fast(arr):
+    """
+    Uninstrumented Merge Sort (no statistics are collected).
+    
+    Args:
+        arr: The array to be sorted
+        
+    Returns:
+        The sorted array
+    """
+    if len(arr) <= 1:
+        return arr
+    
+    mid = len(arr) // 2
+    return merge_fast(mergesort_fast(arr[:mid]), mergesort_fast(arr[mid:]))
+
+
+def merge_fast(left, right):
+    """
+    Uninstrumented merge of two sorted arrays; same result as merge().
+    
+    Args:
+        left: First sorted array
+        right: Second sorted array
+        
+    Returns:
+        A merged sorted array
+    """
+    result = []
+    append = result.append
+    i = j = 0
+    len_left = len(left)
+    len_right = len(right)
+    
+    while i < len_left and j < len_right:
+        if left[i] <= right[j]:
+            append(left[i])
+            i += 1
+        else:
+            append(right[j])
+            j += 1
+    
+    # Only one of these slices is non-empty
+    result.extend(left[i:])
+    result.extend(right[j:])
+    return result
+
+
+def mergesort_bottom_up(arr, stats=None, key=None, reverse=False):
+    """
+    Sort an array in-place using iterative (bottom-up) Merge Sort.
+    
+    Runs of width 1, 2, 4, ... are merged pairwise inside the caller's list. A single
+    auxiliary buffer is allocated once and reused for every merge, and a merge is
+    skipped entirely when the two runs are already in order. The sort is stable.
+    
+    Args:
+        arr: The array to be sorted
+        stats: Dictionary to track performance statistics (optional)
+        key: Function computing the sort key of each element, called once
+            per element (optional)
+        reverse: Sort in descending order; equal keys keep their original order
+        
+    Returns:
+        The stats dictionary, or None when stats is not provided
+        (the array is sorted in-place)
+    """
+    # Sort decorated keys instead of the elements (see part2/key_sort.py)
+    if key is not None or reverse:
+        return key_sort(arr, mergesort_bottom_up, key, reverse, stats)
+
+    # Without a stats dictionary, run the uninstrumented loop
+    if stats is None:
+        mergesort_bottom_up_fast(arr)
+        return None
+    
+    n = len(arr)
+    
+    # One buffer for the whole sort; it only ever holds the left run of a merge
+    buffer = [None] * n
+    
+    width = 1
+    while width < n:
+        for low in range(0, n - width, 2 * width):
+            mid = low + width
+            high = min(low + 2 * width, n)
+            
+            # Runs are already ordered: nothing to merge
+            stats['comparisons'] += 1  # Count comparison
+            if arr[mid - 1] <= arr[mid]:
+                continue
+            
+            merge_with_buffer(arr, buffer, low, mid, high, stats)
+        width *= 2
+    
+    return stats
+
+
+def merge_with_buffer(arr, buffer, low, mid, high, stats):
+    """
+    Merge the sorted runs arr[low:mid] and arr[mid:high] in-place.
+    
+    The left run is copied into the front of buffer and merged back into arr. Elements
+    of the right run that remain after the left run is exhausted are already in place.
+    Every element written back into arr counts as one move.
+    
+    Args:
+        arr: The array holding both runs
+        buffer: Reusable auxiliary list with room for at least mid - low elements
+        low: Start of the left run
+        mid: Start of the right run
+        high: End of the right run (exclusive)
+        stats: Dictionary to track performance statistics
+        
+    Returns:
+        None (arr is modified in-place)
+    """
+    left_length = mid - low
+    for k in range(left_length):
+        buffer[k] = arr[low + k]
+    
+    i = 0
+    j = mid
+    k = low
+    
+    # Compare elements from both runs and write the smaller back into arr
+    while i < left_length and j < high:
+        stats['comparisons'] += 1  # Count comparison
+        if buffer[i] <= arr[j]:
+            arr[k] = buffer[i]
+            i += 1
+        else:
+            arr[k] = arr[j]
+            j += 1
+        k += 1
+        stats['swaps'] += 1  # Count move operation
+    
+    # Copy what is left of the left run; leftovers of the right run are in place
+    while i < left_length:
+        arr[k] = buffer[i]
+        i += 1
+        k += 1
+        stats['swaps'] += 1  # Count move operation
+
+
+def mergesort_bottom_up_fast(arr):
+    """
+    Uninstrumented bottom-up Merge Sort (no statistics are collected).
+    
+    Args:
+        arr: The array to be sorted
+        
+    Returns:
+        None (the array is sorted in-place)
+    """
+    n = len(arr)
+    buffer = [None] * n
+    
+    width = 1
+    while width < n:
+        for low in range(0, n - width, 2 * width):
+            mid = low + width
+            if arr[mid - 1] <= arr[mid]:
+                continue
+            high = min(low + 2 * width, n)
+            
+            left_length = width
+            for k in range(left_length):
+                buffer[k] = arr[low + k]
+            
+            i = 0
+            j = mid
+            k = low
+            while i < left_length and j < high:
+                left_value = buffer[i]
+                right_value = arr[j]
+                if left_value <= right_value:
+                    arr[k] = left_value
+                    i += 1
+                else:
+                    arr[k] = right_value
+                    j += 1
+                k += 1
+            
+            while i < left_length:
+                arr[k] = buffer[i]
+                i += 1
+                k += 1
+        width *= 2
+
+
 if __name__ == "__main__":
     # Example usage
     test_array = [38, 27, 43, 3, 9, 82, 10]
@@ -92,4 +316,10 @@ if __name__ == "__main__":
     stats = {'comparisons': 0, 'swaps': 0}
     print(f"\nSorting an array of {len(large_array)} random elements...")
     sorted_large = mergesort(large_array, stats)
+    print(f"Performance stats: {stats}")
+    
+    # Same input with the in-place bottom-up variant
+    stats = {'comparisons': 0, 'swaps': 0}
+    print(f"\nSorting the same array in-place with bottom-up Merge Sort...")
+    mergesort_bottom_up(large_array, stats)
     print(f"Performance stats: {stats}")
\ No newline at end of file
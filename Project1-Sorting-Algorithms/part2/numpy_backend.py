@@ -0,0 +1,199 @@
+"""
+NumPy-vectorized sorting backend.
+
+This module keeps datasets as NumPy int64 arrays from generation and loading through
+sorting and verification, so the vectorized kernels can be measured in the same
+harness as the pure-Python part2 sorters:
+1. Dataset generators that build the five dataset families directly as int64 arrays
+2. Sorters with the part2 signature (arr, stats=None) wrapping np.sort/argsort kinds
+3. A vectorized sortedness check
+4. buffer_sorter(), which runs a part2 sorter on a memoryview of an int64 array so the
+   data stays in the packed buffer instead of being converted to a list
+
+NumPy is optional; everything else in part2 works without it. Calling into this module
+without NumPy installed raises ImportError.
+"""
+
+import os
+import sys
+from functools import partial
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed for this backend
+    np = None
+
+# Add the parent directory to the path so we can import the sorting modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Algorithms accepted by ndarray.sort(kind=...)
+NUMPY_SORT_KINDS = ['quicksort', 'mergesort', 'heapsort', 'stable']
+
+
+def require_numpy():
+    """Raise ImportError if NumPy is not installed."""
+    if np is None:
+        raise ImportError("The NumPy backend requires NumPy: pip install numpy")
+
+
+def is_numpy_array(obj):
+    """Return True if obj is a NumPy array (False when NumPy is not installed)."""
+    return np is not None and isinstance(obj, np.ndarray)
+
+
+def to_int64_array(data):
+    """
+    Convert data to a NumPy int64 array.
+
+    Objects exposing a buffer of 8-byte integers (array('q'), memoryview, mmap slices)
+    are wrapped without copying; other sequences are converted.
+
+    Args:
+        data: A sequence of integers
+
+    Returns:
+        A one-dimensional int64 array
+    """
+    require_numpy()
+    if isinstance(data, np.ndarray):
+        return data.astype(np.int64, copy=False)
+    try:
+        view = memoryview(data)
+    except TypeError:
+        return np.asarray(data, dtype=np.int64)
+    if view.itemsize == 8 and view.format in ('q', '<q', 'l', '<l'):
+        return np.frombuffer(data, dtype=np.int64)
+    return np.asarray(data, dtype=np.int64)
+
+
+def generate_dataset_array(kind, size, seed=None):
+    """
+    Generate one of the standard dataset families as an int64 array.
+
+    The families and their parameters match data/generate_datasets.py.
+
+    Args:
+        kind: 'random', 'nearly_sorted', 'reverse_sorted', 'duplicates' or 'constant'
+        size: Number of elements
+        seed: Seed for the random generator (optional)
+
+    Returns:
+        A one-dimensional int64 array
+    """
+    require_numpy()
+    rng = np.random.default_rng(seed)
+
+    if kind == 'random':
+        # Distinct values while the range allows it, like random.sample()
+        min_val, max_val = -10000, 10000
+        width = max_val - min_val + 1
+        if size <= width:
+            return rng.choice(width, size=size, replace=False).astype(np.int64) + min_val
+        return rng.integers(min_val, max_val + 1, size=size, dtype=np.int64)
+
+    if kind == 'nearly_sorted':
+        # 10% of the positions take part in disjoint random swaps
+        arr = np.arange(size, dtype=np.int64)
+        num_swaps = min(size * 10 // 100, size // 2)
+        positions = rng.choice(size, size=2 * num_swaps, replace=False)
+        first, second = positions[:num_swaps], positions[num_swaps:]
+        arr[first], arr[second] = arr[second], arr[first]
+        return arr
+
+    if kind == 'reverse_sorted':
+        return np.arange(size, 0, -1, dtype=np.int64)
+
+    if kind == 'duplicates':
+        # 20% distinct values drawn from [-1000, 1000)
+        num_unique = min(max(1, size * 20 // 100), 2000)
+        unique_values = rng.choice(np.arange(-1000, 1000, dtype=np.int64), size=num_unique, replace=False)
+        return rng.choice(unique_values, size=size)
+
+    if kind == 'constant':
+        return np.full(size, 42, dtype=np.int64)
+
+    raise ValueError(f"Unknown dataset kind: '{kind}'")
+
+
+def numpy_sort(arr, stats=None, kind='quicksort'):
+    """
+    Sort a NumPy array in-place with ndarray.sort().
+
+    Args:
+        arr: The array to be sorted
+        stats: Dictionary to track performance statistics (optional); the vectorized
+            kernels do not report comparisons or swaps, so it is returned unchanged
+        kind: One of NUMPY_SORT_KINDS
+
+    Returns:
+        The stats dictionary, or None when stats is not provided
+        (the array is sorted in-place)
+    """
+    arr.sort(kind=kind)
+    return stats
+
+
+def numpy_argsort_sort(arr, stats=None, kind='stable'):
+    """
+    Sort a NumPy array in-place by gathering it through np.argsort().
+
+    This is the pattern used when a permutation must be applied to other columns too.
+
+    Args:
+        arr: The array to be sorted
+        stats: Dictionary to track performance statistics (optional, returned unchanged)
+        kind: One of NUMPY_SORT_KINDS
+
+    Returns:
+        The stats dictionary, or None when stats is not provided
+        (the array is sorted in-place)
+    """
+    order = np.argsort(arr, kind=kind)
+    arr[:] = arr[order]
+    return stats
+
+
+def numpy_sorters():
+    """
+    Return (function, name) pairs for every vectorized sorter.
+
+    Returns:
+        A list of (callable, display name) tuples
+    """
+    require_numpy()
+    sorters = [(partial(numpy_sort, kind=kind), f'NumPy sort ({kind})') for kind in NUMPY_SORT_KINDS]
+    sorters.append((partial(numpy_argsort_sort, kind='stable'), 'NumPy argsort (stable)'))
+    return sorters
+
+
+def is_sorted_vectorized(arr):
+    """Return True if the NumPy array arr is in non-descending order."""
+    return bool(np.all(arr[:-1] <= arr[1:]))
+
+
+def buffer_sorter(algorithm):
+    """
+    Wrap a part2 sorter so it runs on a memoryview of a NumPy array.
+
+    The data stays in the array's packed int64 buffer and is sorted in-place through
+    the view. Sorters that return a new sequence (Merge Sort) still do so.
+
+    Args:
+        algorithm: A part2 sorter taking (arr, stats=None)
+
+    Returns:
+        A sorter taking (arr, stats=None) where arr is a NumPy array
+    """
+    def sort_buffer(arr, stats=None):
+        view = memoryview(arr)
+        try:
+            result = algorithm(view, stats=stats)
+            # Merge Sort returns its input unchanged for n <= 1; detach it from the view
+            if isinstance(result, memoryview):
+                result = result.tolist()
+        finally:
+            view.release()
+        return result
+
+    sort_buffer.__name__ = getattr(algorithm, '__name__', 'sort_buffer')
+    return sort_buffer
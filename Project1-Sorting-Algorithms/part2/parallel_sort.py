@@ -0,0 +1,536 @@
+"""
+Parallel sorting on top of the part2 sequential sorters.
+
+This module provides two process-pool strategies:
+1. Parallel Merge Sort: the input is split into one chunk per worker, every chunk is
+   sorted in a separate process with the adaptive Timsort-style sort, and the sorted
+   chunks are combined with a k-way heap merge.
+2. Parallel Sample Sort: splitters chosen from an oversampled random sample divide the
+   values into buckets, the buckets are filled in parallel and each bucket is sorted in
+   a worker. Concatenating the buckets gives the result, so there is no final merge.
+
+Large integer inputs are handed to the workers through a single shared memory block
+(packed as signed 64-bit integers) instead of pickling a list per chunk. Other inputs
+fall back to sending the chunks themselves.
+"""
+
+import heapq
+import os
+import random
+import sys
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from multiprocessing import shared_memory
+
+# Add the parent directory to the path so we can import the sorting modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from part2.array_utils import assign_slice
+from part2.timsort import timsort
+from part2.key_sort import key_sort
+
+# Inputs smaller than this are sorted sequentially; process start-up would dominate
+PARALLEL_THRESHOLD = 10000
+
+# Inputs at least this large travel through shared memory instead of pickled lists
+SHARED_MEMORY_THRESHOLD = 100000
+
+# Sample sort draws this many sample elements per bucket when choosing splitters
+OVERSAMPLING_FACTOR = 32
+
+# Range of values that fit the 'q' (signed 64-bit) array typecode
+INT64_MIN = -2 ** 63
+INT64_MAX = 2 ** 63 - 1
+
+
+def parallel_mergesort(arr, workers=None, stats=None, key=None, reverse=False):
+    """
+    Sort an array using Merge Sort parallelized over a process pool.
+
+    Args:
+        arr: The array to be sorted
+        workers: Number of worker processes (default: os.cpu_count())
+        stats: Dictionary to track performance statistics (optional)
+        key: Function computing the sort key of each element, called once
+            per element (optional)
+        reverse: Sort in descending order; equal keys keep their original order
+
+    Returns:
+        The stats dictionary, or None when stats is not provided
+        (the array is sorted in-place)
+    """
+    # Sort decorated keys instead of the elements (see part2/key_sort.py)
+    if key is not None or reverse:
+        return key_sort(arr, partial(parallel_mergesort, workers=workers), key, reverse, stats)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    n = len(arr)
+    if workers <= 1 or n < PARALLEL_THRESHOLD:
+        return timsort(arr, stats)
+
+    bounds = chunk_bounds(n, workers)
+
+    if n >= SHARED_MEMORY_THRESHOLD and fits_int64(arr):
+        chunk_stats = sort_chunks_shared(arr, bounds, workers, stats is not None)
+    else:
+        chunk_stats = sort_chunks_pickled(arr, bounds, workers, stats is not None)
+
+    if stats is not None:
+        for worker_stats in chunk_stats:
+            stats['comparisons'] += worker_stats['comparisons']
+            stats['swaps'] += worker_stats['swaps']
+
+    # Every chunk is now sorted in arr; merge them into one sorted sequence
+    runs = [arr[start:end] for start, end in bounds]
+    assign_slice(arr, 0, n, kway_heap_merge(runs, stats))
+
+    return stats
+
+
+def chunk_bounds(n, parts):
+    """
+    Split range(n) into contiguous, nearly equal (start, end) pairs.
+
+    Args:
+        n: Number of elements
+        parts: Number of chunks
+
+    Returns:
+        A list of (start, end) pairs; end is exclusive
+    """
+    parts = max(1, min(parts, n))
+    size, extra = divmod(n, parts)
+    bounds = []
+    start = 0
+    for i in range(parts):
+        end = start + size + (1 if i < extra else 0)
+        bounds.append((start, end))
+        start = end
+    return bounds
+
+
+def fits_int64(arr):
+    """Return True if every element is an int that fits in a signed 64-bit slot."""
+    if isinstance(arr, array) and arr.typecode in 'bBhHiIlq':
+        return True
+    if not all(type(value) is int for value in arr):
+        return False
+    return len(arr) == 0 or (min(arr) >= INT64_MIN and max(arr) <= INT64_MAX)
+
+
+def sort_chunks_shared(arr, bounds, workers, collect_stats):
+    """
+    Sort the chunks of arr in worker processes through one shared memory block.
+
+    Args:
+        arr: The array whose chunks should be sorted (updated in-place)
+        bounds: List of (start, end) chunk boundaries
+        workers: Number of worker processes
+        collect_stats: Whether workers should count comparisons and swaps
+
+    Returns:
+        A list with one stats dictionary (or None) per chunk
+    """
+    n = len(arr)
+    block = shared_memory.SharedMemory(create=True, size=n * 8)
+    try:
+        view = block.buf.cast('q')
+        view[:] = array('q', arr)
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(sort_shared_chunk, block.name, start, end, collect_stats)
+                           for start, end in bounds]
+                chunk_stats = [future.result() for future in futures]
+
+            # Copy the sorted chunks back into the caller's array
+            assign_slice(arr, 0, n, view.tolist())
+        finally:
+            view.release()
+    finally:
+        block.close()
+        block.unlink()
+
+    return chunk_stats
+
+
+def sort_shared_chunk(name, start, end, collect_stats):
+    """
+    Worker: sort slots [start, end) of the shared int64 block called name.
+
+    Args:
+        name: Name of the shared memory block
+        start: First slot of the chunk
+        end: End of the chunk (exclusive)
+        collect_stats: Whether to count comparisons and swaps
+
+    Returns:
+        The chunk's stats dictionary, or None
+    """
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        view = block.buf.cast('q')
+        try:
+            chunk = view[start:end].tolist()
+            stats = {'comparisons': 0, 'swaps': 0} if collect_stats else None
+            timsort(chunk, stats)
+            view[start:end] = array('q', chunk)
+        finally:
+            view.release()
+    finally:
+        block.close()
+    return stats
+
+
+def sort_chunks_pickled(arr, bounds, workers, collect_stats):
+    """
+    Sort the chunks of arr in worker processes by sending each chunk as a list.
+
+    Args:
+        arr: The array whose chunks should be sorted (updated in-place)
+        bounds: List of (start, end) chunk boundaries
+        workers: Number of worker processes
+        collect_stats: Whether workers should count comparisons and swaps
+
+    Returns:
+        A list with one stats dictionary (or None) per chunk
+    """
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(sort_list_chunk, list(arr[start:end]), collect_stats)
+                   for start, end in bounds]
+        results = [future.result() for future in futures]
+
+    chunk_stats = []
+    for (start, end), (chunk, stats) in zip(bounds, results):
+        assign_slice(arr, start, end, chunk)
+        chunk_stats.append(stats)
+    return chunk_stats
+
+
+def sort_list_chunk(chunk, collect_stats):
+    """
+    Worker: sort a pickled chunk and send it back.
+
+    Args:
+        chunk: The list to be sorted
+        collect_stats: Whether to count comparisons and swaps
+
+    Returns:
+        A tuple (sorted chunk, stats dictionary or None)
+    """
+    stats = {'comparisons': 0, 'swaps': 0} if collect_stats else None
+    timsort(chunk, stats)
+    return chunk, stats
+
+
+def parallel_samplesort(arr, workers=None, stats=None, oversampling=OVERSAMPLING_FACTOR,
+                        key=None, reverse=False):
+    """
+    Sort an array using Sample Sort parallelized over a process pool.
+
+    workers - 1 splitters are picked from a random sample of workers * oversampling
+    elements. Every element is assigned to the bucket between two splitters; an element
+    equal to a splitter goes to that splitter's own equality bucket. Equality buckets
+    need no sorting, so a heavily repeated key (which a skewed distribution tends to
+    pick as a splitter) is never sorted at all, and the remaining buckets stay balanced.
+
+    Args:
+        arr: The array to be sorted
+        workers: Number of worker processes (default: os.cpu_count())
+        stats: Dictionary to track performance statistics (optional)
+        key: Function computing the sort key of each element, called once
+            per element (optional)
+        reverse: Sort in descending order; equal keys keep their original order
+        oversampling: Sample elements drawn per bucket when choosing splitters
+
+    Returns:
+        The stats dictionary, or None when stats is not provided
+        (the array is sorted in-place)
+    """
+    # Sort decorated keys instead of the elements (see part2/key_sort.py)
+    if key is not None or reverse:
+        algorithm = partial(parallel_samplesort, workers=workers, oversampling=oversampling)
+        return key_sort(arr, algorithm, key, reverse, stats)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    n = len(arr)
+    if workers <= 1 or n < PARALLEL_THRESHOLD:
+        return timsort(arr, stats)
+
+    collect_stats = stats is not None
+    splitters = choose_splitters(arr, workers, oversampling, stats)
+    bounds = chunk_bounds(n, workers)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # Phase 1: every worker distributes one chunk of the input over the buckets
+        if n >= SHARED_MEMORY_THRESHOLD and fits_int64(arr):
+            block = shared_memory.SharedMemory(create=True, size=n * 8)
+            try:
+                view = block.buf.cast('q')
+                view[:] = array('q', arr)
+                view.release()
+                futures = [pool.submit(bucket_shared_chunk, block.name, start, end, splitters, collect_stats)
+                           for start, end in bounds]
+                partials = [future.result() for future in futures]
+            finally:
+                block.close()
+                block.unlink()
+        else:
+            futures = [pool.submit(bucket_list_chunk, list(arr[start:end]), splitters, collect_stats)
+                       for start, end in bounds]
+            partials = [future.result() for future in futures]
+
+        # Gather bucket b from every chunk
+        bucket_count = 2 * len(splitters) + 1
+        buckets = [[] for _ in range(bucket_count)]
+        for chunk_buckets, chunk_comparisons in partials:
+            for b in range(bucket_count):
+                buckets[b].extend(chunk_buckets[b])
+            if collect_stats:
+                stats['comparisons'] += chunk_comparisons
+
+        # Phase 2: sort the range buckets (even indices); equality buckets are done
+        futures = {b: pool.submit(sort_list_chunk, buckets[b], collect_stats)
+                   for b in range(0, bucket_count, 2) if len(buckets[b]) > 1}
+        for b, future in futures.items():
+            buckets[b], bucket_stats = future.result()
+            if collect_stats:
+                stats['comparisons'] += bucket_stats['comparisons']
+                stats['swaps'] += bucket_stats['swaps']
+
+    # Buckets are in key order, so concatenating them yields the sorted array
+    position = 0
+    for bucket in buckets:
+        assign_slice(arr, position, position + len(bucket), bucket)
+        position += len(bucket)
+    if collect_stats:
+        stats['swaps'] += n
+
+    return stats
+
+
+def choose_splitters(arr, workers, oversampling, stats=None):
+    """
+    Pick up to workers - 1 distinct splitters from an oversampled random sample.
+
+    Args:
+        arr: The array to be sorted
+        workers: Number of buckets wanted
+        oversampling: Sample elements drawn per bucket
+        stats: Dictionary to track performance statistics (optional)
+
+    Returns:
+        A sorted list of distinct splitter values
+    """
+    sample_size = min(len(arr), workers * oversampling)
+    sample = [arr[i] for i in random.sample(range(len(arr)), sample_size)]
+    timsort(sample, stats)
+
+    # Every oversampling-th element of the sorted sample; duplicates collapse
+    step = sample_size / workers
+    splitters = []
+    for i in range(1, workers):
+        candidate = sample[int(i * step)]
+        if not splitters or splitters[-1] < candidate:
+            splitters.append(candidate)
+    return splitters
+
+
+def bucket_index(value, splitters):
+    """
+    Return the bucket of value for the given sorted, distinct splitters.
+
+    Bucket 2 * i holds values strictly between splitters[i - 1] and splitters[i], and
+    bucket 2 * i + 1 holds values equal to splitters[i].
+    """
+    i = bisect_left(splitters, value)
+    if i < len(splitters) and not value < splitters[i]:
+        return 2 * i + 1
+    return 2 * i
+
+
+def distribute(values, splitters, collect_stats):
+    """
+    Distribute values over the 2 * len(splitters) + 1 buckets.
+
+    Args:
+        values: The values to distribute
+        splitters: Sorted, distinct splitter values
+        collect_stats: Whether to count comparisons
+
+    Returns:
+        A tuple (list of buckets, number of comparisons performed)
+    """
+    count = len(splitters)
+    buckets = [[] for _ in range(2 * count + 1)]
+
+    if not collect_stats:
+        for value in values:
+            buckets[bucket_index(value, splitters)].append(value)
+        return buckets, 0
+
+    # Same search as bucket_index(), written out so every comparison is counted
+    comparisons = 0
+    for value in values:
+        low = 0
+        high = count
+        while low < high:
+            mid = (low + high) // 2
+            comparisons += 1
+            if splitters[mid] < value:
+                low = mid + 1
+            else:
+                high = mid
+        b = 2 * low
+        if low < count:
+            comparisons += 1
+            if not value < splitters[low]:
+                b += 1
+        buckets[b].append(value)
+    return buckets, comparisons
+
+
+def bucket_shared_chunk(name, start, end, splitters, collect_stats):
+    """
+    Worker: distribute slots [start, end) of the shared int64 block over the buckets.
+
+    Returns:
+        A tuple (list of buckets, number of comparisons performed)
+    """
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        view = block.buf.cast('q')
+        try:
+            values = view[start:end].tolist()
+        finally:
+            view.release()
+    finally:
+        block.close()
+    return distribute(values, splitters, collect_stats)
+
+
+def bucket_list_chunk(values, splitters, collect_stats):
+    """
+    Worker: distribute a pickled chunk over the buckets.
+
+    Returns:
+        A tuple (list of buckets, number of comparisons performed)
+    """
+    return distribute(values, splitters, collect_stats)
+
+
+def kway_heap_merge(runs, stats=None):
+    """
+    Merge k sorted runs into a single sorted list with a binary min-heap.
+
+    Without stats this delegates to heapq.merge(). With stats, the heap of run heads is
+    maintained by hand so that every comparison can be counted. Ties are broken by run
+    index, which keeps the merge stable.
+
+    Args:
+        runs: List of sorted sequences
+        stats: Dictionary to track performance statistics (optional)
+
+    Returns:
+        A new sorted list containing every element of every run
+    """
+    if stats is None:
+        return list(heapq.merge(*runs))
+
+    result = []
+    comparisons = 0
+
+    # Heap entries are [value, run index, position within run]
+    heap = [[run[0], index, 0] for index, run in enumerate(runs) if len(run)]
+    size = len(heap)
+
+    # Build the heap bottom-up
+    for i in range(size // 2 - 1, -1, -1):
+        comparisons += sift_down(heap, i, size)
+
+    while size:
+        top = heap[0]
+        value, index, position = top
+        result.append(value)
+
+        # Replace the head with the next element of the same run, or drop the run
+        position += 1
+        run = runs[index]
+        if position < len(run):
+            top[0] = run[position]
+            top[2] = position
+        else:
+            size -= 1
+            heap[0] = heap[size]
+            heap.pop()
+        comparisons += sift_down(heap, 0, size)
+
+    stats['comparisons'] += comparisons
+    stats['swaps'] += len(result)
+    return result
+
+
+def sift_down(heap, i, size):
+    """
+    Restore the heap property below index i of a heap of [value, run index, ...] entries.
+
+    Args:
+        heap: The heap list
+        i: Index of the entry that may be out of place
+        size: Number of entries in the heap
+
+    Returns:
+        The number of comparisons performed
+    """
+    comparisons = 0
+    entry = heap[i] if i < size else None
+    while True:
+        child = 2 * i + 1
+        if child >= size:
+            break
+        right = child + 1
+        if right < size:
+            comparisons += 1
+            if entry_less(heap[right], heap[child]):
+                child = right
+        comparisons += 1
+        if not entry_less(heap[child], entry):
+            break
+        heap[i] = heap[child]
+        i = child
+    if entry is not None:
+        heap[i] = entry
+    return comparisons
+
+
+def entry_less(a, b):
+    """Order heap entries by value, then by run index so that equal values stay stable."""
+    if a[0] < b[0]:
+        return True
+    if b[0] < a[0]:
+        return False
+    return a[1] < b[1]
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    # Example usage
+    test_array = [random.randint(-10000, 10000) for _ in range(200000)]
+    expected = sorted(test_array)
+
+    for algorithm in [parallel_mergesort, parallel_samplesort]:
+        for workers in [1, 2, 4]:
+            data = test_array.copy()
+            stats = {'comparisons': 0, 'swaps': 0}
+            start_time = time.perf_counter()
+            algorithm(data, workers=workers, stats=stats)
+            elapsed = (time.perf_counter() - start_time) * 1000
+            print(f"{algorithm.__name__}, workers={workers}: {elapsed:.1f} ms, "
+                  f"sorted={data == expected}, stats={stats}")
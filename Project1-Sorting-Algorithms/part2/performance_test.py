@@ -5,10 +5,18 @@ This script tests the performance of different sorting algorithms on various dat
 and collects metrics such as execution time, comparisons, and swaps.
 """
 
+import argparse
+import heapq
 import time
 import json
 import os
+import random
 import sys
+import tempfile
+import tracemalloc
+from array import array
+from functools import partial
+from operator import itemgetter
 import pandas as pd
 import matplotlib.pyplot as plt
 from tabulate import tabulate
@@ -17,97 +25,233 @@ from tabulate import tabulate
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import sorting algorithms
-from part2.quicksort import quicksort
-from part2.mergesort import mergesort
-from part2.heapsort import heapsort
-from part2.insertionsort import insertionsort, insertionsort_with_binary_search
+from part2.quicksort import quicksort, quicksort_three_way, quicksort_iterative
+from part2.mergesort import mergesort, mergesort_bottom_up, merge, merge_fast
+from part2.heapsort import heapsort, heapsort_bottom_up
+from part2.insertionsort import insertionsort, insertionsort_with_binary_search, insertionsort_block_move
+from part2.introsort import introsort
+from part2.timsort import timsort
+from part2.parallel_sort import parallel_mergesort, parallel_samplesort
+from part2.external_sort import external_sort
+from part2.kmerge import kmerge, kmerge_chunks
+from part2.selection import nth_element, partial_sort, top_k
+from part2.key_sort import multi_key_sort
+from part2.auto_sort import auto_sort, all_integers
+from part2.radixsort import counting_sort, radix_sort, integer_sort, COUNTING_MAX_RANGE_FACTOR
+from part2.array_utils import is_sorted
+from part2.matrix_runner import run_matrix
+from part2.phase_tracer import PhaseTracer
+from part2.benchmark_harness import (DEFAULT_OPTIONS, measure, measure_memory, peak_rss_kb,
+                                     summarize, pin_cpu)
+from part2.numpy_backend import (to_int64_array, generate_dataset_array, numpy_sorters,
+                                 buffer_sorter, is_numpy_array, is_sorted_vectorized)
+
+# Import dataset generators and the binary dataset format
+from data.dataset_format import open_binary_dataset, load_binary_dataset, read_header
+from data.generate_datasets import (generate_random_array, generate_array_with_duplicates,
+                                    generate_skewed_duplicates_array, generate_nearly_sorted_array,
+                                    generate_reverse_sorted_array, generate_constant_array)
 
 # Create results directory if it doesn't exist
 # (modified on Mar 24) os.makedirs('results', exist_ok=True)
 results_dir = os.path.join('Project1-Sorting-Algorithms', 'results')
 os.makedirs(results_dir, exist_ok=True)
 
-def load_dataset(filename):
-    """Load a dataset from a JSON file."""
-    with open(os.path.join('datasets', filename), 'r') as f:
-        return json.load(f)
+# Columns of performance_results.csv, in the order test_algorithm() produces them
+RESULT_COLUMNS = ['algorithm', 'dataset', 'size', 'time_ms', 'time_uninstrumented_ms',
+                  'time_uninstrumented_min_ms', 'time_uninstrumented_p95_ms',
+                  'time_uninstrumented_ci_low_ms', 'time_uninstrumented_ci_high_ms',
+                  'time_uninstrumented_p95_ci_low_ms', 'time_uninstrumented_p95_ci_high_ms',
+                  'repeats', 'instrumentation_tax_pct', 'comparisons', 'swaps',
+                  'peak_alloc_bytes', 'alloc_blocks_retained', 'peak_rss_kb', 'verified']
+
+def load_dataset(filename, backend='python'):
+    """
+    Load a dataset as a list, or as an int64 array for the NumPy backend.
+    
+    Binary (.bin) datasets are memory-mapped; the NumPy backend wraps the mapping
+    without copying, so no Python ints are created. JSON datasets are parsed.
+    """
+    path = os.path.join('datasets', filename)
+    if filename.endswith('.bin'):
+        dataset = open_binary_dataset(path)
+        if backend == 'numpy':
+            # The array keeps the mapping alive; it is unmapped once the array is freed
+            return to_int64_array(dataset.view)
+        data = dataset.to_list()
+        dataset.close()
+        return data
+    
+    with open(path, 'r') as f:
+        data = json.load(f)
+    if backend == 'numpy':
+        return to_int64_array(data)
+    return data
+
+def dataset_size(filename):
+    """
+    Return the number of values in a dataset without sorting it.
+    
+    Binary datasets store the count in their header; JSON datasets are parsed.
+    """
+    path = os.path.join('datasets', filename)
+    if filename.endswith('.bin'):
+        with open(path, 'rb') as f:
+            return read_header(f)
+    with open(path, 'r') as f:
+        return len(json.load(f))
+
+def list_datasets():
+    """Return the dataset files in datasets/, preferring the binary copy of each dataset."""
+    files = os.listdir('datasets')
+    binary_names = {os.path.splitext(f)[0] for f in files if f.endswith('.bin')}
+    return sorted(f for f in files
+                  if f.endswith('.bin') or (f.endswith('.json') and os.path.splitext(f)[0] not in binary_names))
 
-def test_algorithm(algorithm, dataset, algo_name, dataset_name):
-    """Test a sorting algorithm on a dataset and return performance metrics."""
-    # Make a copy of the dataset to avoid modifying the original
-    data_copy = dataset.copy()
+def verify_sorted(data):
+    """Check sortedness, using the vectorized check for NumPy arrays."""
+    if is_numpy_array(data):
+        return is_sorted_vectorized(data)
+    return is_sorted(data)
+
+def test_algorithm(algorithm, dataset, algo_name, dataset_name, options=None):
+    """
+    Test a sorting algorithm on a dataset and return performance metrics.
+    
+    The algorithm is measured twice with the benchmark harness: with a stats dictionary
+    (instrumented) and with stats=None (uninstrumented fast path), so the cost of
+    counting comparisons and swaps can be reported alongside the raw sorting time.
+    time_ms and time_uninstrumented_ms are medians over the measured repeats; the
+    uninstrumented path also reports its min, p95 and 95% confidence intervals.
     
-    # Initialize stats dictionary
-    stats = {'comparisons': 0, 'swaps': 0}
+    Memory is profiled in one extra, untimed run: peak_alloc_bytes is the most memory
+    the sort had allocated at once (tracemalloc), alloc_blocks_retained the number of
+    its allocations still live at the end, and peak_rss_kb the high-water mark of the
+    process running the cell.
     
-    # Measure execution time
-    start_time = time.time()
+    Args:
+        options: Harness options (see benchmark_harness.DEFAULT_OPTIONS)
+    """
+    instrumented = measure(algorithm, dataset, options, instrumented=True)
+    uninstrumented = measure(algorithm, dataset, options)
+    memory = measure_memory(algorithm, dataset)
+    stats = instrumented['stats']
     
-    # Run the algorithm
-    if algo_name in ['Quick Sort', 'Heap Sort', 'Insertion Sort', 'Insertion Sort (Binary)']:
-        returned_stats = algorithm(data_copy, stats)
-        if returned_stats:
-            stats = returned_stats
-    else:  # Merge Sort returns a new array
-        algorithm(data_copy, stats)
+    execution_time = summarize(instrumented['samples_ns'])['median_ms']
+    fast = summarize(uninstrumented['samples_ns'])
+    fast_time = fast['median_ms']
     
-    # Calculate execution time
-    execution_time = (time.time() - start_time) * 1000  # Convert to milliseconds
+    # Instrumentation tax: extra time spent counting, relative to the fast path
+    if fast_time > 0:
+        instrumentation_tax = (execution_time - fast_time) / fast_time * 100
+    else:
+        instrumentation_tax = 0.0
     
     return {
         'algorithm': algo_name,
         'dataset': dataset_name,
         'size': len(dataset),
         'time_ms': execution_time,
+        'time_uninstrumented_ms': fast_time,
+        'time_uninstrumented_min_ms': fast['min_ms'],
+        'time_uninstrumented_p95_ms': fast['p95_ms'],
+        'time_uninstrumented_ci_low_ms': fast['median_ci_low_ms'],
+        'time_uninstrumented_ci_high_ms': fast['median_ci_high_ms'],
+        'time_uninstrumented_p95_ci_low_ms': fast['p95_ci_low_ms'],
+        'time_uninstrumented_p95_ci_high_ms': fast['p95_ci_high_ms'],
+        'repeats': fast['repeats'],
+        'instrumentation_tax_pct': instrumentation_tax,
         'comparisons': stats['comparisons'],
-        'swaps': stats['swaps']
+        'swaps': stats['swaps'],
+        'peak_alloc_bytes': memory['peak_alloc_bytes'],
+        'alloc_blocks_retained': memory['alloc_blocks_retained'],
+        'peak_rss_kb': peak_rss_kb(),
+        'verified': instrumented['verified'] and uninstrumented['verified']
     }
 
-def run_performance_tests():
-    """Run performance tests on all algorithms using all datasets."""
-    results = []
-    
-    # Define algorithms to test
+def benchmark_algorithms(backend='python'):
+    """Return the (function, name) pairs benchmarked by run_performance_tests()."""
     algorithms = [
         (quicksort, 'Quick Sort'),
+        (quicksort_three_way, 'Quick Sort (3-Way)'),
         (mergesort, 'Merge Sort'),
+        (mergesort_bottom_up, 'Merge Sort (Bottom-Up)'),
+        (timsort, 'Timsort (Adaptive)'),
         (heapsort, 'Heap Sort'),
+        (heapsort_bottom_up, 'Heap Sort (Bottom-Up)'),
+        (partial(heapsort_bottom_up, arity=4), 'Heap Sort (4-ary)'),
         (insertionsort, 'Insertion Sort'),
-        (insertionsort_with_binary_search, 'Insertion Sort (Binary)')
+        (insertionsort_with_binary_search, 'Insertion Sort (Binary)'),
+        (introsort, 'Introsort'),
+        (counting_sort, 'Counting Sort'),
+        (radix_sort, 'Radix Sort (LSD)'),
+        (integer_sort, 'Integer Sort (Auto)')
     ]
     
+    if backend == 'numpy':
+        algorithms = numpy_sorters() + [(buffer_sorter(func), name) for func, name in algorithms]
+    return algorithms
+
+def test_cell(backend, algo_index, dataset_file, options):
+    """
+    Benchmark one (algorithm, dataset) cell; runs in its own process under run_matrix().
+    
+    The algorithm is looked up by index and the dataset is loaded here, so neither has
+    to be pickled and sent to the process.
+    """
+    algo_func, algo_name = benchmark_algorithms(backend)[algo_index]
+    dataset = load_dataset(dataset_file, backend)
+    return test_algorithm(algo_func, dataset, algo_name, os.path.splitext(dataset_file)[0], options)
+
+def run_performance_tests(backend='python', options=None, jobs=1, cell_timeout=None):
+    """
+    Run performance tests on all algorithms using all datasets.
+    
+    With backend='numpy', datasets are loaded as int64 arrays, the vectorized NumPy
+    sorters are added, and the part2 sorters run on a memoryview of each array.
+    options are passed to the benchmark harness.
+    
+    Every (algorithm, dataset) cell runs in its own process, at most jobs at a time, and
+    is stopped after cell_timeout seconds. Rows are appended to the CSV as cells finish;
+    cells that time out or fail are kept in the CSV with their status and the same
+    algorithm, dataset and size columns as finished cells.
+    """
+    algorithms = benchmark_algorithms(backend)
+    
     # Get all dataset files
-    dataset_files = [f for f in os.listdir('datasets') if f.endswith('.json')]
+    dataset_files = list_datasets()
     
-    total_tests = len(algorithms) * len(dataset_files)
-    test_count = 0
+    # Cells that fail or time out keep these key columns, so they still match baselines
+    sizes = {dataset_file: dataset_size(dataset_file) for dataset_file in dataset_files}
     
-    # Run tests for each algorithm and dataset
-    for algo_func, algo_name in algorithms:
+    cells = []
+    for algo_index, (_, algo_name) in enumerate(algorithms):
         for dataset_file in dataset_files:
-            test_count += 1
-            dataset_name = dataset_file.replace('.json', '')
-            print(f"Running test {test_count}/{total_tests}: {algo_name} on {dataset_name}")
-            
-            try:
-                dataset = load_dataset(dataset_file)
-                result = test_algorithm(algo_func, dataset, algo_name, dataset_name)
-                results.append(result)
-            except Exception as e:
-                print(f"Error testing {algo_name} on {dataset_name}: {e}")
-    
-    # Convert results to a DataFrame
-    df = pd.DataFrame(results)
+            row = {'algorithm': algo_name, 'dataset': os.path.splitext(dataset_file)[0],
+                   'size': sizes[dataset_file]}
+            cells.append((row, (backend, algo_index, dataset_file, options)))
     
-    # Save results to CSV
+    print(f"Running {len(cells)} tests, {jobs} at a time")
     # (modified on Mar 24) df.to_csv('results/performance_results.csv', index=False)
-    df.to_csv(os.path.join(results_dir, 'performance_results.csv'), index=False)
+    rows = run_matrix(cells, test_cell, RESULT_COLUMNS,
+                      os.path.join(results_dir, 'performance_results.csv'), jobs, cell_timeout)
+    
+    for row in rows:
+        if row['status'] != 'ok':
+            print(f"Error testing {row['algorithm']} on {row['dataset']}: {row['error']}")
+    results = [row for row in rows if row['status'] == 'ok']
+    
+    # Convert results to a DataFrame (the CSV has already been written)
+    df = pd.DataFrame(results)
     
     # Print summary table
     summary = df.groupby(['algorithm', 'dataset']).agg({
         'time_ms': 'mean',
+        'time_uninstrumented_ms': 'mean',
+        'instrumentation_tax_pct': 'mean',
         'comparisons': 'mean',
-        'swaps': 'mean'
+        'swaps': 'mean',
+        'peak_alloc_bytes': 'mean'
     }).reset_index()
     
     print("\nPerformance Summary:")
@@ -182,11 +326,807 @@ def generate_charts(results_df):
     plt.tight_layout()
     # (modified on Mar 24) plt.savefig('results/size_vs_time.png')
     plt.savefig(os.path.join(results_dir, 'size_vs_time.png'))
+    
+    # Peak memory allocated by the sort across sizes, over all sizes in the results
+    plt.figure(figsize=(12, 6))
+    size_memory = results_df.groupby(['algorithm', 'size']).agg({'peak_alloc_bytes': 'max'}).reset_index()
+    
+    for algo in size_memory['algorithm'].unique():
+        algo_df = size_memory[size_memory['algorithm'] == algo]
+        plt.plot(algo_df['size'], algo_df['peak_alloc_bytes'] / 1024, marker='o', label=algo)
+    
+    plt.xscale('log')
+    # In-place sorts allocate little or nothing, which a plain log scale cannot show
+    plt.yscale('symlog', linthresh=1)
+    plt.xlabel('Dataset Size (log scale)')
+    plt.ylabel('Peak Allocated Memory (KiB)')
+    plt.title('Peak Memory Allocated by the Sort vs Dataset Size')
+    plt.legend()
+    plt.grid(True)
+    plt.tight_layout()
+    plt.savefig(os.path.join(results_dir, 'size_vs_memory.png'))
+
+def run_scaling_tests(size=1000000, worker_counts=None):
+    """
+    Measure how parallel_mergesort() speeds up as worker processes are added.
+    
+    Speedup is relative to the single-worker run, which is the sequential sort.
+    """
+    if worker_counts is None:
+        cpu_count = os.cpu_count() or 1
+        worker_counts = [1]
+        while worker_counts[-1] * 2 <= cpu_count:
+            worker_counts.append(worker_counts[-1] * 2)
+    
+    dataset = [random.randint(-10000, 10000) for _ in range(size)]
+    results = []
+    
+    for workers in worker_counts:
+        print(f"Running scaling test: Parallel Merge Sort, size {size}, {workers} worker(s)")
+        data_copy = dataset.copy()
+        start_time = time.perf_counter_ns()
+        parallel_mergesort(data_copy, workers=workers)
+        execution_time = (time.perf_counter_ns() - start_time) / 1e6  # Convert to milliseconds
+        results.append({'workers': workers, 'size': size, 'time_ms': execution_time})
+    
+    df = pd.DataFrame(results)
+    df['speedup'] = df['time_ms'].iloc[0] / df['time_ms']
+    df.to_csv(os.path.join(results_dir, 'scaling_results.csv'), index=False)
+    
+    print("\nScaling Summary:")
+    print(tabulate(df, headers='keys', tablefmt='grid'))
+    
+    return df
+
+def generate_scaling_chart(scaling_df):
+    """Plot speedup against the number of workers, with ideal linear speedup for reference."""
+    plt.figure(figsize=(8, 6))
+    plt.plot(scaling_df['workers'], scaling_df['speedup'], marker='o', label='Parallel Merge Sort')
+    plt.plot(scaling_df['workers'], scaling_df['workers'], linestyle='--', color='gray', label='Ideal (linear)')
+    plt.xscale('log', base=2)
+    plt.xlabel('Workers (log2 scale)')
+    plt.ylabel('Speedup vs 1 worker')
+    plt.title(f"Parallel Merge Sort Speedup (n = {scaling_df['size'].iloc[0]})")
+    plt.legend()
+    plt.grid(True)
+    plt.tight_layout()
+    plt.savefig(os.path.join(results_dir, 'speedup_vs_workers.png'))
+
+def run_parallel_strategy_tests(size=1000000, workers=None):
+    """
+    Compare the two parallel strategies on random, duplicate and skewed-duplicate data.
+    
+    The skewed dataset follows a Zipf distribution, so a few keys dominate and naive
+    splitter selection would produce badly unbalanced buckets.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    
+    datasets = [
+        ('random', generate_random_array(size, -10 * size, 10 * size)),
+        ('duplicates', generate_array_with_duplicates(size)),
+        ('skewed_duplicates', generate_skewed_duplicates_array(size)),
+    ]
+    algorithms = [
+        (parallel_mergesort, 'Parallel Merge Sort'),
+        (parallel_samplesort, 'Parallel Sample Sort'),
+    ]
+    results = []
+    
+    for dataset_name, dataset in datasets:
+        for algo_func, algo_name in algorithms:
+            print(f"Running parallel test: {algo_name} on {dataset_name}_{size} with {workers} worker(s)")
+            data_copy = dataset.copy()
+            start_time = time.perf_counter_ns()
+            algo_func(data_copy, workers=workers)
+            execution_time = (time.perf_counter_ns() - start_time) / 1e6  # Convert to milliseconds
+            results.append({
+                'algorithm': algo_name,
+                'dataset': dataset_name,
+                'size': size,
+                'workers': workers,
+                'time_ms': execution_time
+            })
+    
+    df = pd.DataFrame(results)
+    df.to_csv(os.path.join(results_dir, 'parallel_strategy_results.csv'), index=False)
+    
+    print("\nParallel Strategy Summary:")
+    print(tabulate(df, headers='keys', tablefmt='grid'))
+    
+    time_pivot = df.pivot(index='dataset', columns='algorithm', values='time_ms')
+    ax = time_pivot.plot(kind='bar', figsize=(10, 6),
+                         title=f'Parallel Strategies, n = {size}, {workers} worker(s)')
+    ax.set_ylabel('Time (ms)')
+    ax.set_xlabel('Dataset')
+    plt.tight_layout()
+    plt.savefig(os.path.join(results_dir, 'parallel_strategies.png'))
+    
+    return df
+
+def run_external_sort_benchmark(memory_budget=16 * 1024 * 1024, budget_multiple=10):
+    """
+    Benchmark external_sort() on a packed int64 file budget_multiple times the memory budget.
+    
+    The input is generated block by block as headerless packed integers. Peak traced
+    memory shows that the sort stays within (a small multiple of) the budget. The output
+    is a binary dataset; it is read back with load_binary_dataset(), which checks its
+    header, after the sort has been measured.
+    """
+    element_count = memory_budget * budget_multiple // array('q').itemsize
+    block_size = 1000000
+    
+    with tempfile.TemporaryDirectory(prefix='external_sort_benchmark_') as work_dir:
+        input_path = os.path.join(work_dir, 'input.bin')
+        output_path = os.path.join(work_dir, 'output.bin')
+        
+        print(f"Generating {element_count} integers ({budget_multiple}x the {memory_budget} byte budget)...")
+        with open(input_path, 'wb') as f:
+            remaining = element_count
+            while remaining:
+                count = min(block_size, remaining)
+                array('q', (random.randint(-10 ** 9, 10 ** 9) for _ in range(count))).tofile(f)
+                remaining -= count
+        
+        print("Running external sort...")
+        stats = {'comparisons': 0, 'swaps': 0}
+        tracemalloc.start()
+        start_time = time.perf_counter_ns()
+        external_sort(input_path, output_path, memory_budget=memory_budget, stats=stats)
+        execution_time = (time.perf_counter_ns() - start_time) / 1e6  # Convert to milliseconds
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        
+        # Read the output back as a binary dataset to check it is sorted
+        output = load_binary_dataset(output_path)
+        output_sorted = is_sorted(output)
+        count = len(output)
+        del output
+    
+    result = {
+        'elements': element_count,
+        'input_bytes': element_count * array('q').itemsize,
+        'memory_budget': memory_budget,
+        'peak_traced_bytes': peak_bytes,
+        'runs': stats['runs'],
+        'merge_passes': stats['merge_passes'],
+        'time_ms': execution_time,
+        'sorted': output_sorted and count == element_count
+    }
+    df = pd.DataFrame([result])
+    df.to_csv(os.path.join(results_dir, 'external_sort_results.csv'), index=False)
+    
+    print("\nExternal Sort Summary:")
+    print(tabulate(df, headers='keys', tablefmt='grid'))
+    
+    return df
+
+def run_integer_sort_crossover(sizes=None, value_ranges=None):
+    """
+    Time the integer sorts against Quick Sort and Merge Sort across sizes and key ranges.
+    
+    The value ranges match the generators in data/generate_datasets.py, plus a wide
+    32-bit range where Counting Sort is no longer viable.
+    """
+    if sizes is None:
+        sizes = [100, 300, 1000, 3000, 10000, 30000, 100000]
+    if value_ranges is None:
+        value_ranges = [(-1000, 1000), (-10000, 10000), (-2 ** 31, 2 ** 31 - 1)]
+    
+    algorithms = [
+        (counting_sort, 'Counting Sort'),
+        (radix_sort, 'Radix Sort (LSD)'),
+        (integer_sort, 'Integer Sort (Auto)'),
+        (quicksort, 'Quick Sort'),
+        (mergesort, 'Merge Sort'),
+    ]
+    results = []
+    
+    for low, high in value_ranges:
+        for size in sizes:
+            dataset = [random.randint(low, high) for _ in range(size)]
+            for algo_func, algo_name in algorithms:
+                # Counting Sort hands ranges this wide to Radix Sort
+                if algo_func is counting_sort and high - low + 1 > COUNTING_MAX_RANGE_FACTOR * size:
+                    continue
+                data_copy = dataset.copy()
+                start_time = time.perf_counter_ns()
+                algo_func(data_copy)
+                execution_time = (time.perf_counter_ns() - start_time) / 1e6  # Convert to milliseconds
+                results.append({
+                    'algorithm': algo_name,
+                    'value_range': f'[{low}, {high}]',
+                    'size': size,
+                    'time_ms': execution_time
+                })
+    
+    df = pd.DataFrame(results)
+    df.to_csv(os.path.join(results_dir, 'integer_sort_crossover.csv'), index=False)
+    
+    # One panel per value range: time vs size, the crossover is where the lines meet
+    ranges = df['value_range'].unique()
+    fig, axes = plt.subplots(1, len(ranges), figsize=(6 * len(ranges), 5), squeeze=False)
+    for ax, value_range in zip(axes[0], ranges):
+        range_df = df[df['value_range'] == value_range]
+        for algo in range_df['algorithm'].unique():
+            algo_df = range_df[range_df['algorithm'] == algo]
+            ax.plot(algo_df['size'], algo_df['time_ms'], marker='o', label=algo)
+        ax.set_xscale('log')
+        ax.set_yscale('log')
+        ax.set_xlabel('Dataset Size (log scale)')
+        ax.set_ylabel('Time (ms) (log scale)')
+        ax.set_title(f'Values in {value_range}')
+        ax.grid(True)
+        ax.legend()
+    plt.tight_layout()
+    plt.savefig(os.path.join(results_dir, 'integer_sort_crossover.png'))
+    
+    return df
+
+def run_backend_comparison(size=1000000, kinds=None):
+    """
+    Compare NumPy kernels with part2 sorters on large int64 arrays, generated with NumPy.
+    
+    Only the O(n log n) and linear-time part2 sorters are included at this size. They
+    run on a memoryview of the array, so the data never becomes a Python list.
+    """
+    if kinds is None:
+        kinds = ['random', 'nearly_sorted', 'reverse_sorted', 'duplicates', 'constant']
+    
+    algorithms = numpy_sorters() + [
+        (buffer_sorter(introsort), 'Introsort (buffer)'),
+        (buffer_sorter(timsort), 'Timsort (buffer)'),
+        (buffer_sorter(integer_sort), 'Integer Sort (buffer)'),
+    ]
+    results = []
+    
+    for kind in kinds:
+        dataset = generate_dataset_array(kind, size, seed=0)
+        for algo_func, algo_name in algorithms:
+            print(f"Running backend comparison: {algo_name} on {kind}_{size}")
+            data_copy = dataset.copy()
+            start_time = time.perf_counter_ns()
+            algo_func(data_copy)
+            execution_time = (time.perf_counter_ns() - start_time) / 1e6  # Convert to milliseconds
+            results.append({
+                'algorithm': algo_name,
+                'dataset': kind,
+                'size': size,
+                'time_ms': execution_time,
+                'verified': verify_sorted(data_copy)
+            })
+    
+    df = pd.DataFrame(results)
+    df.to_csv(os.path.join(results_dir, 'backend_comparison.csv'), index=False)
+    
+    print("\nBackend Comparison Summary:")
+    print(tabulate(df, headers='keys', tablefmt='grid'))
+    
+    return df
+
+def run_selection_benchmarks(size=100000, ks=None, options=None):
+    """
+    Compare nth_element(), partial_sort() and top_k() with a full Introsort.
+    
+    Each operation is timed with the benchmark harness and counted once with stats;
+    speedup is relative to fully sorting the same data.
+    """
+    if ks is None:
+        ks = [1, 10, 100, 1000, size // 2]
+    dataset = generate_random_array(size, -10 ** 9, 10 ** 9)
+    
+    def time_and_count(algorithm):
+        timing = summarize(measure(algorithm, dataset, options)['samples_ns'])
+        stats = {'comparisons': 0, 'swaps': 0}
+        algorithm(dataset.copy(), stats=stats)
+        return timing['median_ms'], stats['comparisons']
+    
+    full_time, full_comparisons = time_and_count(introsort)
+    results = [{'operation': 'Full sort (Introsort)', 'k': size, 'size': size,
+                'time_ms': full_time, 'comparisons': full_comparisons, 'speedup': 1.0}]
+    
+    for k in ks:
+        operations = [
+            (partial(nth_element, k=k - 1), 'nth_element'),
+            (partial(partial_sort, k=k), 'partial_sort'),
+            (partial(top_k, k=k), 'top_k (heap)')
+        ]
+        for algorithm, name in operations:
+            print(f"Running selection benchmark: {name}, k = {k}, size {size}")
+            execution_time, comparisons = time_and_count(algorithm)
+            results.append({'operation': name, 'k': k, 'size': size, 'time_ms': execution_time,
+                            'comparisons': comparisons, 'speedup': full_time / execution_time})
+    
+    df = pd.DataFrame(results)
+    df.to_csv(os.path.join(results_dir, 'selection_results.csv'), index=False)
+    
+    print("\nSelection Summary:")
+    print(tabulate(df, headers='keys', tablefmt='grid'))
+    
+    return df
+
+def run_key_sort_benchmarks(size=100000, options=None):
+    """
+    Measure what sorting records by a key costs compared with sorting plain ints.
+    
+    Records are ticket dictionaries like those of Lab 7. Decorate-sort-undecorate
+    (key=) is compared with a wrapper that calls the key inside every comparison, and
+    the time spent computing keys alone is reported so it can be set against the time
+    spent comparing. key_calls counts calls to the key function.
+    """
+    rng = random.Random(0)
+    events = ['Concert', 'Sports', 'Theater', 'Comedy', 'Festival']
+    tickets = [{'ticket_id': f"T{i:07d}", 'event': rng.choice(events),
+                'priority': rng.randint(1, 1000)} for i in range(size)]
+    priorities = [ticket['priority'] for ticket in tickets]
+    
+    key_calls = [0]
+    
+    def counting_priority(ticket):
+        key_calls[0] += 1
+        return ticket['priority']
+    
+    class KeyPerComparison:
+        """Wrapper whose comparisons call the key function on both sides."""
+        __slots__ = ('ticket',)
+        
+        def __init__(self, ticket):
+            self.ticket = ticket
+        
+        def __lt__(self, other):
+            return counting_priority(self.ticket) < counting_priority(other.ticket)
+        
+        def __le__(self, other):
+            return counting_priority(self.ticket) <= counting_priority(other.ticket)
+        
+        def __gt__(self, other):
+            return counting_priority(self.ticket) > counting_priority(other.ticket)
+        
+        def __ge__(self, other):
+            return counting_priority(self.ticket) >= counting_priority(other.ticket)
+    
+    wrapped = [KeyPerComparison(ticket) for ticket in tickets]
+    
+    def extract_keys(arr, stats=None):
+        return [counting_priority(ticket) for ticket in arr]
+    
+    cases = [
+        ('Plain ints', introsort, priorities),
+        ('Key extraction only', extract_keys, tickets),
+        ('key= (decorate-sort-undecorate)', partial(introsort, key=counting_priority), tickets),
+        ('key= and reverse=', partial(introsort, key=counting_priority, reverse=True), tickets),
+        ('Key per comparison (wrapper)', introsort, wrapped),
+        ('Multi-key (event, priority desc)',
+         partial(multi_key_sort, keys=[itemgetter('event'), (counting_priority, True)]), tickets),
+    ]
+    # Timed here rather than with measure(), which verifies by comparing elements and
+    # cannot compare ticket dictionaries
+    repeats = dict(DEFAULT_OPTIONS, **(options or {}))['repeats']
+    results = []
+    
+    for name, algorithm, dataset in cases:
+        print(f"Running key sort benchmark: {name}, size {size}")
+        samples = []
+        for _ in range(repeats):
+            data_copy = dataset.copy()
+            start_time = time.perf_counter_ns()
+            algorithm(data_copy)
+            samples.append(time.perf_counter_ns() - start_time)
+        timing = summarize(samples)
+        stats = {'comparisons': 0, 'swaps': 0}
+        key_calls[0] = 0
+        algorithm(dataset.copy(), stats=stats)
+        results.append({'case': name, 'size': size, 'time_ms': timing['median_ms'],
+                        'comparisons': stats['comparisons'], 'key_calls': key_calls[0]})
+    
+    base_time = results[0]['time_ms']
+    for row in results:
+        row['relative_to_ints'] = row['time_ms'] / base_time
+    
+    df = pd.DataFrame(results)
+    df.to_csv(os.path.join(results_dir, 'key_sort_results.csv'), index=False)
+    
+    print("\nKey Sort Summary:")
+    print(tabulate(df, headers='keys', tablefmt='grid'))
+    
+    return df
+
+def run_auto_sort_benchmarks(size=100000, options=None):
+    """
+    Compare auto_sort() with every fixed algorithm it can choose, on each dataset family.
+    
+    slowdown is auto_sort()'s median time over the fastest fixed choice's; the auto_sort
+    rows also show the chosen algorithm and the time spent profiling the input.
+    """
+    families = {
+        'random': generate_random_array(size),
+        'random_wide': generate_random_array(size, -10 ** 12, 10 ** 12),
+        'nearly_sorted': generate_nearly_sorted_array(size),
+        'nearly_sorted_1pct': generate_nearly_sorted_array(size, 1),
+        'sorted': list(range(size)),
+        'reverse_sorted': generate_reverse_sorted_array(size),
+        'duplicates': generate_array_with_duplicates(size, 1),
+        'skewed_duplicates': generate_skewed_duplicates_array(size),
+        'constant': generate_constant_array(size),
+        'floats': [random.random() for _ in range(size)],
+        'strings': [f"{random.random():.12f}" for _ in range(size)],
+    }
+    fixed = [(timsort, 'Timsort'), (introsort, 'Introsort'),
+             (quicksort_three_way, 'Quick Sort (3-way)'), (heapsort, 'Heap Sort'),
+             (integer_sort, 'Integer Sort')]
+    results = []
+    
+    for family, dataset in families.items():
+        times = {}
+        for algo_func, algo_name in fixed:
+            if algo_func is integer_sort and not all_integers(dataset):
+                continue
+            print(f"Running auto sort benchmark: {algo_name} on {family}_{size}")
+            times[algo_name] = summarize(measure(algo_func, dataset, options)['samples_ns'])['median_ms']
+        best_name = min(times, key=times.get)
+        
+        print(f"Running auto sort benchmark: auto_sort on {family}_{size}")
+        auto_time = summarize(measure(auto_sort, dataset, options)['samples_ns'])['median_ms']
+        stats = auto_sort(dataset.copy(), {'comparisons': 0, 'swaps': 0})
+        
+        for algo_name, execution_time in times.items():
+            results.append({'dataset': family, 'size': size, 'algorithm': algo_name,
+                            'time_ms': execution_time, 'chosen': '', 'profile_ms': '',
+                            'slowdown': execution_time / times[best_name]})
+        results.append({'dataset': family, 'size': size, 'algorithm': 'auto_sort',
+                        'time_ms': auto_time, 'chosen': stats['algorithm'],
+                        'profile_ms': stats['profile_ns'] / 1e6,
+                        'slowdown': auto_time / times[best_name]})
+    
+    df = pd.DataFrame(results)
+    df.to_csv(os.path.join(results_dir, 'auto_sort_results.csv'), index=False)
+    
+    print("\nAuto Sort Summary (slowdown relative to the fastest fixed choice):")
+    print(tabulate(df[df['algorithm'] == 'auto_sort'], headers='keys', tablefmt='grid'))
+    
+    return df
+
+def run_heapsort_comparison(options=None):
+    """
+    Compare the leaf-descent Heap Sort variants with the textbook Heap Sort.
+    
+    Every dataset in datasets/ is sorted by each variant; counts come from one
+    instrumented run and times from the benchmark harness. 'swaps' holds swaps for
+    heapsort() but single-element moves for the bottom-up variants. The ratio columns
+    are relative to the textbook heapsort() on the same dataset.
+    """
+    variants = [
+        (heapsort, 'Heap Sort'),
+        (heapsort_bottom_up, 'Heap Sort (Bottom-Up)'),
+        (partial(heapsort_bottom_up, arity=4), 'Heap Sort (4-ary)'),
+    ]
+    results = []
+    
+    for dataset_file in list_datasets():
+        dataset = load_dataset(dataset_file)
+        dataset_name = os.path.splitext(dataset_file)[0]
+        baseline = None
+        for algo_func, algo_name in variants:
+            print(f"Running heapsort comparison: {algo_name} on {dataset_name}")
+            measurement = measure(algo_func, dataset, options, instrumented=True)
+            stats = measurement['stats']
+            row = {
+                'algorithm': algo_name,
+                'dataset': dataset_name,
+                'size': len(dataset),
+                'time_ms': summarize(measure(algo_func, dataset, options)['samples_ns'])['median_ms'],
+                'comparisons': stats['comparisons'],
+                'swaps': stats['swaps'],
+                'verified': measurement['verified']
+            }
+            if baseline is None:
+                baseline = row
+            row['comparison_ratio'] = row['comparisons'] / baseline['comparisons'] if baseline['comparisons'] else 1.0
+            row['time_ratio'] = row['time_ms'] / baseline['time_ms'] if baseline['time_ms'] else 1.0
+            results.append(row)
+    
+    df = pd.DataFrame(results)
+    df.to_csv(os.path.join(results_dir, 'heapsort_results.csv'), index=False)
+    
+    print("\nHeap Sort Variants Summary:")
+    print(tabulate(df, headers='keys', tablefmt='grid'))
+    
+    return df
+
+def run_kmerge_benchmarks(total=200000, ks=None):
+    """
+    Compare the lazy loser-tree kmerge() with repeated pairwise merge() as k grows.
+    
+    total elements are split into k sorted shards. The streaming methods are consumed
+    element by element (or chunk by chunk) without keeping the output; the pairwise
+    methods build the merged list, either in a balanced tree of merges or by folding
+    the shards in one at a time. peak_alloc_bytes is the tracemalloc peak while merging,
+    which shows the O(k) memory of the streaming methods.
+    """
+    if ks is None:
+        ks = [2, 4, 8, 16, 64, 256]
+    
+    def balanced_pairwise(shards, merge_two):
+        while len(shards) > 1:
+            merged = [merge_two(shards[i], shards[i + 1]) for i in range(0, len(shards) - 1, 2)]
+            if len(shards) % 2:
+                merged.append(shards[-1])
+            shards = merged
+        return shards[0]
+    
+    def sequential_pairwise(shards, merge_two):
+        result = shards[0]
+        for shard in shards[1:]:
+            result = merge_two(result, shard)
+        return result
+    
+    def drain(stream):
+        for _ in stream:
+            pass
+    
+    methods = [
+        ('kmerge (loser tree)', lambda shards, stats: drain(kmerge(*shards, stats=stats))),
+        ('kmerge_chunks', lambda shards, stats: drain(kmerge_chunks(*shards, stats=stats))),
+        ('heapq.merge', lambda shards, stats: drain(heapq.merge(*shards))),
+        ('pairwise merge() (balanced)', lambda shards, stats: balanced_pairwise(
+            shards, merge_fast if stats is None else partial(merge, stats=stats))),
+        ('pairwise merge() (sequential)', lambda shards, stats: sequential_pairwise(
+            shards, merge_fast if stats is None else partial(merge, stats=stats))),
+    ]
+    results = []
+    
+    for k in ks:
+        shards = [sorted(generate_random_array(total // k, -10 ** 9, 10 ** 9)) for _ in range(k)]
+        for method, run in methods:
+            print(f"Running k-way merge benchmark: {method}, k = {k}, {total} elements")
+            start_time = time.perf_counter_ns()
+            run(shards, None)
+            execution_time = (time.perf_counter_ns() - start_time) / 1e6  # Convert to milliseconds
+            
+            stats = {'comparisons': 0, 'swaps': 0}
+            tracemalloc.start()
+            run(shards, stats)
+            _, peak_bytes = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            
+            results.append({
+                'method': method,
+                'k': k,
+                'elements': total // k * k,
+                'time_ms': execution_time,
+                # heapq.merge() cannot count its comparisons
+                'comparisons': stats['comparisons'] if method != 'heapq.merge' else None,
+                'peak_alloc_bytes': peak_bytes
+            })
+    
+    df = pd.DataFrame(results)
+    df.to_csv(os.path.join(results_dir, 'kmerge_results.csv'), index=False)
+    
+    print("\nK-Way Merge Summary:")
+    print(tabulate(df, headers='keys', tablefmt='grid'))
+    
+    return df
+
+def run_quicksort_stack_benchmarks(sizes=None, adversarial_sizes=None, options=None):
+    """
+    Compare the iterative, explicit-stack quicksort_iterative() with the recursive quicksort().
+    
+    Both partition identically, so comparisons and swaps match and the time difference
+    is the cost of Python call frames. Random inputs show the saving at normal depth;
+    sorted inputs make the recursive version n levels deep, past the recursion limit
+    once n is large enough, while the iterative stack stays at one entry.
+    """
+    if sizes is None:
+        sizes = [1000, 10000, 100000]
+    if adversarial_sizes is None:
+        adversarial_sizes = [500, 2000]
+    
+    cases = [('random', generate_random_array(size, -10 ** 9, 10 ** 9)) for size in sizes]
+    cases += [('sorted', list(range(size))) for size in adversarial_sizes]
+    variants = [(quicksort, 'Quick Sort (recursive)'), (quicksort_iterative, 'Quick Sort (iterative)')]
+    results = []
+    
+    for dataset_name, dataset in cases:
+        for algo_func, algo_name in variants:
+            print(f"Running quicksort stack benchmark: {algo_name} on {dataset_name}_{len(dataset)}")
+            row = {'algorithm': algo_name, 'dataset': dataset_name, 'size': len(dataset)}
+            try:
+                stats = algo_func(dataset.copy(), stats={'comparisons': 0, 'swaps': 0})
+                timing = summarize(measure(algo_func, dataset, options)['samples_ns'])
+            except RecursionError:
+                row['status'] = 'RecursionError'
+                results.append(row)
+                continue
+            row.update(time_ms=timing['median_ms'], time_ci_low_ms=timing['median_ci_low_ms'],
+                       time_ci_high_ms=timing['median_ci_high_ms'], comparisons=stats['comparisons'],
+                       max_stack_depth=stats.get('max_stack_depth'), status='ok')
+            results.append(row)
+    
+    df = pd.DataFrame(results)
+    df.to_csv(os.path.join(results_dir, 'quicksort_stack_results.csv'), index=False)
+    
+    print("\nQuick Sort Stack Summary:")
+    print(tabulate(df, headers='keys', tablefmt='grid'))
+    
+    return df
+
+def run_insertion_block_move_benchmarks(sizes=None):
+    """
+    Measure binary Insertion Sort with block moves against the element-by-element variants.
+    
+    Every variant sorts the same random data at each size; the block-move variant is also
+    run on array('q') storage. Times are medians over enough runs to total about 20000
+    sorted elements per size, and speedup is relative to insertionsort_with_binary_search().
+    """
+    if sizes is None:
+        sizes = [16, 64, 256, 1024, 4096]
+    variants = [
+        (insertionsort, 'Insertion Sort', list),
+        (insertionsort_with_binary_search, 'Insertion Sort (Binary)', list),
+        (insertionsort_block_move, 'Insertion Sort (Block Move)', list),
+        (insertionsort_block_move, 'Insertion Sort (Block Move, array)', lambda data: array('q', data)),
+    ]
+    results = []
+    
+    for size in sizes:
+        dataset = generate_random_array(size, -10 ** 9, 10 ** 9)
+        runs = max(5, 20000 // size)
+        baseline = None
+        for algo_func, algo_name, storage in variants:
+            print(f"Running block move benchmark: {algo_name}, size {size}")
+            samples = []
+            for _ in range(runs):
+                data = storage(dataset)
+                start_time = time.perf_counter_ns()
+                algo_func(data)
+                samples.append(time.perf_counter_ns() - start_time)
+            execution_time = summarize(samples)['median_ms']
+            if algo_func is insertionsort_with_binary_search:
+                baseline = execution_time
+            results.append({'algorithm': algo_name, 'size': size, 'time_ms': execution_time,
+                            'verified': verify_sorted(data)})
+        for row in results[-len(variants):]:
+            row['speedup'] = baseline / row['time_ms'] if row['time_ms'] else None
+    
+    df = pd.DataFrame(results)
+    df.to_csv(os.path.join(results_dir, 'insertion_block_move_results.csv'), index=False)
+    
+    print("\nInsertion Sort Block Move Summary:")
+    print(tabulate(df, headers='keys', tablefmt='grid'))
+    
+    return df
+
+def run_phase_profile(size=20000, options=None):
+    """
+    Profile the phases of each instrumented sorter and export them as a flame graph.
+    
+    Each sorter runs once on random data with a PhaseTracer attached. Per-phase
+    self and total times go to phase_profile_results.csv, the depth and partition
+    balance histograms to phase_profile_histograms.json, and the call stacks (rooted
+    at the algorithm name, self time in nanoseconds) to phase_profile.folded, which
+    flamegraph.pl, speedscope and inferno read directly. tracer_overhead compares the
+    traced run with the median instrumented run without a tracer.
+    """
+    algorithms = [
+        (quicksort, 'Quick Sort'),
+        (mergesort, 'Merge Sort'),
+        (heapsort, 'Heap Sort'),
+        (heapsort_bottom_up, 'Heap Sort (Bottom-Up)'),
+        (introsort, 'Introsort'),
+        (timsort, 'Timsort'),
+    ]
+    dataset = generate_random_array(size, 1, 1000000)
+    folded_path = os.path.join(results_dir, 'phase_profile.folded')
+    results = []
+    histograms = {}
+    
+    for index, (algo_func, algo_name) in enumerate(algorithms):
+        print(f"Running phase profile: {algo_name}, size {size}")
+        untraced_ms = summarize(measure(algo_func, dataset, options, instrumented=True)['samples_ns'])['median_ms']
+        
+        tracer = PhaseTracer()
+        data = dataset.copy()
+        start_time = time.perf_counter_ns()
+        result = algo_func(data, stats={'comparisons': 0, 'swaps': 0, 'tracer': tracer})
+        traced_ms = (time.perf_counter_ns() - start_time) / 1e6
+        sorted_data = result if isinstance(result, list) else data
+        
+        # Frames are rooted at the algorithm name so all profiles share one file
+        tracer.write_collapsed(folded_path, root=algo_name.replace(' ', '_'), append=index > 0)
+        summary = tracer.summary()
+        histograms[algo_name] = {
+            'depth_histogram': summary['depth_histogram'],
+            'balance_histogram': summary['balance_histogram'],
+        }
+        traced_total_ns = sum(phase['self_ns'] for phase in summary['phases'].values())
+        for phase_name, phase in summary['phases'].items():
+            results.append({
+                'algorithm': algo_name,
+                'phase': phase_name,
+                'calls': phase['calls'],
+                'self_ms': phase['self_ns'] / 1e6,
+                'total_ms': phase['total_ns'] / 1e6,
+                'self_share': phase['self_ns'] / traced_total_ns if traced_total_ns else None,
+                'max_depth': phase['max_depth'],
+                'mean_balance': summary['mean_balance'],
+                'tracer_overhead': traced_ms / untraced_ms if untraced_ms else None,
+                'verified': verify_sorted(sorted_data)
+            })
+    
+    with open(os.path.join(results_dir, 'phase_profile_histograms.json'), 'w') as f:
+        json.dump(histograms, f, indent=2)
+    
+    df = pd.DataFrame(results)
+    df.to_csv(os.path.join(results_dir, 'phase_profile_results.csv'), index=False)
+    
+    print("\nPhase Profile Summary:")
+    print(tabulate(df, headers='keys', tablefmt='grid'))
+    print(f"Collapsed stacks written to {folded_path}")
+    
+    return df
+
+def positive_int(text):
+    """Parse a command-line count that must be at least 1."""
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the sorting performance tests.")
+    parser.add_argument('--backend', choices=['python', 'numpy'], default='python',
+                        help="keep datasets as Python lists or as NumPy int64 arrays")
+    parser.add_argument('--warmup', type=int, default=DEFAULT_OPTIONS['warmup'],
+                        help="discarded runs before each measurement")
+    parser.add_argument('--repeats', type=int, default=DEFAULT_OPTIONS['repeats'],
+                        help="measured runs per algorithm and dataset")
+    parser.add_argument('--keep-gc', action='store_true',
+                        help="leave the garbage collector enabled during timed runs")
+    parser.add_argument('--pin-cpu', type=int, nargs='+', metavar='CPU',
+                        help="pin the benchmark to these CPU indices")
+    parser.add_argument('--subprocess', action='store_true',
+                        help="take every measurement in a freshly spawned interpreter")
+    parser.add_argument('--jobs', type=positive_int, default=1,
+                        help="benchmark cells run at once; keep 1 for comparable timings")
+    parser.add_argument('--cell-timeout', type=float, default=600,
+                        help="seconds before a benchmark cell is stopped (default: 600)")
+    args = parser.parse_args()
+    
+    if args.pin_cpu:
+        pin_cpu(args.pin_cpu)
+    options = {'warmup': args.warmup, 'repeats': args.repeats,
+               'disable_gc': not args.keep_gc, 'subprocess': args.subprocess}
+    
     print("Starting performance tests...")
-    results = run_performance_tests()
+    results = run_performance_tests(args.backend, options, args.jobs, args.cell_timeout)
     print("\nGenerating charts...")
     generate_charts(results)
+    print("\nStarting parallel scaling tests...")
+    scaling_results = run_scaling_tests()
+    generate_scaling_chart(scaling_results)
+    run_parallel_strategy_tests()
+    print("\nStarting external sort benchmark...")
+    run_external_sort_benchmark()
+    print("\nStarting integer sort crossover tests...")
+    run_integer_sort_crossover()
+    print("\nStarting selection benchmarks...")
+    run_selection_benchmarks(options=options)
+    print("\nStarting key sort benchmarks...")
+    run_key_sort_benchmarks(options=options)
+    print("\nStarting auto sort benchmarks...")
+    run_auto_sort_benchmarks(options=options)
+    print("\nStarting heapsort comparison...")
+    run_heapsort_comparison(options)
+    print("\nStarting k-way merge benchmarks...")
+    run_kmerge_benchmarks()
+    print("\nStarting quicksort stack benchmarks...")
+    run_quicksort_stack_benchmarks(options=options)
+    print("\nStarting insertion sort block move benchmarks...")
+    run_insertion_block_move_benchmarks()
+    print("\nStarting phase profile...")
+    run_phase_profile(options=options)
+    if args.backend == 'numpy':
+        print("\nStarting NumPy backend comparison...")
+        run_backend_comparison()
     # (modified on Mar 24) print("\nPerformance testing complete! Results saved to 'results' directory.")
     print(f"\nPerformance testing complete! Results saved to '{results_dir}' directory.")
\ No newline at end of file
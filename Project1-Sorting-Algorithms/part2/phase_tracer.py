@@ -0,0 +1,235 @@
+"""
+Per-phase profiling of the instrumented sorters.
+
+The stats dictionary only says how many comparisons and swaps a sort made, not where
+its time went. A PhaseTracer stored under stats['tracer'] is told by the sorters when
+they enter and leave each phase, and records:
+1. Time per phase, both per call stack (self time, for flame graphs) and per phase name
+   (self and total time, and number of calls)
+2. A histogram of the stack depth at which each phase was entered, which for the
+   recursive sorters is the recursion depth
+3. A histogram of partition balance: the smaller side of each partition divided by
+   the number of elements partitioned, from 0 (one side empty) to 0.5 (even split)
+
+The phases reported by each sorter:
+- quicksort: 'quicksort' (one frame per recursive call) and 'partition'
+- mergesort: 'mergesort' (one frame per recursive call), 'split' and 'merge'
+- heapsort, heapsort_bottom_up: 'build_heap' and 'extract'
+- introsort: 'introsort', 'pivot', 'partition', 'heapsort' (the depth-limit fallback)
+  and 'insertion' (the small-partition finisher)
+- timsort: 'timsort', 'find_run', 'insertion' and 'merge'
+
+Sorters look the tracer up once per call and only on their instrumented path, so
+nothing changes when stats is None, and a stats dictionary without a tracer costs one
+dictionary lookup per call. With a tracer attached, every enter()/exit() pair costs
+one to a few microseconds, which would be charged to the enclosing phase and make the
+recursive frames look far more expensive than they are. Like cProfile's bias, that cost
+is measured once by calibrate() and subtracted from the enclosing phase for every
+nested phase.
+
+collapsed_stacks() and write_collapsed() export the folded-stack format read by
+flamegraph.pl, speedscope and inferno: one "frame;frame;frame value" line per stack,
+with the self time in nanoseconds as the value.
+"""
+
+import time
+from collections import Counter
+
+# Partition balance is bucketed in steps of 0.5 / BALANCE_BUCKETS
+BALANCE_BUCKETS = 10
+
+# Nested enter()/exit() pairs timed by calibrate()
+CALIBRATION_ROUNDS = 2000
+
+# Calibration results per clock, so each clock is calibrated once per process
+calibrated_bias = {}
+
+
+class PhaseTracer:
+    """
+    Records time, depth and partition balance per sorting phase.
+    """
+
+    def __init__(self, clock=time.perf_counter_ns, bias_ns=None):
+        """
+        Args:
+            clock: Function returning the current time in nanoseconds
+            bias_ns: Cost of one enter()/exit() pair to charge to the tracer instead of
+                the enclosing phase (default: measured by calibrate(); 0 to disable)
+        """
+        self.clock = clock
+        self.bias_ns = calibrate(clock) if bias_ns is None else bias_ns
+
+        # Open phases: [collapsed stack, phase, start time, time spent in nested phases]
+        self.stack = []
+        # Number of open frames per phase, so recursive phases count their total once
+        self.active = Counter()
+
+        self.stack_ns = Counter()  # collapsed stack -> self time
+        self.self_ns = Counter()   # phase -> self time
+        self.total_ns = Counter()  # phase -> time including nested phases
+        self.calls = Counter()     # phase -> number of times entered
+        self.depths = {}           # phase -> Counter of stack depth when entered
+        self.balance = Counter()   # balance bucket -> number of partitions
+        self.partitioned = 0       # elements partitioned, for the weighted mean balance
+        self.balance_sum = 0.0
+
+    def enter(self, phase):
+        """
+        Start a phase, nested inside the phase currently open.
+
+        Args:
+            phase: Name of the phase
+        """
+        stack = self.stack
+        depths = self.depths.get(phase)
+        if depths is None:
+            depths = self.depths[phase] = Counter()
+        depths[len(stack)] += 1
+        self.calls[phase] += 1
+        self.active[phase] += 1
+        path = f"{stack[-1][0]};{phase}" if stack else phase
+        stack.append([path, phase, self.clock(), 0])
+
+    def exit(self):
+        """
+        End the phase most recently entered.
+        """
+        end = self.clock()
+        stack = self.stack
+        path, phase, start, nested_ns = stack.pop()
+        elapsed = end - start
+        own_ns = elapsed - nested_ns
+
+        self.stack_ns[path] += own_ns
+        self.self_ns[phase] += own_ns
+        self.active[phase] -= 1
+        if not self.active[phase]:
+            self.total_ns[phase] += elapsed
+        if stack:
+            stack[-1][3] += elapsed + self.bias_ns
+
+    def record_partition(self, left, right):
+        """
+        Record the sizes of the two sides of a partition.
+
+        Args:
+            left: Number of elements placed before the pivot
+            right: Number of elements placed after the pivot
+        """
+        size = left + right
+        if size == 0:
+            return
+        ratio = min(left, right) / size
+        self.balance[min(int(ratio * 2 * BALANCE_BUCKETS), BALANCE_BUCKETS - 1)] += 1
+        self.partitioned += size
+        self.balance_sum += ratio * size
+
+    def collapsed_stacks(self, root=None):
+        """
+        Return the self time of every call stack in the folded-stack format.
+
+        Args:
+            root: Frame to put at the bottom of every stack, for example the
+                algorithm name when several profiles share one file (optional)
+
+        Returns:
+            A list of "frame;frame value" lines, values in nanoseconds
+        """
+        prefix = f"{root};" if root is not None else ""
+        # Subtracting the bias can leave a stack slightly negative; flame graphs need
+        # positive counts, so those stacks are dropped
+        return [f"{prefix}{path} {ns}" for path, ns in sorted(self.stack_ns.items()) if ns > 0]
+
+    def write_collapsed(self, path, root=None, append=False):
+        """
+        Write collapsed_stacks() to a file.
+
+        Args:
+            path: Output file
+            root: Frame to put at the bottom of every stack (optional)
+            append: Add to the file instead of replacing it
+        """
+        with open(path, 'a' if append else 'w') as f:
+            for line in self.collapsed_stacks(root):
+                f.write(line + '\n')
+
+    def summary(self):
+        """
+        Summarize the recorded phases.
+
+        Returns:
+            A dictionary with:
+            - phases: phase -> {'calls', 'self_ns', 'total_ns', 'max_depth'}
+            - depth_histogram: phase -> {depth: number of times entered}
+            - balance_histogram: {lower bound of bucket: number of partitions}
+            - mean_balance: partition balance averaged over the elements partitioned,
+              so large partitions weigh more than small ones (None without partitions)
+        """
+        bucket_width = 0.5 / BALANCE_BUCKETS
+        return {
+            'phases': {
+                phase: {
+                    'calls': self.calls[phase],
+                    'self_ns': self.self_ns[phase],
+                    'total_ns': self.total_ns[phase],
+                    'max_depth': max(self.depths[phase]),
+                }
+                for phase in self.calls
+            },
+            'depth_histogram': {phase: dict(sorted(depths.items())) for phase, depths in self.depths.items()},
+            'balance_histogram': {round(bucket * bucket_width, 3): count
+                                  for bucket, count in sorted(self.balance.items())},
+            'mean_balance': self.balance_sum / self.partitioned if self.partitioned else None,
+        }
+
+
+def calibrate(clock=time.perf_counter_ns, rounds=CALIBRATION_ROUNDS):
+    """
+    Measure the cost of one enter()/exit() pair that ends up in the enclosing phase.
+
+    A scratch tracer times `rounds` empty nested phases inside one outer phase without
+    bias; whatever remains as the outer phase's self time is tracer cost. The smallest
+    of a few trials is kept, since interruptions only ever add time.
+
+    Args:
+        clock: The clock the tracer will use
+        rounds: Number of nested phases per trial
+
+    Returns:
+        The cost per pair in nanoseconds
+    """
+    if clock in calibrated_bias:
+        return calibrated_bias[clock]
+    trials = []
+    for _ in range(5):
+        tracer = PhaseTracer(clock, bias_ns=0)
+        tracer.enter('calibration')
+        for _ in range(rounds):
+            tracer.enter('empty')
+            tracer.exit()
+        tracer.exit()
+        trials.append(tracer.self_ns['calibration'] // rounds)
+    calibrated_bias[clock] = min(trials)
+    return calibrated_bias[clock]
+
+
+if __name__ == "__main__":
+    # Example usage: profile one Quick Sort and print its folded stacks
+    import os
+    import random
+    import sys
+
+    # Add the parent directory to the path so we can import the sorting modules
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from part2.quicksort import quicksort
+
+    tracer = PhaseTracer()
+    stats = {'comparisons': 0, 'swaps': 0, 'tracer': tracer}
+    quicksort(random.sample(range(10000), 2000), stats=stats)
+    for line in tracer.collapsed_stacks(root='quicksort')[:5]:
+        print(line)
+    summary = tracer.summary()
+    for phase, row in summary['phases'].items():
+        print(f"{phase}: {row}")
+    print(f"Mean partition balance: {summary['mean_balance']:.3f}")
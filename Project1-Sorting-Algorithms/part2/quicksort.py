@@ -2,9 +2,19 @@
 Implementation of Quick Sort algorithm.
 
 This module provides functions to perform the Quick Sort algorithm on lists of comparable elements.
+Every sorter runs in one of two modes: pass a stats dictionary to count comparisons and swaps,
+or leave stats as None to run a specialized loop with no counting at all.
 """
 
-def quicksort(arr, low=None, high=None, stats=None):
+import os
+import sys
+
+# Add the parent directory to the path so we can import the sorting modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from part2.key_sort import key_sort
+
+def quicksort(arr, low=None, high=None, stats=None, key=None, reverse=False):
     """
     Sort an array using the Quick Sort algorithm.
     
@@ -12,28 +22,51 @@ def quicksort(arr, low=None, high=None, stats=None):
         arr: The array to be sorted
         low: Starting index (default: 0)
         high: Ending index (default: len(arr)-1)
-        stats: Dictionary to track performance statistics (optional)
+        stats: Dictionary to track performance statistics (optional). A PhaseTracer
+            under 'tracer' receives the 'quicksort' and 'partition' phases.
+        key: Function computing the sort key of each element, called once
+            per element (optional)
+        reverse: Sort in descending order; equal keys keep their original order
         
     Returns:
-        None (the array is sorted in-place)
+        The stats dictionary, or None when stats is not provided
+        (the array is sorted in-place)
     """
-    # Initialize stats dictionary if not provided
-    if stats is None:
-        stats = {'comparisons': 0, 'swaps': 0}
-    
+    # Sort decorated keys instead of the elements (see part2/key_sort.py)
+    if key is not None or reverse:
+        return key_sort(arr, quicksort, key, reverse, stats, low, high)
+
     # Initialize low and high if not provided
     if low is None:
         low = 0
     if high is None:
         high = len(arr) - 1
     
+    # Without a stats dictionary, run the uninstrumented loop
+    if stats is None:
+        quicksort_fast(arr, low, high)
+        return None
+    
     if low < high:
+        # Report phases to a tracer when one is attached (see part2/phase_tracer.py)
+        tracer = stats.get('tracer')
+        if tracer is not None:
+            tracer.enter('quicksort')
+            tracer.enter('partition')
+        
         # Partition the array and get the pivot position
         pivot_position = partition(arr, low, high, stats)
         
+        if tracer is not None:
+            tracer.exit()
+            tracer.record_partition(pivot_position - low, high - pivot_position)
+        
         # Sort the sub-arrays independently
         quicksort(arr, low, pivot_position - 1, stats)
         quicksort(arr, pivot_position + 1, high, stats)
+        
+        if tracer is not None:
+            tracer.exit()
     
     return stats
 
@@ -70,12 +103,268 @@ def partition(arr, low, high, stats):
     return i + 1
 
 
+def quicksort_fast(arr, low, high):
+    """
+    Uninstrumented Quick Sort of arr[low..high] (no statistics are collected).
+    
+    Args:
+        arr: The array to be sorted
+        low: Starting index
+        high: Ending index
+        
+    Returns:
+        None (the array is sorted in-place)
+    """
+    if low < high:
+        pivot_position = partition_fast(arr, low, high)
+        quicksort_fast(arr, low, pivot_position - 1)
+        quicksort_fast(arr, pivot_position + 1, high)
+
+
+def partition_fast(arr, low, high):
+    """
+    Uninstrumented Lomuto partition; same result as partition().
+    
+    Args:
+        arr: The array to be partitioned
+        low: Starting index
+        high: Ending index
+        
+    Returns:
+        The position of the pivot element
+    """
+    pivot = arr[high]
+    i = low - 1
+    
+    for j in range(low, high):
+        if arr[j] <= pivot:
+            i += 1
+            arr[i], arr[j] = arr[j], arr[i]
+    
+    arr[i + 1], arr[high] = arr[high], arr[i + 1]
+    return i + 1
+
+
+def quicksort_iterative(arr, low=None, high=None, stats=None, key=None, reverse=False):
+    """
+    Sort an array using Quick Sort without recursion.
+
+    Same partitioning (and so the same comparisons and swaps) as quicksort(), but the
+    subarrays waiting to be sorted are kept on an explicit stack of (low, high) pairs
+    instead of in Python call frames. After each partition the larger side is pushed and
+    the loop carries on with the smaller side, so every pushed range is at most half of
+    the range below it: the stack never holds more than log2(n) entries, even on inputs
+    where quicksort() recurses n levels deep and exceeds the recursion limit.
+
+    Args:
+        arr: The array to be sorted
+        low: Starting index (default: 0)
+        high: Ending index (default: len(arr)-1)
+        stats: Dictionary to track performance statistics (optional). The largest
+            number of stacked ranges is recorded under 'max_stack_depth'.
+        key: Function computing the sort key of each element, called once
+            per element (optional)
+        reverse: Sort in descending order; equal keys keep their original order
+
+    Returns:
+        The stats dictionary, or None when stats is not provided
+        (the array is sorted in-place)
+    """
+    # Sort decorated keys instead of the elements (see part2/key_sort.py)
+    if key is not None or reverse:
+        return key_sort(arr, quicksort_iterative, key, reverse, stats, low, high)
+
+    # Initialize low and high if not provided
+    if low is None:
+        low = 0
+    if high is None:
+        high = len(arr) - 1
+
+    # Without a stats dictionary, run the uninstrumented loop
+    if stats is None:
+        quicksort_iterative_fast(arr, low, high)
+        return None
+
+    stack = []
+    max_depth = 0
+    while True:
+        while low < high:
+            pivot_position = partition(arr, low, high, stats)
+
+            # Defer the larger side (if it needs sorting) and continue with the smaller
+            if pivot_position - low < high - pivot_position:
+                if pivot_position + 1 < high:
+                    stack.append((pivot_position + 1, high))
+                high = pivot_position - 1
+            else:
+                if low < pivot_position - 1:
+                    stack.append((low, pivot_position - 1))
+                low = pivot_position + 1
+            if len(stack) > max_depth:
+                max_depth = len(stack)
+
+        if not stack:
+            break
+        low, high = stack.pop()
+
+    stats['max_stack_depth'] = max(stats.get('max_stack_depth', 0), max_depth)
+    return stats
+
+
+def quicksort_iterative_fast(arr, low, high):
+    """
+    Uninstrumented iterative Quick Sort of arr[low..high] (no statistics are collected).
+
+    Args:
+        arr: The array to be sorted
+        low: Starting index
+        high: Ending index
+
+    Returns:
+        None (the array is sorted in-place)
+    """
+    stack = []
+    push = stack.append
+    while True:
+        while low < high:
+            pivot_position = partition_fast(arr, low, high)
+            if pivot_position - low < high - pivot_position:
+                if pivot_position + 1 < high:
+                    push((pivot_position + 1, high))
+                high = pivot_position - 1
+            else:
+                if low < pivot_position - 1:
+                    push((low, pivot_position - 1))
+                low = pivot_position + 1
+
+        if not stack:
+            return
+        low, high = stack.pop()
+
+
+def quicksort_three_way(arr, low=None, high=None, stats=None, key=None, reverse=False):
+    """
+    Sort an array using Quick Sort with three-way (Dutch national flag) partitioning.
+
+    Keys equal to the pivot are gathered in the middle and never revisited, so
+    runs of equal keys are handled in linear time.
+
+    Args:
+        arr: The array to be sorted
+        low: Starting index (default: 0)
+        high: Ending index (default: len(arr)-1)
+        stats: Dictionary to track performance statistics (optional)
+        key: Function computing the sort key of each element, called once
+            per element (optional)
+        reverse: Sort in descending order; equal keys keep their original order
+
+    Returns:
+        The stats dictionary, or None when stats is not provided
+        (the array is sorted in-place)
+    """
+    # Sort decorated keys instead of the elements (see part2/key_sort.py)
+    if key is not None or reverse:
+        return key_sort(arr, quicksort_three_way, key, reverse, stats, low, high)
+
+    # Initialize low and high if not provided
+    if low is None:
+        low = 0
+    if high is None:
+        high = len(arr) - 1
+
+    while low < high:
+        if stats is None:
+            lt, gt = partition_three_way_fast(arr, low, high)
+        else:
+            lt, gt = partition_three_way(arr, low, high, stats)
+
+        # Recurse into the smaller side and loop on the larger one
+        if lt - low < high - gt:
+            quicksort_three_way(arr, low, lt - 1, stats)
+            low = gt + 1
+        else:
+            quicksort_three_way(arr, gt + 1, high, stats)
+            high = lt - 1
+
+    return stats
+
+
+def partition_three_way(arr, low, high, stats):
+    """
+    Partition the array into keys less than, equal to and greater than the pivot.
+
+    Args:
+        arr: The array to be partitioned
+        low: Starting index
+        high: Ending index
+        stats: Dictionary to track performance statistics
+
+    Returns:
+        A tuple (lt, gt) such that arr[lt..gt] holds every key equal to the pivot
+    """
+    # Select the middle element as pivot
+    pivot = arr[low + (high - low) // 2]
+    lt = low
+    i = low
+    gt = high
+
+    while i <= gt:
+        stats['comparisons'] += 1  # Count comparison
+        if arr[i] < pivot:
+            arr[lt], arr[i] = arr[i], arr[lt]
+            stats['swaps'] += 1  # Count swap
+            lt += 1
+            i += 1
+        else:
+            stats['comparisons'] += 1  # Count comparison
+            if arr[i] > pivot:
+                arr[i], arr[gt] = arr[gt], arr[i]
+                stats['swaps'] += 1  # Count swap
+                gt -= 1
+            else:
+                i += 1
+
+    return lt, gt
+
+
+def partition_three_way_fast(arr, low, high):
+    """
+    Uninstrumented three-way partition; same result as partition_three_way().
+
+    Args:
+        arr: The array to be partitioned
+        low: Starting index
+        high: Ending index
+
+    Returns:
+        A tuple (lt, gt) such that arr[lt..gt] holds every key equal to the pivot
+    """
+    pivot = arr[low + (high - low) // 2]
+    lt = low
+    i = low
+    gt = high
+
+    while i <= gt:
+        value = arr[i]
+        if value < pivot:
+            arr[lt], arr[i] = value, arr[lt]
+            lt += 1
+            i += 1
+        elif value > pivot:
+            arr[i], arr[gt] = arr[gt], value
+            gt -= 1
+        else:
+            i += 1
+
+    return lt, gt
+
+
 if __name__ == "__main__":
     # Example usage
     test_array = [10, 7, 8, 9, 1, 5]
     print(f"Original array: {test_array}")
     
-    stats = quicksort(test_array)
+    stats = quicksort(test_array, stats={'comparisons': 0, 'swaps': 0})
     print(f"Sorted array: {test_array}")
     print(f"Performance stats: {stats}")
     
@@ -83,5 +372,17 @@ if __name__ == "__main__":
     import random
     large_array = random.sample(range(1, 1001), 100)  # 100 random numbers
     print(f"\nSorting an array of {len(large_array)} random elements...")
-    stats = quicksort(large_array.copy())
-    print(f"Performance stats: {stats}")
\ No newline at end of file
+    stats = quicksort(large_array.copy(), stats={'comparisons': 0, 'swaps': 0})
+    print(f"Performance stats: {stats}")
+    
+    # The iterative version partitions identically but keeps a short explicit stack
+    sorted_array = list(range(2000))
+    stats = quicksort_iterative(sorted_array, stats={'comparisons': 0, 'swaps': 0})
+    print(f"\nIterative Quick Sort on {len(sorted_array)} sorted elements "
+          f"(deeper than the recursion limit): {stats}")
+    
+    # Compare with three-way partitioning on low-cardinality keys
+    duplicate_array = [random.choice([1, 2, 3]) for _ in range(100)]
+    print(f"\nSorting {len(duplicate_array)} elements drawn from 3 distinct keys...")
+    print(f"Lomuto partition stats: {quicksort(duplicate_array.copy(), stats={'comparisons': 0, 'swaps': 0})}")
+    print(f"Three-way partition stats: {quicksort_three_way(duplicate_array.copy(), stats={'comparisons': 0, 'swaps': 0})}")
\ No newline at end of file
@@ -0,0 +1,358 @@
+"""
+Implementation of non-comparison sorts for integer keys.
+
+This module provides:
+1. Counting Sort, for keys drawn from a small range
+2. LSD Radix Sort, one byte (8 bits) per pass, for integers of any size and sign
+3. integer_sort(), which inspects min, max and n and picks the cheapest method
+
+Neither sort compares elements with each other, so 'comparisons' only counts the
+min/max scan used to size the count arrays. 'swaps' counts element writes.
+
+Counting Sort and Radix Sort raise TypeError for keys that are not ints; integer_sort()
+sorts such input with Introsort instead, whatever its size.
+"""
+
+import math
+import os
+import sys
+
+# Add the parent directory to the path so we can import the sorting modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from array import array
+
+from part2.array_utils import assign_slice
+from part2.introsort import introsort
+from part2.key_sort import key_sort, decorate, undecorate
+
+# Bits consumed per radix pass, and the matching number of buckets
+RADIX_BITS = 8
+RADIX = 1 << RADIX_BITS
+
+# Counting sort is used while the key range is at most this many times n
+COUNTING_RANGE_FACTOR = 4
+
+# counting_sort() hands wider key ranges to Radix Sort instead of allocating a counter
+# per possible key (ranges up to RADIX are always counted: one radix pass needs as many)
+COUNTING_MAX_RANGE_FACTOR = 100
+
+# Approximate cost of one radix pass, in comparison-sort "levels" of n comparisons
+RADIX_PASS_COST = 2
+
+# Inputs this small go straight to a comparison sort
+SMALL_INPUT = 64
+
+# array.array typecodes (and memoryview formats) that can only hold integers
+INTEGER_TYPECODES = 'bBhHiIlLqQ'
+
+
+def all_integers(arr):
+    """Return whether every element of arr is an int (bool excluded)."""
+    if isinstance(arr, array):
+        return arr.typecode in INTEGER_TYPECODES
+    if isinstance(arr, memoryview):
+        return arr.format in INTEGER_TYPECODES
+    dtype = getattr(arr, 'dtype', None)
+    if dtype is not None:
+        # NumPy arrays
+        return dtype.kind in 'iu'
+    return set(map(type, arr)) <= {int}
+
+
+def check_integers(arr, algorithm):
+    """
+    Raise TypeError unless every element of arr is an int.
+
+    Args:
+        arr: The keys to be sorted
+        algorithm: Name of the sort, for the error message
+    """
+    if not all_integers(arr):
+        kinds = sorted({type(value).__name__ for value in arr if type(value) is not int})
+        raise TypeError(f"{algorithm} requires integer keys, got {', '.join(kinds) or 'non-integer values'}")
+
+
+def counting_sort(arr, stats=None, key=None, reverse=False):
+    """
+    Sort an array of integers using Counting Sort.
+
+    Runs in O(n + k) time and O(k) extra space, where k = max - min + 1. Inputs whose
+    range k exceeds COUNTING_MAX_RANGE_FACTOR * n are sorted with radix_sort() instead.
+
+    Args:
+        arr: The array of integers to be sorted
+        stats: Dictionary to track performance statistics (optional)
+        key: Function computing an integer sort key of each element, called once
+            per element (optional)
+        reverse: Sort in descending order; equal keys keep their original order
+
+    Returns:
+        The stats dictionary, or None when stats is not provided
+        (the array is sorted in-place)
+    """
+    # Counting Sort is stable on its own, so keys need no index decoration
+    if key is not None or reverse:
+        return counting_sort_by_key(arr, key, reverse, stats)
+
+    n = len(arr)
+    if n < 2:
+        return stats
+    check_integers(arr, 'counting_sort')
+
+    low = min(arr)
+    high = max(arr)
+
+    # A counter per possible key would dwarf the input
+    if high - low + 1 > max(COUNTING_MAX_RANGE_FACTOR * n, RADIX):
+        return radix_sort(arr, stats)
+
+    # Count occurrences of every key, shifted so that the smallest key is 0
+    counts = [0] * (high - low + 1)
+    for value in arr:
+        counts[value - low] += 1
+
+    # Write the keys back in order
+    position = 0
+    for offset, count in enumerate(counts):
+        if count:
+            assign_slice(arr, position, position + count, [low + offset] * count)
+            position += count
+
+    if stats is not None:
+        stats['comparisons'] += 2 * (n - 1)  # min() and max() scans
+        stats['swaps'] += n
+    return stats
+
+
+def counting_sort_by_key(arr, key=None, reverse=False, stats=None):
+    """
+    Stably sort arr by an integer key using Counting Sort.
+
+    Packing the key with the element's index (as key_sort() does for the other sorters)
+    would multiply the key range by n, so this variant counts the keys themselves and
+    places every element directly at its final position.
+
+    Args:
+        arr: The array to be sorted
+        key: Function computing an integer sort key of each element (default: the element)
+        reverse: Sort in descending order of key; equal keys keep their original order
+        stats: Dictionary to track performance statistics (optional)
+
+    Returns:
+        The stats dictionary, or None when stats is not provided
+        (the array is sorted in-place)
+    """
+    n = len(arr)
+    if n < 2:
+        return stats
+
+    keys = list(arr) if key is None else [key(element) for element in arr]
+    check_integers(keys, 'counting_sort')
+    low = min(keys)
+    high = max(keys)
+
+    # A counter per possible key would dwarf the input: radix sort the keys instead
+    if high - low + 1 > max(COUNTING_MAX_RANGE_FACTOR * n, RADIX):
+        radix_sort_by_keys(arr, keys, reverse, stats)
+        if stats is not None:
+            stats['key_calls'] = stats.get('key_calls', 0) + (n if key is not None else 0)
+        return stats
+
+    counts = [0] * (high - low + 1)
+    for k in keys:
+        counts[k - low] += 1
+
+    # First output slot of every key, walking the keys in the requested direction
+    starts = [0] * len(counts)
+    position = 0
+    for offset in (range(len(counts) - 1, -1, -1) if reverse else range(len(counts))):
+        starts[offset] = position
+        position += counts[offset]
+
+    # Elements are visited in their original order, which keeps the sort stable
+    output = [None] * n
+    for element, k in zip(arr, keys):
+        output[starts[k - low]] = element
+        starts[k - low] += 1
+    assign_slice(arr, 0, n, output)
+
+    if stats is not None:
+        stats['comparisons'] += 2 * (n - 1)  # min() and max() scans
+        stats['swaps'] += n
+        stats['key_calls'] = stats.get('key_calls', 0) + (n if key is not None else 0)
+    return stats
+
+
+def radix_sort(arr, stats=None, key=None, reverse=False):
+    """
+    Sort an array of integers using LSD (least significant digit first) Radix Sort.
+
+    Negative numbers are handled by sorting value - min, which is never negative; the
+    number of byte-wide passes is set by the width of the range, not of the values.
+    Every pass is a stable counting sort on one byte.
+
+    Args:
+        arr: The array of integers to be sorted
+        stats: Dictionary to track performance statistics (optional)
+        key: Function computing an integer sort key of each element, called once
+            per element (optional)
+        reverse: Sort in descending order; equal keys keep their original order
+
+    Returns:
+        The stats dictionary, or None when stats is not provided
+        (the array is sorted in-place)
+    """
+    n = len(arr)
+    if n < 2:
+        return stats
+
+    if key is not None or reverse:
+        # Check the keys before they are decorated, so errors name the caller's types
+        keys = list(arr) if key is None else [key(element) for element in arr]
+        check_integers(keys, 'radix_sort')
+        radix_sort_by_keys(arr, keys, reverse, stats)
+        if stats is not None:
+            stats['key_calls'] = stats.get('key_calls', 0) + (n if key is not None else 0)
+        return stats
+    check_integers(arr, 'radix_sort')
+
+    low = min(arr)
+    span = max(arr) - low
+    passes = radix_passes(span)
+
+    source = list(arr)
+    target = [0] * n
+    mask = RADIX - 1
+
+    for shift in range(0, passes * RADIX_BITS, RADIX_BITS):
+        # Histogram of the current byte
+        counts = [0] * RADIX
+        for value in source:
+            counts[((value - low) >> shift) & mask] += 1
+
+        # Exclusive prefix sums give the first slot of every bucket
+        total = 0
+        for digit in range(RADIX):
+            counts[digit], total = total, total + counts[digit]
+
+        # Stable scatter into the other buffer
+        for value in source:
+            digit = ((value - low) >> shift) & mask
+            target[counts[digit]] = value
+            counts[digit] += 1
+
+        source, target = target, source
+
+    assign_slice(arr, 0, n, source)
+
+    if stats is not None:
+        stats['comparisons'] += 2 * (n - 1)  # min() and max() scans
+        stats['swaps'] += n * passes + n
+    return stats
+
+
+def radix_sort_by_keys(arr, keys, reverse, stats):
+    """
+    Stably sort arr in-place by precomputed integer keys.
+
+    The keys are decorated with their indexes (see part2/key_sort.py), radix sorted,
+    and used to put the elements of arr in order.
+
+    Args:
+        arr: The array to be sorted
+        keys: The integer sort key of every element of arr
+        reverse: Sort in descending order of key; equal keys keep their original order
+        stats: Dictionary to track performance statistics (optional)
+    """
+    decorated, packed = decorate(keys, None, reverse)
+    radix_sort(decorated, stats)
+    assign_slice(arr, 0, len(arr), undecorate(arr, decorated, packed, reverse))
+
+
+def radix_passes(span):
+    """Return the number of byte-wide passes needed for keys in [0, span]."""
+    return max(1, (span.bit_length() + RADIX_BITS - 1) // RADIX_BITS)
+
+
+def choose_integer_sort(n, low, high):
+    """
+    Decide how to sort n integers whose values lie in [low, high].
+
+    Args:
+        n: Number of elements
+        low: Smallest value
+        high: Largest value
+
+    Returns:
+        'counting', 'radix' or 'comparison'
+    """
+    if n < SMALL_INPUT:
+        return 'comparison'
+
+    span = high - low
+    if span + 1 <= COUNTING_RANGE_FACTOR * n:
+        return 'counting'
+
+    # A radix pass touches every element a constant number of times; a comparison sort
+    # needs about log2(n) levels of n comparisons each
+    if radix_passes(span) * RADIX_PASS_COST <= math.log2(n):
+        return 'radix'
+    return 'comparison'
+
+
+def integer_sort(arr, stats=None, key=None, reverse=False):
+    """
+    Sort an array of integers, choosing Counting Sort, Radix Sort or Introsort.
+
+    Arrays holding anything but ints (floats, for example) are sorted with Introsort.
+
+    Args:
+        arr: The array of integers to be sorted
+        stats: Dictionary to track performance statistics (optional). The chosen
+            method is recorded under 'method'.
+        key: Function computing an integer sort key of each element, called once
+            per element (optional)
+        reverse: Sort in descending order; equal keys keep their original order
+
+    Returns:
+        The stats dictionary, or None when stats is not provided
+        (the array is sorted in-place)
+    """
+    # Sort decorated keys instead of the elements (see part2/key_sort.py)
+    if key is not None or reverse:
+        return key_sort(arr, integer_sort, key, reverse, stats)
+
+    n = len(arr)
+    if n < 2:
+        return stats
+
+    if all_integers(arr):
+        method = choose_integer_sort(n, min(arr), max(arr))
+    else:
+        method = 'comparison'
+    if stats is not None:
+        stats['method'] = method
+
+    if method == 'counting':
+        return counting_sort(arr, stats)
+    if method == 'radix':
+        return radix_sort(arr, stats)
+    return introsort(arr, stats)
+
+
+if __name__ == "__main__":
+    # Example usage
+    test_array = [170, -45, 75, -90, 802, 24, 2, 66]
+    print(f"Original array: {test_array}")
+
+    stats = radix_sort(test_array, {'comparisons': 0, 'swaps': 0})
+    print(f"Sorted array (radix sort): {test_array}")
+    print(f"Performance stats: {stats}")
+
+    # Let integer_sort() pick a method for a few input shapes
+    import random
+    for low, high in [(-1000, 1000), (-10000, 10000), (-2 ** 40, 2 ** 40)]:
+        large_array = [random.randint(low, high) for _ in range(10000)]
+        stats = integer_sort(large_array, {'comparisons': 0, 'swaps': 0})
+        print(f"\nRange [{low}, {high}], n = {len(large_array)}: {stats}")
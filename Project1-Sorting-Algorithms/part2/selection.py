@@ -0,0 +1,235 @@
+"""
+Selection algorithms: nth element, partial sort and top-k.
+
+When only the k smallest items or a median are needed, a full sort does more work than
+necessary. This module provides:
+1. nth_element(), Introselect: Quick Sort's partition applied to one side only, with a
+   Heap Sort fallback when partitioning stops making progress. O(n) on average.
+2. partial_sort(), which places the k smallest items, in order, at the front of the
+   array in O(n + k log k) on average
+3. top_k(), which keeps the k smallest (or largest) items of any iterable in a bounded
+   heap, using O(k) memory and O(n log k) comparisons
+
+Every function takes the same optional stats dictionary as the sorters.
+"""
+
+import heapq
+import math
+import os
+import sys
+
+# Add the parent directory to the path so we can import the sorting modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from part2.quicksort import partition, partition_fast
+from part2.introsort import (choose_pivot, heapsort_range, insertionsort_range, introsort,
+                             introsort_loop, INSERTION_SORT_THRESHOLD)
+
+
+def nth_element(arr, k, stats=None):
+    """
+    Rearrange arr so that arr[k] holds the value it would have if arr were sorted.
+
+    Every element before position k is <= arr[k] and every element after it is >= arr[k];
+    neither side is sorted.
+
+    Args:
+        arr: The array to rearrange
+        k: Index of the element to place (0 <= k < len(arr))
+        stats: Dictionary to track performance statistics (optional)
+
+    Returns:
+        The stats dictionary, or None when stats is not provided
+        (the array is rearranged in-place)
+    """
+    n = len(arr)
+    if not 0 <= k < n:
+        raise IndexError(f"k={k} is out of range for an array of length {n}")
+    if n < 2:
+        return stats
+
+    low, high = 0, n - 1
+    # Same depth budget as Introsort before falling back to Heap Sort
+    depth_limit = 2 * int(math.log2(n))
+
+    while high - low + 1 > INSERTION_SORT_THRESHOLD:
+        if depth_limit == 0:
+            heapsort_range(arr, low, high, stats)
+            return stats
+        depth_limit -= 1
+
+        # Move the chosen pivot to arr[high] so the Lomuto partition can use it
+        pivot_index = choose_pivot(arr, low, high, stats)
+        if pivot_index != high:
+            arr[pivot_index], arr[high] = arr[high], arr[pivot_index]
+            if stats is not None:
+                stats['swaps'] += 1
+
+        if stats is None:
+            pivot_position = partition_fast(arr, low, high)
+        else:
+            pivot_position = partition(arr, low, high, stats)
+
+        # Continue only in the side that contains position k
+        if pivot_position == k:
+            return stats
+        if k < pivot_position:
+            high = pivot_position - 1
+        else:
+            low = pivot_position + 1
+
+    insertionsort_range(arr, low, high, stats)
+    return stats
+
+
+def partial_sort(arr, k, stats=None):
+    """
+    Rearrange arr so that arr[:k] holds its k smallest elements in sorted order.
+
+    The order of arr[k:] is unspecified.
+
+    Args:
+        arr: The array to rearrange
+        k: Number of smallest elements to sort into place
+        stats: Dictionary to track performance statistics (optional)
+
+    Returns:
+        The stats dictionary, or None when stats is not provided
+        (the array is rearranged in-place)
+    """
+    n = len(arr)
+    if k >= n:
+        return introsort(arr, stats)
+    if k <= 0:
+        return stats
+
+    # Put the k-th smallest at arr[k - 1] with everything smaller before it
+    nth_element(arr, k - 1, stats)
+    if k > 2:
+        introsort_loop(arr, 0, k - 2, 2 * int(math.log2(k - 1)), stats)
+    return stats
+
+
+def top_k(iterable, k, largest=False, stats=None):
+    """
+    Return the k smallest (or largest) items of an iterable.
+
+    Items are consumed one at a time, so the iterable may be a generator over more
+    data than fits in memory. Without stats this delegates to heapq.nsmallest() and
+    heapq.nlargest(); with stats, the bounded heap is maintained by hand so that every
+    comparison can be counted.
+
+    Args:
+        iterable: Any iterable of comparable items
+        k: Number of items to keep
+        largest: Keep the largest items instead of the smallest
+        stats: Dictionary to track performance statistics (optional)
+
+    Returns:
+        A list of the selected items, ascending for the smallest and descending for
+        the largest
+    """
+    if k <= 0:
+        return []
+    if stats is None:
+        return heapq.nlargest(k, iterable) if largest else heapq.nsmallest(k, iterable)
+
+    # The root of the heap is the worst item kept so far: the largest of the k
+    # smallest, or the smallest of the k largest
+    if largest:
+        def worse(a, b):
+            return a < b
+    else:
+        def worse(a, b):
+            return b < a
+
+    heap = []
+    comparisons = 0
+    swaps = 0
+
+    for item in iterable:
+        if len(heap) < k:
+            # Sift the new item up from the bottom
+            heap.append(item)
+            i = len(heap) - 1
+            while i > 0:
+                parent = (i - 1) // 2
+                comparisons += 1
+                if not worse(heap[i], heap[parent]):
+                    break
+                heap[i], heap[parent] = heap[parent], heap[i]
+                swaps += 1
+                i = parent
+        else:
+            # Replace the root only if the new item is better than the worst kept one
+            comparisons += 1
+            if worse(heap[0], item):
+                heap[0] = item
+                swaps += 1
+                moved, compared = sift_down_worst(heap, 0, k, worse)
+                swaps += moved
+                comparisons += compared
+
+    # Pop the worst item to the back until the heap is empty, which orders the result
+    size = len(heap)
+    while size > 1:
+        size -= 1
+        heap[0], heap[size] = heap[size], heap[0]
+        swaps += 1
+        moved, compared = sift_down_worst(heap, 0, size, worse)
+        swaps += moved
+        comparisons += compared
+
+    stats['comparisons'] += comparisons
+    stats['swaps'] += swaps
+    return heap
+
+
+def sift_down_worst(heap, i, size, worse):
+    """
+    Restore the heap property below index i of a heap ordered by worse().
+
+    Args:
+        heap: The heap list
+        i: Index of the item that may be out of place
+        size: Number of items in the heap
+        worse: Function returning True when its first argument belongs nearer the root
+
+    Returns:
+        (number of swaps, number of comparisons)
+    """
+    swaps = 0
+    comparisons = 0
+    while True:
+        child = 2 * i + 1
+        if child >= size:
+            break
+        right = child + 1
+        if right < size:
+            comparisons += 1
+            if worse(heap[right], heap[child]):
+                child = right
+        comparisons += 1
+        if not worse(heap[child], heap[i]):
+            break
+        heap[i], heap[child] = heap[child], heap[i]
+        swaps += 1
+        i = child
+    return swaps, comparisons
+
+
+if __name__ == "__main__":
+    # Example usage
+    test_array = [10, 7, 8, 9, 1, 5, 3, 6, 2, 4]
+    print(f"Original array: {test_array}")
+
+    median_index = len(test_array) // 2
+    stats = nth_element(test_array, median_index, {'comparisons': 0, 'swaps': 0})
+    print(f"Median (index {median_index}): {test_array[median_index]}, stats: {stats}")
+
+    stats = partial_sort(test_array, 3, {'comparisons': 0, 'swaps': 0})
+    print(f"Three smallest, sorted: {test_array[:3]}, stats: {stats}")
+
+    stats = {'comparisons': 0, 'swaps': 0}
+    print(f"Three largest of a generator: {top_k((x * x % 97 for x in range(1000)), 3, largest=True, stats=stats)}")
+    print(f"Performance stats: {stats}")
@@ -0,0 +1,961 @@
+"""
+Implementation of an adaptive, Timsort-style Merge Sort.
+
+This module provides a stable sort that takes advantage of order already present in
+the input. It scans for natural runs (non-descending, or strictly descending runs that
+are reversed in-place), extends short runs with binary insertion sort, keeps the runs
+on a stack whose lengths follow the Timsort invariants, and merges neighbouring runs
+with a galloping merge. Presorted and nearly sorted inputs are sorted in close to
+linear time.
+
+With a stats dictionary the merge loops count comparisons and moves in local integers
+and add them to the totals once per merge. Without one, TimSortFast runs copies of the
+run scanning and merging methods with no counting at all. Both share compute_min_run(),
+the run stack and merge scheduling, and the galloping searches gallop_left() and
+gallop_right(), which return their comparison count for TimSort to add up.
+"""
+
+import os
+import sys
+
+# Add the parent directory to the path so we can import the sorting modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from part2.array_utils import assign_slice, copy_slice
+from part2.insertionsort import insertionsort_block_move_range
+from part2.key_sort import key_sort
+
+# Arrays shorter than this are sorted with binary insertion sort alone
+MIN_MERGE = 32
+
+# Number of consecutive wins by one run before a merge switches to galloping mode
+MIN_GALLOP = 7
+
+
+def timsort(arr, stats=None, key=None, reverse=False):
+    """
+    Sort an array using the adaptive Timsort-style Merge Sort.
+
+    Args:
+        arr: The array to be sorted
+        stats: Dictionary to track performance statistics (optional). A PhaseTracer
+            under 'tracer' receives the 'timsort', 'find_run', 'insertion' and
+            'merge' phases.
+        key: Function computing the sort key of each element, called once
+            per element (optional)
+        reverse: Sort in descending order; equal keys keep their original order
+
+    Returns:
+        The stats dictionary, or None when stats is not provided
+        (the array is sorted in-place)
+    """
+    # Sort decorated keys instead of the elements (see part2/key_sort.py)
+    if key is not None or reverse:
+        return key_sort(arr, timsort, key, reverse, stats)
+
+    n = len(arr)
+    if n < 2:
+        return stats
+
+    # Without a stats dictionary, run the uninstrumented methods
+    sorter = TimSort(arr) if stats is not None else TimSortFast(arr)
+    min_run = compute_min_run(n)
+
+    # Report phases to a tracer when one is attached (see part2/phase_tracer.py)
+    tracer = stats.get('tracer') if stats is not None else None
+    if tracer is not None:
+        tracer.enter('timsort')
+
+    low = 0
+    remaining = n
+    while remaining:
+        # Find the next natural run, reversing it if it is descending
+        if tracer is not None:
+            tracer.enter('find_run')
+        run_length = sorter.count_run_and_make_ascending(low, n)
+        if tracer is not None:
+            tracer.exit()
+
+        # Extend short runs to min_run elements with binary insertion sort
+        if run_length < min_run:
+            forced = min(remaining, min_run)
+            if tracer is not None:
+                tracer.enter('insertion')
+            sorter.binary_insertion_sort(low, low + forced, low + run_length)
+            if tracer is not None:
+                tracer.exit()
+            run_length = forced
+
+        # Push the run and merge until the stack invariants hold again
+        sorter.push_run(low, run_length)
+        if tracer is not None:
+            tracer.enter('merge')
+        sorter.merge_collapse()
+        if tracer is not None:
+            tracer.exit()
+
+        low += run_length
+        remaining -= run_length
+
+    if tracer is not None:
+        tracer.enter('merge')
+    sorter.merge_force_collapse()
+    if tracer is not None:
+        tracer.exit()
+        tracer.exit()
+
+    if stats is not None:
+        stats['comparisons'] += sorter.counts['comparisons']
+        stats['swaps'] += sorter.counts['swaps']
+    return stats
+
+
+def compute_min_run(n):
+    """
+    Compute the minimum run length for an array of size n.
+
+    The result lies in [MIN_MERGE / 2, MIN_MERGE] and is chosen so that n / min_run is
+    a power of two or slightly less, which keeps the final merges balanced.
+
+    Args:
+        n: Size of the array
+
+    Returns:
+        The minimum run length
+    """
+    extra = 0
+    while n >= MIN_MERGE:
+        extra |= n & 1
+        n >>= 1
+    return n + extra
+
+
+def gallop_left(key, a, base, length, hint):
+    """
+    Locate the leftmost position at which key can be inserted into a sorted range.
+
+    The search starts at base + hint and probes at exponentially growing offsets
+    before finishing with a binary search, so it costs O(log d) comparisons where d
+    is the distance between hint and the answer.
+
+    Args:
+        key: The value to locate
+        a: The array holding the sorted range
+        base: Start of the sorted range
+        length: Length of the sorted range
+        hint: Offset within the range at which to start searching
+
+    Returns:
+        (k, comparisons): k in [0, length] such that a[base + k - 1] < key <= a[base + k],
+        and the number of comparisons made
+    """
+    comparisons = 1
+    last_offset = 0
+    offset = 1
+    if a[base + hint] < key:
+        # Gallop right until a[base + hint + last_offset] < key <= a[base + hint + offset]
+        max_offset = length - hint
+        while offset < max_offset:
+            comparisons += 1
+            if not a[base + hint + offset] < key:
+                break
+            last_offset = offset
+            offset = (offset << 1) + 1
+        if offset > max_offset:
+            offset = max_offset
+        last_offset += hint
+        offset += hint
+    else:
+        # Gallop left until a[base + hint - offset] < key <= a[base + hint - last_offset]
+        max_offset = hint + 1
+        while offset < max_offset:
+            comparisons += 1
+            if a[base + hint - offset] < key:
+                break
+            last_offset = offset
+            offset = (offset << 1) + 1
+        if offset > max_offset:
+            offset = max_offset
+        last_offset, offset = hint - offset, hint - last_offset
+
+    # Binary search in a[base + last_offset + 1 .. base + offset]
+    last_offset += 1
+    while last_offset < offset:
+        mid = last_offset + ((offset - last_offset) >> 1)
+        comparisons += 1
+        if a[base + mid] < key:
+            last_offset = mid + 1
+        else:
+            offset = mid
+
+    return offset, comparisons
+
+
+def gallop_right(key, a, base, length, hint):
+    """
+    Locate the rightmost position at which key can be inserted into a sorted range.
+
+    Like gallop_left(), except that key is placed after any equal elements.
+
+    Args:
+        key: The value to locate
+        a: The array holding the sorted range
+        base: Start of the sorted range
+        length: Length of the sorted range
+        hint: Offset within the range at which to start searching
+
+    Returns:
+        (k, comparisons): k in [0, length] such that a[base + k - 1] <= key < a[base + k],
+        and the number of comparisons made
+    """
+    comparisons = 1
+    last_offset = 0
+    offset = 1
+    if key < a[base + hint]:
+        # Gallop left until a[base + hint - offset] <= key < a[base + hint - last_offset]
+        max_offset = hint + 1
+        while offset < max_offset:
+            comparisons += 1
+            if not key < a[base + hint - offset]:
+                break
+            last_offset = offset
+            offset = (offset << 1) + 1
+        if offset > max_offset:
+            offset = max_offset
+        last_offset, offset = hint - offset, hint - last_offset
+    else:
+        # Gallop right until a[base + hint + last_offset] <= key < a[base + hint + offset]
+        max_offset = length - hint
+        while offset < max_offset:
+            comparisons += 1
+            if key < a[base + hint + offset]:
+                break
+            last_offset = offset
+            offset = (offset << 1) + 1
+        if offset > max_offset:
+            offset = max_offset
+        last_offset += hint
+        offset += hint
+
+    # Binary search in a[base + last_offset + 1 .. base + offset]
+    last_offset += 1
+    while last_offset < offset:
+        mid = last_offset + ((offset - last_offset) >> 1)
+        comparisons += 1
+        if key < a[base + mid]:
+            offset = mid
+        else:
+            last_offset = mid + 1
+
+    return offset, comparisons
+
+
+class TimSort:
+    """
+    State of a single Timsort pass: the array, the pending-run stack and counters.
+    """
+
+    def __init__(self, arr):
+        self.arr = arr
+        self.min_gallop = MIN_GALLOP
+
+        # Pending runs: run i covers arr[run_base[i]:run_base[i] + run_length[i]]
+        self.run_base = []
+        self.run_length = []
+
+        # Shared with insertionsort_block_move_range(), which expects a stats dictionary
+        self.counts = {'comparisons': 0, 'swaps': 0}
+
+    def count_run_and_make_ascending(self, low, high):
+        """
+        Return the length of the run starting at arr[low], reversing it if descending.
+
+        A run is either non-descending or strictly descending. Descending runs must be
+        strict so that reversing them in-place cannot break stability.
+
+        Args:
+            low: Index of the first element of the run
+            high: End of the array (exclusive)
+
+        Returns:
+            The length of the run
+        """
+        arr = self.arr
+        run_high = low + 1
+        if run_high == high:
+            return 1
+
+        comparisons = 1
+        if arr[run_high] < arr[low]:
+            # Strictly descending run
+            run_high += 1
+            while run_high < high:
+                comparisons += 1
+                if not arr[run_high] < arr[run_high - 1]:
+                    break
+                run_high += 1
+            assign_slice(arr, low, run_high, copy_slice(arr, low, run_high)[::-1])
+            self.counts['swaps'] += (run_high - low) // 2
+        else:
+            # Non-descending run
+            run_high += 1
+            while run_high < high:
+                comparisons += 1
+                if arr[run_high] < arr[run_high - 1]:
+                    break
+                run_high += 1
+
+        self.counts['comparisons'] += comparisons
+        return run_high - low
+
+    def binary_insertion_sort(self, low, high, start):
+        """
+        Sort arr[low:high] given that arr[low:start] is already sorted.
+
+        Args:
+            low: Start of the range
+            high: End of the range (exclusive)
+            start: First element that is not yet in sorted position
+
+        Returns:
+            None (the array is sorted in-place)
+        """
+        # Each shift is a single block move (see insertionsort_block_move())
+        insertionsort_block_move_range(self.arr, low, high - 1, self.counts, start)
+
+    def push_run(self, base, length):
+        """Push a sorted run onto the pending-run stack."""
+        self.run_base.append(base)
+        self.run_length.append(length)
+
+    def merge_collapse(self):
+        """
+        Merge pending runs until the stack invariants hold again.
+
+        For the top runs X, Y, Z (Z on top) the invariants are
+        len(X) > len(Y) + len(Z) and len(Y) > len(Z), checked one level deeper as
+        well so they hold for the entire stack.
+        """
+        run_length = self.run_length
+        while len(run_length) > 1:
+            n = len(run_length) - 2
+            if ((n > 0 and run_length[n - 1] <= run_length[n] + run_length[n + 1]) or
+                    (n > 1 and run_length[n - 2] <= run_length[n - 1] + run_length[n])):
+                if run_length[n - 1] < run_length[n + 1]:
+                    n -= 1
+            elif run_length[n] > run_length[n + 1]:
+                break
+            self.merge_at(n)
+
+    def merge_force_collapse(self):
+        """Merge all pending runs into one; called once the whole array is scanned."""
+        run_length = self.run_length
+        while len(run_length) > 1:
+            n = len(run_length) - 2
+            if n > 0 and run_length[n - 1] < run_length[n + 1]:
+                n -= 1
+            self.merge_at(n)
+
+    def merge_at(self, i):
+        """
+        Merge the runs at stack positions i and i + 1.
+
+        Args:
+            i: Stack index of the first run; it must be the second or third from the top
+        """
+        arr = self.arr
+        base1 = self.run_base[i]
+        length1 = self.run_length[i]
+        base2 = self.run_base[i + 1]
+        length2 = self.run_length[i + 1]
+
+        # Record the combined run; if merging the 3rd-from-top run, slide the top down
+        self.run_length[i] = length1 + length2
+        if i == len(self.run_length) - 3:
+            self.run_base[i + 1] = self.run_base[i + 2]
+            self.run_length[i + 1] = self.run_length[i + 2]
+        self.run_base.pop()
+        self.run_length.pop()
+
+        # Elements of run 1 that are <= run 2's first element are already in place
+        k = self.gallop_right(arr[base2], arr, base1, length1, 0)
+        base1 += k
+        length1 -= k
+        if length1 == 0:
+            return
+
+        # Elements of run 2 that are >= run 1's last element are already in place
+        length2 = self.gallop_left(arr[base1 + length1 - 1], arr, base2, length2, length2 - 1)
+        if length2 == 0:
+            return
+
+        # Merge what remains, copying the shorter run into the temporary buffer
+        if length1 <= length2:
+            self.merge_low(base1, length1, base2, length2)
+        else:
+            self.merge_high(base1, length1, base2, length2)
+
+    def gallop_left(self, key, a, base, length, hint):
+        """Return the position found by gallop_left(), adding its comparisons to the counts."""
+        offset, comparisons = gallop_left(key, a, base, length, hint)
+        self.counts['comparisons'] += comparisons
+        return offset
+
+    def gallop_right(self, key, a, base, length, hint):
+        """Return the position found by gallop_right(), adding its comparisons to the counts."""
+        offset, comparisons = gallop_right(key, a, base, length, hint)
+        self.counts['comparisons'] += comparisons
+        return offset
+
+    def merge_low(self, base1, length1, base2, length2):
+        """
+        Merge two adjacent runs left to right, buffering the first (shorter) run.
+
+        Requires arr[base2] < arr[base1] and that the last element of run 1 is greater
+        than every element of run 2 (merge_at() trims the runs to guarantee this).
+
+        Args:
+            base1: Start of the first run
+            length1: Length of the first run
+            base2: Start of the second run (base1 + length1)
+            length2: Length of the second run
+        """
+        arr = self.arr
+        temp = copy_slice(arr, base1, base1 + length1)
+        cursor1 = 0
+        cursor2 = base2
+        dest = base1
+        comparisons = 0
+        moves = 0
+
+        # The first element of run 2 is known to go first
+        arr[dest] = arr[cursor2]
+        dest += 1
+        cursor2 += 1
+        moves += 1
+        length2 -= 1
+
+        min_gallop = self.min_gallop
+        done = length2 == 0 or length1 == 1
+        while not done:
+            count1 = 0  # Number of times in a row that run 1 won
+            count2 = 0  # Number of times in a row that run 2 won
+
+            # One element at a time until one run starts winning consistently
+            while True:
+                comparisons += 1
+                if arr[cursor2] < temp[cursor1]:
+                    arr[dest] = arr[cursor2]
+                    dest += 1
+                    cursor2 += 1
+                    moves += 1
+                    count2 += 1
+                    count1 = 0
+                    length2 -= 1
+                    if length2 == 0:
+                        done = True
+                        break
+                else:
+                    arr[dest] = temp[cursor1]
+                    dest += 1
+                    cursor1 += 1
+                    moves += 1
+                    count1 += 1
+                    count2 = 0
+                    length1 -= 1
+                    if length1 == 1:
+                        done = True
+                        break
+                if (count1 | count2) >= min_gallop:
+                    break
+            if done:
+                break
+
+            # Galloping mode: copy whole blocks until neither run wins by MIN_GALLOP
+            while True:
+                count1 = self.gallop_right(arr[cursor2], temp, cursor1, length1, 0)
+                if count1 != 0:
+                    assign_slice(arr, dest, dest + count1, temp[cursor1:cursor1 + count1])
+                    dest += count1
+                    cursor1 += count1
+                    moves += count1
+                    length1 -= count1
+                    if length1 <= 1:
+                        done = True
+                        break
+                arr[dest] = arr[cursor2]
+                dest += 1
+                cursor2 += 1
+                moves += 1
+                length2 -= 1
+                if length2 == 0:
+                    done = True
+                    break
+
+                count2 = self.gallop_left(temp[cursor1], arr, cursor2, length2, 0)
+                if count2 != 0:
+                    assign_slice(arr, dest, dest + count2, copy_slice(arr, cursor2, cursor2 + count2))
+                    dest += count2
+                    cursor2 += count2
+                    moves += count2
+                    length2 -= count2
+                    if length2 == 0:
+                        done = True
+                        break
+                arr[dest] = temp[cursor1]
+                dest += 1
+                cursor1 += 1
+                moves += 1
+                length1 -= 1
+                if length1 == 1:
+                    done = True
+                    break
+
+                # Galloping is paying off: make it easier to enter next time
+                min_gallop -= 1
+                if count1 < MIN_GALLOP and count2 < MIN_GALLOP:
+                    break
+            if done:
+                break
+
+            # Penalize leaving galloping mode
+            if min_gallop < 0:
+                min_gallop = 0
+            min_gallop += 2
+
+        self.min_gallop = max(1, min_gallop)
+
+        if length1 == 1:
+            # Remaining run 2 slides left, then the last buffered element goes after it
+            assign_slice(arr, dest, dest + length2, copy_slice(arr, cursor2, cursor2 + length2))
+            arr[dest + length2] = temp[cursor1]
+            moves += length2 + 1
+        else:
+            # Run 2 is exhausted; the rest of run 1 fills the tail
+            assign_slice(arr, dest, dest + length1, temp[cursor1:cursor1 + length1])
+            moves += length1
+
+        self.counts['comparisons'] += comparisons
+        self.counts['swaps'] += moves
+
+    def merge_high(self, base1, length1, base2, length2):
+        """
+        Merge two adjacent runs right to left, buffering the second (shorter) run.
+
+        Requires arr[base2 + length2 - 1] < arr[base1 + length1 - 1] and that the first
+        element of run 2 is smaller than every element of run 1.
+
+        Args:
+            base1: Start of the first run
+            length1: Length of the first run
+            base2: Start of the second run (base1 + length1)
+            length2: Length of the second run
+        """
+        arr = self.arr
+        temp = copy_slice(arr, base2, base2 + length2)
+        cursor1 = base1 + length1 - 1
+        cursor2 = length2 - 1
+        dest = base2 + length2 - 1
+        comparisons = 0
+        moves = 0
+
+        # The last element of run 1 is known to go last
+        arr[dest] = arr[cursor1]
+        dest -= 1
+        cursor1 -= 1
+        moves += 1
+        length1 -= 1
+
+        min_gallop = self.min_gallop
+        done = length1 == 0 or length2 == 1
+        while not done:
+            count1 = 0  # Number of times in a row that run 1 won
+            count2 = 0  # Number of times in a row that run 2 won
+
+            # One element at a time until one run starts winning consistently
+            while True:
+                comparisons += 1
+                if temp[cursor2] < arr[cursor1]:
+                    arr[dest] = arr[cursor1]
+                    dest -= 1
+                    cursor1 -= 1
+                    moves += 1
+                    count1 += 1
+                    count2 = 0
+                    length1 -= 1
+                    if length1 == 0:
+                        done = True
+                        break
+                else:
+                    arr[dest] = temp[cursor2]
+                    dest -= 1
+                    cursor2 -= 1
+                    moves += 1
+                    count2 += 1
+                    count1 = 0
+                    length2 -= 1
+                    if length2 == 1:
+                        done = True
+                        break
+                if (count1 | count2) >= min_gallop:
+                    break
+            if done:
+                break
+
+            # Galloping mode: copy whole blocks until neither run wins by MIN_GALLOP
+            while True:
+                count1 = length1 - self.gallop_right(temp[cursor2], arr, base1, length1, length1 - 1)
+                if count1 != 0:
+                    dest -= count1
+                    cursor1 -= count1
+                    length1 -= count1
+                    assign_slice(arr, dest + 1, dest + 1 + count1,
+                                 copy_slice(arr, cursor1 + 1, cursor1 + 1 + count1))
+                    moves += count1
+                    if length1 == 0:
+                        done = True
+                        break
+                arr[dest] = temp[cursor2]
+                dest -= 1
+                cursor2 -= 1
+                moves += 1
+                length2 -= 1
+                if length2 == 1:
+                    done = True
+                    break
+
+                count2 = length2 - self.gallop_left(arr[cursor1], temp, 0, length2, length2 - 1)
+                if count2 != 0:
+                    dest -= count2
+                    cursor2 -= count2
+                    length2 -= count2
+                    assign_slice(arr, dest + 1, dest + 1 + count2, temp[cursor2 + 1:cursor2 + 1 + count2])
+                    moves += count2
+                    if length2 <= 1:
+                        done = True
+                        break
+                arr[dest] = arr[cursor1]
+                dest -= 1
+                cursor1 -= 1
+                moves += 1
+                length1 -= 1
+                if length1 == 0:
+                    done = True
+                    break
+
+                # Galloping is paying off: make it easier to enter next time
+                min_gallop -= 1
+                if count1 < MIN_GALLOP and count2 < MIN_GALLOP:
+                    break
+            if done:
+                break
+
+            # Penalize leaving galloping mode
+            if min_gallop < 0:
+                min_gallop = 0
+            min_gallop += 2
+
+        self.min_gallop = max(1, min_gallop)
+
+        if length2 == 1:
+            # Remaining run 1 slides right, then the last buffered element goes before it
+            dest -= length1
+            cursor1 -= length1
+            assign_slice(arr, dest + 1, dest + 1 + length1,
+                         copy_slice(arr, cursor1 + 1, cursor1 + 1 + length1))
+            arr[dest] = temp[cursor2]
+            moves += length1 + 1
+        else:
+            # Run 1 is exhausted; the rest of run 2 fills the head
+            assign_slice(arr, dest - (length2 - 1), dest + 1, temp[0:length2])
+            moves += length2
+
+        self.counts['comparisons'] += comparisons
+        self.counts['swaps'] += moves
+
+
+class TimSortFast(TimSort):
+    """
+    Uninstrumented Timsort pass (no statistics are collected).
+
+    Overrides every method that counts comparisons or moves with a copy that does not;
+    the run stack and merge scheduling are inherited unchanged, and the galloping
+    searches are the same module-level functions TimSort uses.
+    """
+
+    def __init__(self, arr):
+        self.arr = arr
+        self.min_gallop = MIN_GALLOP
+        self.run_base = []
+        self.run_length = []
+
+    def binary_insertion_sort(self, low, high, start):
+        """Uninstrumented binary_insertion_sort(); same result."""
+        insertionsort_block_move_range(self.arr, low, high - 1, None, start)
+
+    def count_run_and_make_ascending(self, low, high):
+        """Uninstrumented count_run_and_make_ascending(); same result."""
+        arr = self.arr
+        run_high = low + 1
+        if run_high == high:
+            return 1
+
+        if arr[run_high] < arr[low]:
+            # Strictly descending run
+            run_high += 1
+            while run_high < high:
+                if not arr[run_high] < arr[run_high - 1]:
+                    break
+                run_high += 1
+            assign_slice(arr, low, run_high, copy_slice(arr, low, run_high)[::-1])
+        else:
+            # Non-descending run
+            run_high += 1
+            while run_high < high:
+                if arr[run_high] < arr[run_high - 1]:
+                    break
+                run_high += 1
+
+        return run_high - low
+
+    def gallop_left(self, key, a, base, length, hint):
+        """Uninstrumented gallop_left(); same result."""
+        return gallop_left(key, a, base, length, hint)[0]
+
+    def gallop_right(self, key, a, base, length, hint):
+        """Uninstrumented gallop_right(); same result."""
+        return gallop_right(key, a, base, length, hint)[0]
+
+    def merge_low(self, base1, length1, base2, length2):
+        """Uninstrumented merge_low(); same result."""
+        arr = self.arr
+        temp = copy_slice(arr, base1, base1 + length1)
+        cursor1 = 0
+        cursor2 = base2
+        dest = base1
+
+        # The first element of run 2 is known to go first
+        arr[dest] = arr[cursor2]
+        dest += 1
+        cursor2 += 1
+        length2 -= 1
+
+        min_gallop = self.min_gallop
+        done = length2 == 0 or length1 == 1
+        while not done:
+            count1 = 0  # Number of times in a row that run 1 won
+            count2 = 0  # Number of times in a row that run 2 won
+
+            # One element at a time until one run starts winning consistently
+            while True:
+                if arr[cursor2] < temp[cursor1]:
+                    arr[dest] = arr[cursor2]
+                    dest += 1
+                    cursor2 += 1
+                    count2 += 1
+                    count1 = 0
+                    length2 -= 1
+                    if length2 == 0:
+                        done = True
+                        break
+                else:
+                    arr[dest] = temp[cursor1]
+                    dest += 1
+                    cursor1 += 1
+                    count1 += 1
+                    count2 = 0
+                    length1 -= 1
+                    if length1 == 1:
+                        done = True
+                        break
+                if (count1 | count2) >= min_gallop:
+                    break
+            if done:
+                break
+
+            # Galloping mode: copy whole blocks until neither run wins by MIN_GALLOP
+            while True:
+                count1 = self.gallop_right(arr[cursor2], temp, cursor1, length1, 0)
+                if count1 != 0:
+                    assign_slice(arr, dest, dest + count1, temp[cursor1:cursor1 + count1])
+                    dest += count1
+                    cursor1 += count1
+                    length1 -= count1
+                    if length1 <= 1:
+                        done = True
+                        break
+                arr[dest] = arr[cursor2]
+                dest += 1
+                cursor2 += 1
+                length2 -= 1
+                if length2 == 0:
+                    done = True
+                    break
+
+                count2 = self.gallop_left(temp[cursor1], arr, cursor2, length2, 0)
+                if count2 != 0:
+                    assign_slice(arr, dest, dest + count2, copy_slice(arr, cursor2, cursor2 + count2))
+                    dest += count2
+                    cursor2 += count2
+                    length2 -= count2
+                    if length2 == 0:
+                        done = True
+                        break
+                arr[dest] = temp[cursor1]
+                dest += 1
+                cursor1 += 1
+                length1 -= 1
+                if length1 == 1:
+                    done = True
+                    break
+
+                # Galloping is paying off: make it easier to enter next time
+                min_gallop -= 1
+                if count1 < MIN_GALLOP and count2 < MIN_GALLOP:
+                    break
+            if done:
+                break
+
+            # Penalize leaving galloping mode
+            if min_gallop < 0:
+                min_gallop = 0
+            min_gallop += 2
+
+        self.min_gallop = max(1, min_gallop)
+
+        if length1 == 1:
+            # Remaining run 2 slides left, then the last buffered element goes after it
+            assign_slice(arr, dest, dest + length2, copy_slice(arr, cursor2, cursor2 + length2))
+            arr[dest + length2] = temp[cursor1]
+        else:
+            # Run 2 is exhausted; the rest of run 1 fills the tail
+            assign_slice(arr, dest, dest + length1, temp[cursor1:cursor1 + length1])
+
+    def merge_high(self, base1, length1, base2, length2):
+        """Uninstrumented merge_high(); same result."""
+        arr = self.arr
+        temp = copy_slice(arr, base2, base2 + length2)
+        cursor1 = base1 + length1 - 1
+        cursor2 = length2 - 1
+        dest = base2 + length2 - 1
+
+        # The last element of run 1 is known to go last
+        arr[dest] = arr[cursor1]
+        dest -= 1
+        cursor1 -= 1
+        length1 -= 1
+
+        min_gallop = self.min_gallop
+        done = length1 == 0 or length2 == 1
+        while not done:
+            count1 = 0  # Number of times in a row that run 1 won
+            count2 = 0  # Number of times in a row that run 2 won
+
+            # One element at a time until one run starts winning consistently
+            while True:
+                if temp[cursor2] < arr[cursor1]:
+                    arr[dest] = arr[cursor1]
+                    dest -= 1
+                    cursor1 -= 1
+                    count1 += 1
+                    count2 = 0
+                    length1 -= 1
+                    if length1 == 0:
+                        done = True
+                        break
+                else:
+                    arr[dest] = temp[cursor2]
+                    dest -= 1
+                    cursor2 -= 1
+                    count2 += 1
+                    count1 = 0
+                    length2 -= 1
+                    if length2 == 1:
+                        done = True
+                        break
+                if (count1 | count2) >= min_gallop:
+                    break
+            if done:
+                break
+
+            # Galloping mode: copy whole blocks until neither run wins by MIN_GALLOP
+            while True:
+                count1 = length1 - self.gallop_right(temp[cursor2], arr, base1, length1, length1 - 1)
+                if count1 != 0:
+                    dest -= count1
+                    cursor1 -= count1
+                    length1 -= count1
+                    assign_slice(arr, dest + 1, dest + 1 + count1,
+                                 copy_slice(arr, cursor1 + 1, cursor1 + 1 + count1))
+                    if length1 == 0:
+                        done = True
+                        break
+                arr[dest] = temp[cursor2]
+                dest -= 1
+                cursor2 -= 1
+                length2 -= 1
+                if length2 == 1:
+                    done = True
+                    break
+
+                count2 = length2 - self.gallop_left(arr[cursor1], temp, 0, length2, length2 - 1)
+                if count2 != 0:
+                    dest -= count2
+                    cursor2 -= count2
+                    length2 -= count2
+                    assign_slice(arr, dest + 1, dest + 1 + count2, temp[cursor2 + 1:cursor2 + 1 + count2])
+                    if length2 <= 1:
+                        done = True
+                        break
+                arr[dest] = arr[cursor1]
+                dest -= 1
+                cursor1 -= 1
+                length1 -= 1
+                if length1 == 0:
+                    done = True
+                    break
+
+                # Galloping is paying off: make it easier to enter next time
+                min_gallop -= 1
+                if count1 < MIN_GALLOP and count2 < MIN_GALLOP:
+                    break
+            if done:
+                break
+
+            # Penalize leaving galloping mode
+            if min_gallop < 0:
+                min_gallop = 0
+            min_gallop += 2
+
+        self.min_gallop = max(1, min_gallop)
+
+        if length2 == 1:
+            # Remaining run 1 slides right, then the last buffered element goes before it
+            dest -= length1
+            cursor1 -= length1
+            assign_slice(arr, dest + 1, dest + 1 + length1,
+                         copy_slice(arr, cursor1 + 1, cursor1 + 1 + length1))
+            arr[dest] = temp[cursor2]
+        else:
+            # Run 1 is exhausted; the rest of run 2 fills the head
+            assign_slice(arr, dest - (length2 - 1), dest + 1, temp[0:length2])
+
+
+if __name__ == "__main__":
+    # Example usage
+    test_array = [5, 21, 7, 23, 19, 10, 12, 3, 8, 1]
+    print(f"Original array: {test_array}")
+
+    stats = timsort(test_array, {'comparisons': 0, 'swaps': 0})
+    print(f"Sorted array: {test_array}")
+    print(f"Performance stats: {stats}")
+
+    # Nearly sorted input: a sorted array with 1% of the elements swapped
+    import random
+    nearly_sorted = list(range(10000))
+    for _ in range(100):
+        i, j = random.randrange(10000), random.randrange(10000)
+        nearly_sorted[i], nearly_sorted[j] = nearly_sorted[j], nearly_sorted[i]
+    print(f"\nSorting {len(nearly_sorted)} nearly sorted elements...")
+    stats = timsort(nearly_sorted, {'comparisons': 0, 'swaps': 0})
+    print(f"Performance stats: {stats}")
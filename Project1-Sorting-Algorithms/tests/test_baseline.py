@@ -0,0 +1,141 @@
+# test_baseline.py
+
+"""
+Tests for the benchmark regression gate in part2/baseline.py.
+
+Run from Project1-Sorting-Algorithms with: python -m pytest tests
+"""
+
+import csv
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+# Add the project directory to the path so we can import the sorting modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from part2 import baseline
+
+COLUMNS = ['algorithm', 'dataset', 'size', 'time_uninstrumented_ms',
+           'time_uninstrumented_ci_low_ms', 'time_uninstrumented_ci_high_ms',
+           'comparisons', 'status', 'error']
+
+
+def ok_row(algorithm, time_ms=10.0, comparisons=1000):
+    """Return a finished results row for the random_1000 dataset."""
+    return {'algorithm': algorithm, 'dataset': 'random_1000', 'size': 1000,
+            'time_uninstrumented_ms': time_ms, 'time_uninstrumented_ci_low_ms': time_ms * 0.99,
+            'time_uninstrumented_ci_high_ms': time_ms * 1.01, 'comparisons': comparisons,
+            'status': 'ok', 'error': ''}
+
+
+def failed_row(algorithm, status, error):
+    """Return a row the way matrix_runner writes a failed cell: no metrics."""
+    return {'algorithm': algorithm, 'dataset': 'random_1000', 'size': 1000,
+            'status': status, 'error': error}
+
+
+class TestBaselineGate(unittest.TestCase):
+    """Test saving baselines and comparing results against them."""
+
+    def setUp(self):
+        """Create a scratch directory for results and baselines."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.baseline_file = os.path.join(self.directory.name, 'baselines.json')
+
+    def tearDown(self):
+        """Remove the scratch directory."""
+        self.directory.cleanup()
+
+    def write_results(self, name, rows):
+        """Write rows as a results CSV and return its path."""
+        path = os.path.join(self.directory.name, name)
+        with open(path, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=COLUMNS)
+            writer.writeheader()
+            writer.writerows(rows)
+        return path
+
+    def run_compare(self, results, *options):
+        """Run 'baseline.py compare' against the 'base' revision and return its exit status."""
+        argv = ['baseline.py', '--baseline-file', self.baseline_file, 'compare',
+                '--results', results, '--baseline', 'base', *options]
+        with mock.patch.object(sys, 'argv', argv), redirect_stdout(io.StringIO()):
+            return baseline.main()
+
+    def save_base(self):
+        """Store a baseline where Intro and Quick both finished."""
+        results = self.write_results('base.csv', [ok_row('Intro'), ok_row('Quick')])
+        baseline.save_baseline(results, self.baseline_file, 'base')
+
+    def test_unchanged_results_pass(self):
+        """Test that identical results pass the gate."""
+        self.save_base()
+        results = self.write_results('new.csv', [ok_row('Intro'), ok_row('Quick')])
+        self.assertEqual(self.run_compare(results), 0)
+
+    def test_slowdown_and_comparisons_fail(self):
+        """Test that a significant slowdown or a comparison count change fails the gate."""
+        self.save_base()
+        results = self.write_results('new.csv', [ok_row('Intro', time_ms=20.0),
+                                                 ok_row('Quick', comparisons=2000)])
+        current = baseline.read_results(results)
+        entries = baseline.load_baselines(self.baseline_file)['base']['entries']
+        kinds = {(key, kind) for key, kind, _ in baseline.compare_entries(entries, current)}
+        self.assertEqual(kinds, {('Intro|random_1000|1000', 'slowdown'),
+                                 ('Quick|random_1000|1000', 'comparisons')})
+        self.assertEqual(self.run_compare(results), 1)
+
+    def test_timeout_fails_even_with_allow_missing(self):
+        """Test that a timed-out cell is reported as a timeout and always fails."""
+        self.save_base()
+        results = self.write_results('new.csv', [ok_row('Intro'),
+                                                 failed_row('Quick', 'timeout', 'exceeded 600 s')])
+        current = baseline.read_results(results)
+        entries = baseline.load_baselines(self.baseline_file)['base']['entries']
+        findings = baseline.compare_entries(entries, current)
+        self.assertEqual(findings, [('Quick|random_1000|1000', 'timeout', 'exceeded 600 s')])
+        self.assertEqual(self.run_compare(results), 1)
+        self.assertEqual(self.run_compare(results, '--allow-missing'), 1)
+
+    def test_error_in_new_cell_fails(self):
+        """Test that a failed cell fails the gate even when the baseline does not have it."""
+        self.save_base()
+        results = self.write_results('new.csv', [ok_row('Intro'), ok_row('Quick'),
+                                                 failed_row('Tim', 'error', 'MemoryError: ')])
+        self.assertEqual(self.run_compare(results, '--allow-missing'), 1)
+
+    def test_missing_cell(self):
+        """Test that a missing cell fails unless --allow-missing is given."""
+        self.save_base()
+        results = self.write_results('new.csv', [ok_row('Intro')])
+        self.assertEqual(self.run_compare(results), 1)
+        self.assertEqual(self.run_compare(results, '--allow-missing'), 0)
+
+    def test_save_skips_failed_rows(self):
+        """Test that failed and timed-out rows are not stored in a baseline."""
+        results = self.write_results('base.csv', [ok_row('Intro'),
+                                                  failed_row('Quick', 'timeout', 'exceeded 600 s'),
+                                                  failed_row('Tim', 'error', 'ValueError: bad')])
+        baseline.save_baseline(results, self.baseline_file, 'base')
+        with open(self.baseline_file) as f:
+            entries = json.load(f)['base']['entries']
+        self.assertEqual(list(entries), ['Intro|random_1000|1000'])
+        self.assertEqual(entries['Intro|random_1000|1000']['time_uninstrumented_ms'], 10.0)
+
+    def test_results_without_status_column(self):
+        """Test that results written before statuses were recorded count as finished."""
+        path = os.path.join(self.directory.name, 'old.csv')
+        with open(path, 'w', newline='') as f:
+            f.write("algorithm,dataset,size,time_uninstrumented_ms\nIntro,random_1000,1000,5.0\n")
+        entries = baseline.read_results(path)
+        self.assertEqual(entries['Intro|random_1000|1000']['status'], 'ok')
+
+
+if __name__ == "__main__":
+    unittest.main()
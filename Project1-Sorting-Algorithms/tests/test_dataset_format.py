@@ -0,0 +1,118 @@
+# test_dataset_format.py
+
+"""
+Tests for the binary dataset format in data/dataset_format.py.
+
+Run from Project1-Sorting-Algorithms with: python -m pytest tests
+"""
+
+import json
+import os
+import struct
+import sys
+import tempfile
+import unittest
+from array import array
+
+# Add the project directory to the path so we can import the sorting modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.dataset_format import (HEADER, HEADER_SIZE, MAGIC, VERSION, BinaryDatasetWriter,
+                                 DatasetFormatError, convert_json_dataset, load_binary_dataset,
+                                 open_binary_dataset, read_header, save_binary_dataset)
+
+VALUES = [5, -3, 0, 2 ** 63 - 1, -2 ** 63, 42]
+
+
+class TestBinaryDataset(unittest.TestCase):
+    """Test writing, reading and validating binary datasets."""
+
+    def setUp(self):
+        """Create a scratch directory."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'data.bin')
+
+    def tearDown(self):
+        """Remove the scratch directory."""
+        self.directory.cleanup()
+
+    def test_header_layout(self):
+        """Test the 16-byte little-endian header and payload size."""
+        save_binary_dataset(VALUES, self.path)
+        with open(self.path, 'rb') as f:
+            raw = f.read()
+        self.assertEqual(HEADER_SIZE, 16)
+        self.assertEqual(raw[:4], MAGIC)
+        self.assertEqual(struct.unpack('<H', raw[4:6])[0], VERSION)
+        self.assertEqual(raw[6:7], b'q')
+        self.assertEqual(struct.unpack('<Q', raw[8:16])[0], len(VALUES))
+        self.assertEqual(len(raw), HEADER_SIZE + 8 * len(VALUES))
+        self.assertEqual(list(struct.unpack(f'<{len(VALUES)}q', raw[16:])), VALUES)
+
+    def test_round_trips(self):
+        """Test that save/load and save/open return the same values."""
+        for values in ([], [7], VALUES, list(range(-1000, 1000))):
+            with self.subTest(size=len(values)):
+                save_binary_dataset(values, self.path)
+                self.assertEqual(list(load_binary_dataset(self.path)), values)
+                with open_binary_dataset(self.path) as dataset:
+                    self.assertEqual(len(dataset), len(values))
+                    self.assertEqual(dataset.to_list(), values)
+                    self.assertEqual(dataset.to_array(), array('q', values))
+
+    def test_incremental_writer(self):
+        """Test write() and write_block() mixed, with a small block size."""
+        with BinaryDatasetWriter(self.path, block_size=4) as writer:
+            for value in range(10):
+                writer.write(value)
+            writer.write_block(array('q', [100, 101]))
+            writer.write_block([200])
+            writer.write(300)
+        self.assertEqual(list(load_binary_dataset(self.path)), list(range(10)) + [100, 101, 200, 300])
+        with open(self.path, 'rb') as f:
+            self.assertEqual(read_header(f), 14)
+
+    def test_mapped_view_is_copy_on_write(self):
+        """Test that sorting the mapped view leaves the file unchanged."""
+        save_binary_dataset(VALUES, self.path)
+        with open_binary_dataset(self.path) as dataset:
+            dataset.view[0] = 99
+            self.assertEqual(dataset.view[0], 99)
+        self.assertEqual(list(load_binary_dataset(self.path)), VALUES)
+
+    def test_convert_json_dataset(self):
+        """Test converting a JSON dataset next to the original file."""
+        json_path = os.path.join(self.directory.name, 'random_6.json')
+        with open(json_path, 'w') as f:
+            json.dump(VALUES, f)
+        bin_path = convert_json_dataset(json_path)
+        self.assertEqual(bin_path, os.path.join(self.directory.name, 'random_6.bin'))
+        self.assertEqual(list(load_binary_dataset(bin_path)), VALUES)
+
+    def test_invalid_files(self):
+        """Test that bad headers and truncated payloads raise DatasetFormatError."""
+        good_header = HEADER.pack(MAGIC, VERSION, b'q', 2)
+        cases = {
+            'too short': b'SRTD',
+            'bad magic': HEADER.pack(b'JSON', VERSION, b'q', 0),
+            'bad version': HEADER.pack(MAGIC, VERSION + 1, b'q', 0),
+            'bad typecode': HEADER.pack(MAGIC, VERSION, b'd', 0),
+            'truncated payload': good_header + struct.pack('<q', 1),
+        }
+        for name, raw in cases.items():
+            with open(self.path, 'wb') as f:
+                f.write(raw)
+            with self.subTest(case=name, loader='load'):
+                with self.assertRaises(DatasetFormatError):
+                    load_binary_dataset(self.path)
+            with self.subTest(case=name, loader='open'):
+                with self.assertRaises(DatasetFormatError):
+                    open_binary_dataset(self.path)
+
+    def test_format_error_is_value_error(self):
+        """Test that callers catching ValueError also catch format errors."""
+        self.assertTrue(issubclass(DatasetFormatError, ValueError))
+
+
+if __name__ == "__main__":
+    unittest.main()
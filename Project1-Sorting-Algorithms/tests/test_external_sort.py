@@ -0,0 +1,196 @@
+# test_external_sort.py
+
+"""
+Tests for the external-memory Merge Sort in part2/external_sort.py.
+
+Run from Project1-Sorting-Algorithms with: python -m pytest tests
+"""
+
+import json
+import os
+import random
+import sys
+import tempfile
+import unittest
+from array import array
+from unittest import mock
+
+# Add the project directory to the path so we can import the sorting modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from part2 import external_sort as es
+from data.dataset_format import load_binary_dataset, save_binary_dataset
+
+# Bytes of memory budget per integer held in an in-memory run
+BUDGET_PER_ELEMENT = es.LIST_BYTES_PER_ELEMENT
+
+
+def write_input(path, values):
+    """Write values to path in the format given by its extension."""
+    extension = os.path.splitext(path)[1]
+    if extension == '.bin':
+        save_binary_dataset(values, path)
+    elif extension == '.json':
+        with open(path, 'w') as f:
+            json.dump(values, f)
+    else:
+        with open(path, 'w') as f:
+            f.write('\n'.join(map(str, values)) + '\n')
+
+
+def read_output(path):
+    """Read the integers of a sorted output file."""
+    extension = os.path.splitext(path)[1]
+    if extension == '.bin':
+        return list(load_binary_dataset(path))
+    if extension == '.json':
+        with open(path) as f:
+            return json.load(f)
+    with open(path) as f:
+        return [int(line) for line in f]
+
+
+class TestExternalSort(unittest.TestCase):
+    """Test round trips through every format and multi-pass merges."""
+
+    def setUp(self):
+        """Create a scratch directory and a random dataset."""
+        self.directory = tempfile.TemporaryDirectory()
+        rng = random.Random(8)
+        self.values = [rng.randint(-10 ** 12, 10 ** 12) for _ in range(1000)] + [0, 0, -1, 1]
+
+    def tearDown(self):
+        """Remove the scratch directory."""
+        self.directory.cleanup()
+
+    def path(self, name):
+        """Return the path of a file in the scratch directory."""
+        return os.path.join(self.directory.name, name)
+
+    def test_round_trips(self):
+        """Test every input format against every output format."""
+        for source in ('.bin', '.json', '.txt'):
+            input_path = self.path('input' + source)
+            write_input(input_path, self.values)
+            for target in ('.bin', '.json', '.txt'):
+                with self.subTest(source=source, target=target):
+                    output_path = self.path('output' + target)
+                    stats = es.external_sort(input_path, output_path, stats={'comparisons': 0, 'swaps': 0})
+                    self.assertEqual(read_output(output_path), sorted(self.values))
+                    self.assertEqual(stats['elements'], len(self.values))
+                    self.assertEqual(stats['runs'], 1)
+
+    def test_multi_pass_merge(self):
+        """Test a budget that forces many runs and a fan-in that forces several passes."""
+        input_path = self.path('input.txt')
+        write_input(input_path, self.values)
+        for fan_in in (2, 3, 64):
+            with self.subTest(fan_in=fan_in):
+                output_path = self.path('output.bin')
+                stats = es.external_sort(input_path, output_path, memory_budget=50 * BUDGET_PER_ELEMENT,
+                                         fan_in=fan_in, stats={'comparisons': 0, 'swaps': 0})
+                self.assertEqual(read_output(output_path), sorted(self.values))
+                self.assertEqual(stats['runs'], 21)
+                expected_passes = {2: 5, 3: 3, 64: 1}[fan_in]
+                self.assertEqual(stats['merge_passes'], expected_passes)
+
+    def test_empty_input(self):
+        """Test that an empty file sorts into an empty file."""
+        for source, target in (('.json', '.bin'), ('.txt', '.json'), ('.bin', '.txt')):
+            with self.subTest(source=source, target=target):
+                input_path = self.path('empty' + source)
+                write_input(input_path, [])
+                output_path = self.path('output' + target)
+                es.external_sort(input_path, output_path)
+                self.assertEqual(read_output(output_path), [])
+
+    def test_headerless_binary_input(self):
+        """Test that raw packed int64 input is accepted."""
+        input_path = self.path('raw.bin')
+        with open(input_path, 'wb') as f:
+            array('q', self.values).tofile(f)
+        output_path = self.path('output.bin')
+        es.external_sort(input_path, output_path, memory_budget=100 * BUDGET_PER_ELEMENT)
+        self.assertEqual(read_output(output_path), sorted(self.values))
+
+    def test_text_split_across_blocks(self):
+        """Test that numbers split between text blocks are read whole."""
+        input_path = self.path('input.json')
+        write_input(input_path, self.values)
+        for block_size in (1, 2, 7, 64):
+            with self.subTest(block_size=block_size), mock.patch.object(es, 'TEXT_BLOCK_SIZE', block_size):
+                values = [value for block in es.read_text_blocks(input_path) for value in block]
+                self.assertEqual(values, self.values)
+
+    def test_chunk_sizes(self):
+        """Test that read_chunks() yields full chunks and one shorter last chunk."""
+        input_path = self.path('input.txt')
+        write_input(input_path, self.values)
+        for chunk_size in (1, 3, 100, 5000):
+            with self.subTest(chunk_size=chunk_size), mock.patch.object(es, 'TEXT_BLOCK_SIZE', 100):
+                chunks = list(es.read_chunks(input_path, chunk_size))
+                self.assertTrue(all(len(chunk) == chunk_size for chunk in chunks[:-1]))
+                self.assertEqual([value for chunk in chunks for value in chunk], self.values)
+
+    def test_invalid_arguments(self):
+        """Test that unsupported formats and a fan-in below 2 are rejected."""
+        input_path = self.path('input.txt')
+        write_input(input_path, self.values)
+        with self.assertRaises(ValueError):
+            es.external_sort(input_path, self.path('output.csv'))
+        with self.assertRaises(ValueError):
+            es.external_sort(self.path('input.csv'), self.path('output.txt'))
+        with self.assertRaises(ValueError):
+            es.external_sort(input_path, self.path('output.txt'), fan_in=1)
+
+
+class TestTextParsing(unittest.TestCase):
+    """Test which text inputs are accepted as integers."""
+
+    def test_valid_text(self):
+        """Test the separators and signs that are accepted."""
+        cases = [
+            (b'[-10, 20, -30]', [-10, 20, -30]),
+            (b'1\n2\r\n-3\t4 ', [1, 2, -3, 4]),
+            (b'[]', []),
+            (b'', []),
+            (b'-0', [0]),
+            (b'123456789012345678', [123456789012345678]),
+        ]
+        for text, expected in cases:
+            with self.subTest(text=text):
+                self.assertEqual(es.tokenize_integers(text), expected)
+
+    def test_invalid_text(self):
+        """Test that non-integer input is rejected with the offset of the first bad byte."""
+        cases = [
+            (b'[1.5, 2e3, --5]', 2),
+            (b'2e3', 1),
+            (b'1-2', 1),
+            (b'--5', 0),
+            (b'-', 0),
+            (b'5-', 1),
+            (b'- 4', 0),
+            (b'1, x', 3),
+            (b'NaN', 0),
+            (b'"1"', 0),
+        ]
+        for text, position in cases:
+            with self.subTest(text=text):
+                with self.assertRaisesRegex(ValueError, f"at byte {position + 100}:"):
+                    es.tokenize_integers(text, offset=100)
+
+    def test_invalid_file_is_not_sorted(self):
+        """Test that a bad file fails the sort, at the right offset, for any block size."""
+        with tempfile.TemporaryDirectory() as directory:
+            input_path = os.path.join(directory, 'input.json')
+            with open(input_path, 'w') as f:
+                f.write('[1, 2, 3, 44, 5.5, 6]')
+            for block_size in (1, 3, 1024):
+                with self.subTest(block_size=block_size), mock.patch.object(es, 'TEXT_BLOCK_SIZE', block_size):
+                    with self.assertRaisesRegex(ValueError, "at byte 15:"):
+                        es.external_sort(input_path, os.path.join(directory, 'output.bin'))
+
+
+if __name__ == "__main__":
+    unittest.main()
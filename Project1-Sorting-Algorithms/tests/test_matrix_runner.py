@@ -0,0 +1,67 @@
+# test_matrix_runner.py
+
+"""
+Tests for the process-per-cell benchmark runner in part2/matrix_runner.py.
+
+Run from Project1-Sorting-Algorithms with: python -m pytest tests
+"""
+
+import csv
+import io
+import os
+import sys
+import tempfile
+import time
+import unittest
+from contextlib import redirect_stdout
+
+# Add the project directory to the path so we can import the sorting modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from part2.matrix_runner import run_matrix
+
+FIELDNAMES = ['algorithm', 'dataset', 'size', 'time_ms']
+
+
+def cell_worker(outcome):
+    """Worker run in each cell: finish, raise or run past the timeout."""
+    if outcome == 'raise':
+        raise ValueError("bad dataset")
+    if outcome == 'sleep':
+        time.sleep(30)
+    return {'algorithm': 'Intro', 'dataset': 'random_3', 'size': 3, 'time_ms': 1.5}
+
+
+class TestRunMatrix(unittest.TestCase):
+    """Test statuses and key columns of the rows written by run_matrix()."""
+
+    def test_failed_cells_keep_key_columns(self):
+        """Test that error and timeout rows are written with the cell's key columns."""
+        cells = [({'algorithm': 'Intro', 'dataset': 'random_3', 'size': 3}, (outcome,))
+                 for outcome in ('finish', 'raise', 'sleep')]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'results.csv')
+            with redirect_stdout(io.StringIO()):
+                rows = run_matrix(cells, cell_worker, FIELDNAMES, path, jobs=3, timeout=2)
+            with open(path, newline='') as f:
+                written = list(csv.DictReader(f))
+
+        self.assertEqual(sorted(row['status'] for row in rows), ['error', 'ok', 'timeout'])
+        self.assertEqual(len(written), 3)
+        for row in written:
+            self.assertEqual((row['algorithm'], row['dataset'], row['size']),
+                             ('Intro', 'random_3', '3'))
+        errors = {row['status']: row['error'] for row in written}
+        self.assertEqual(errors['error'], "ValueError: bad dataset")
+        self.assertEqual(errors['ok'], '')
+
+    def test_jobs_must_be_positive(self):
+        """Test that a job count below 1 is rejected instead of waiting forever."""
+        with tempfile.TemporaryDirectory() as directory:
+            for jobs in (0, -1):
+                with self.assertRaises(ValueError):
+                    run_matrix([], cell_worker, FIELDNAMES, os.path.join(directory, 'r.csv'), jobs)
+
+
+if __name__ == "__main__":
+    unittest.main()
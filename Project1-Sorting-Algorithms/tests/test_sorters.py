@@ -0,0 +1,292 @@
+# test_sorters.py
+
+"""
+Tests for the part2 sorters: sortedness, key=/reverse= stability and index ranges.
+
+Every sorter is checked against sorted() on lists, array('q') objects and memoryviews,
+both instrumented (with a stats dictionary) and on its uninstrumented fast path.
+
+Run from Project1-Sorting-Algorithms with: python -m pytest tests
+"""
+
+import os
+import random
+import sys
+import unittest
+from array import array
+from bisect import bisect_left, bisect_right
+from functools import partial
+from operator import itemgetter
+
+# Add the project directory to the path so we can import the sorting modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from part2.quicksort import quicksort, quicksort_three_way, quicksort_iterative
+from part2.mergesort import mergesort, mergesort_bottom_up
+from part2.heapsort import heapsort, heapsort_bottom_up
+from part2.insertionsort import insertionsort, insertionsort_with_binary_search, insertionsort_block_move
+from part2.introsort import introsort
+from part2.timsort import timsort, gallop_left, gallop_right
+from part2.parallel_sort import parallel_mergesort, parallel_samplesort
+from part2.radixsort import counting_sort, radix_sort, integer_sort
+from part2.auto_sort import auto_sort
+from part2.key_sort import multi_key_sort
+
+SORTERS = [
+    ('quicksort', quicksort),
+    ('quicksort_three_way', quicksort_three_way),
+    ('quicksort_iterative', quicksort_iterative),
+    ('mergesort', mergesort),
+    ('mergesort_bottom_up', mergesort_bottom_up),
+    ('heapsort', heapsort),
+    ('heapsort_bottom_up', heapsort_bottom_up),
+    ('heapsort_bottom_up arity 3', partial(heapsort_bottom_up, arity=3)),
+    ('heapsort_bottom_up arity 4', partial(heapsort_bottom_up, arity=4)),
+    ('insertionsort', insertionsort),
+    ('insertionsort_with_binary_search', insertionsort_with_binary_search),
+    ('insertionsort_block_move', insertionsort_block_move),
+    ('introsort', introsort),
+    ('timsort', timsort),
+    ('parallel_mergesort', parallel_mergesort),
+    ('parallel_samplesort', parallel_samplesort),
+    ('counting_sort', counting_sort),
+    ('radix_sort', radix_sort),
+    ('integer_sort', integer_sort),
+    ('auto_sort', auto_sort),
+]
+
+# Sorters taking low/high to sort only part of the array
+RANGE_SORTERS = [
+    ('quicksort', quicksort),
+    ('quicksort_three_way', quicksort_three_way),
+    ('quicksort_iterative', quicksort_iterative),
+]
+
+
+def datasets():
+    """Return (name, values) pairs covering the shapes the benchmark uses."""
+    rng = random.Random(34)
+    return [
+        ('empty', []),
+        ('single', [7]),
+        ('two elements', [2, 1]),
+        ('random', [rng.randint(-1000, 1000) for _ in range(500)]),
+        ('duplicates', [rng.randint(0, 9) for _ in range(500)]),
+        ('sorted', list(range(300))),
+        ('reverse sorted', list(range(300, 0, -1))),
+        ('constant', [42] * 200),
+        ('sawtooth', [i % 37 for i in range(600)]),
+    ]
+
+
+def containers(values):
+    """Return (name, container) pairs holding values as each supported sequence type."""
+    return [
+        ('list', list(values)),
+        ('array', array('q', values)),
+        ('memoryview', memoryview(array('q', values))),
+    ]
+
+
+def run_sorter(sorter, arr, **kwargs):
+    """Run a sorter and return the sorted elements, whether it sorted in-place or not."""
+    result = sorter(arr, **kwargs)
+    # Merge Sort returns a new list; the in-place sorters return None or their stats
+    return list(result) if isinstance(result, list) else list(arr)
+
+
+class TestSorters(unittest.TestCase):
+    """Test every sorter against sorted()."""
+
+    def test_sorted_order(self):
+        """Test sortedness on every input type, with and without stats."""
+        for name, sorter in SORTERS:
+            for data_name, values in datasets():
+                for kind, arr in containers(values):
+                    for stats in (None, {'comparisons': 0, 'swaps': 0}):
+                        with self.subTest(sorter=name, data=data_name, kind=kind,
+                                          instrumented=stats is not None):
+                            self.assertEqual(run_sorter(sorter, arr, stats=stats), sorted(values))
+
+    def test_stats_are_returned(self):
+        """Test that in-place sorters return the stats dictionary they were given."""
+        for name, sorter in SORTERS:
+            if sorter is mergesort:
+                continue
+            with self.subTest(sorter=name):
+                stats = {'comparisons': 0, 'swaps': 0}
+                self.assertIs(sorter([3, 1, 2], stats=stats), stats)
+                self.assertIsNone(sorter([3, 1, 2]))
+
+    def test_key_and_reverse_are_stable(self):
+        """Test that key= and reverse= keep equal keys in their original order."""
+        rng = random.Random(11)
+        values = [rng.randint(-200, 200) for _ in range(400)]
+        for name, sorter in SORTERS:
+            for reverse in (False, True):
+                for kind, arr in containers(values):
+                    with self.subTest(sorter=name, reverse=reverse, kind=kind):
+                        # Many values share a key, so an unstable order shows up
+                        expected = sorted(values, key=lambda v: v // 10, reverse=reverse)
+                        self.assertEqual(run_sorter(sorter, arr, key=lambda v: v // 10,
+                                                    reverse=reverse), expected)
+
+    def test_records(self):
+        """Test sorting records by a non-integer key, stably."""
+        rng = random.Random(5)
+        records = [{'id': i, 'event': rng.choice(['Concert', 'Sports', 'Theater'])}
+                   for i in range(200)]
+        for name, sorter in SORTERS:
+            if name in ('counting_sort', 'radix_sort', 'integer_sort'):
+                continue
+            for reverse in (False, True):
+                with self.subTest(sorter=name, reverse=reverse):
+                    arr = list(records)
+                    expected = sorted(records, key=itemgetter('event'), reverse=reverse)
+                    self.assertEqual(run_sorter(sorter, arr, key=itemgetter('event'),
+                                                reverse=reverse), expected)
+
+    def test_key_calls(self):
+        """Test that the key function is called once per element."""
+        calls = []
+
+        def key(value):
+            calls.append(value)
+            return -value
+
+        for name, sorter in SORTERS:
+            with self.subTest(sorter=name):
+                calls.clear()
+                self.assertEqual(run_sorter(sorter, list(range(50)), key=key), list(range(49, -1, -1)))
+                self.assertEqual(len(calls), 50)
+
+    def test_multi_key_sort(self):
+        """Test several keys, each with its own direction."""
+        rng = random.Random(8)
+        records = [(rng.randint(0, 3), rng.randint(0, 3), i) for i in range(100)]
+        arr = list(records)
+        multi_key_sort(arr, [itemgetter(0), (itemgetter(1), True)], algorithm=quicksort)
+        expected = sorted(sorted(records, key=itemgetter(1), reverse=True), key=itemgetter(0))
+        self.assertEqual(arr, expected)
+
+
+class TestTimsort(unittest.TestCase):
+    """Test the galloping search and merges shared by both Tim Sort paths."""
+
+    def test_gallop_matches_bisect(self):
+        """Test gallop_left()/gallop_right() against bisect from every starting hint."""
+        a = [0, 1, 1, 1, 3, 5, 5, 8, 13, 13, 13, 13, 21]
+        for base, length in ((0, len(a)), (2, 7), (4, 1)):
+            segment = a[base:base + length]
+            for key in range(-1, 23):
+                for hint in range(length):
+                    with self.subTest(base=base, length=length, key=key, hint=hint):
+                        self.assertEqual(gallop_left(key, a, base, length, hint)[0],
+                                         bisect_left(segment, key))
+                        self.assertEqual(gallop_right(key, a, base, length, hint)[0],
+                                         bisect_right(segment, key))
+
+    def test_galloping_merges(self):
+        """Test inputs whose runs interleave in long blocks, so merges gallop."""
+        rng = random.Random(2)
+        runs = [sorted(rng.randint(0, 10 ** 6) for _ in range(rng.randint(100, 3000)))
+                for _ in range(12)]
+        values = [value for run in runs for value in run]
+        blocks = list(range(2000)) + list(range(1000, 3000)) + list(range(500, 800)) * 3
+        for data_name, data in (('runs', values), ('blocks', blocks)):
+            with self.subTest(data=data_name):
+                fast = list(data)
+                timsort(fast)
+                stats = {'comparisons': 0, 'swaps': 0}
+                counted = list(data)
+                timsort(counted, stats)
+                self.assertEqual(fast, sorted(data))
+                self.assertEqual(counted, sorted(data))
+
+
+class TestIntegerSorters(unittest.TestCase):
+    """Test how the integer-only sorters handle keys that are not ints."""
+
+    def test_non_integer_keys_are_rejected(self):
+        """Test that Counting Sort and Radix Sort name the caller's key type."""
+        for name, sorter in (('counting_sort', counting_sort), ('radix_sort', radix_sort)):
+            for kwargs in ({}, {'key': lambda v: v}, {'reverse': True}, {'key': lambda v: v * 2}):
+                with self.subTest(sorter=name, kwargs=sorted(kwargs)):
+                    with self.assertRaisesRegex(TypeError, f"{name} requires integer keys, got float"):
+                        sorter([1.5, 0.5, 2.5], **kwargs)
+            with self.subTest(sorter=name, key='float of int'):
+                with self.assertRaisesRegex(TypeError, "got float"):
+                    sorter([3, 1, 2], key=lambda v: v / 2)
+
+    def test_integer_sort_falls_back(self):
+        """Test that integer_sort() sorts non-integer input with a comparison sort."""
+        values = [2.5, -1.0, 0.5] * 50
+        for kwargs in ({}, {'key': lambda v: -v}, {'reverse': True}):
+            with self.subTest(kwargs=sorted(kwargs)):
+                arr = list(values)
+                integer_sort(arr, **kwargs)
+                self.assertEqual(arr, sorted(values, key=kwargs.get('key'),
+                                             reverse=kwargs.get('reverse', False)))
+
+    def test_wide_key_range(self):
+        """Test that Counting Sort handles a key range far wider than the input."""
+        values = [10 ** 15, -10 ** 15, 0, 7, 10 ** 15]
+        for kwargs in ({}, {'key': lambda v: -v}, {'reverse': True}):
+            with self.subTest(kwargs=sorted(kwargs)):
+                arr = list(values)
+                counting_sort(arr, **kwargs)
+                self.assertEqual(arr, sorted(values, key=kwargs.get('key'),
+                                             reverse=kwargs.get('reverse', False)))
+
+
+class TestRanges(unittest.TestCase):
+    """Test low/high on the Quick Sort variants, alone and combined with key=."""
+
+    def test_range_only(self):
+        """Test that only arr[low..high] is sorted."""
+        values = [9, 8, 7, 6, 5, 4, 3, 2, 1]
+        for name, sorter in RANGE_SORTERS:
+            for kind, arr in containers(values):
+                for stats in (None, {'comparisons': 0, 'swaps': 0}):
+                    with self.subTest(sorter=name, kind=kind, instrumented=stats is not None):
+                        sorter(arr, 2, 5, stats=stats)
+                        self.assertEqual(list(arr), [9, 8, 4, 5, 6, 7, 3, 2, 1])
+
+    def test_range_with_key(self):
+        """Test that key= and reverse= sort only arr[low..high] too."""
+        values = [9, 8, 7, 6, 5, 4, 3, 2, 1]
+        for name, sorter in RANGE_SORTERS:
+            for kind, arr in containers(values):
+                with self.subTest(sorter=name, kind=kind, reverse=False):
+                    sorter(arr, 2, 5, key=lambda v: v)
+                    self.assertEqual(list(arr), [9, 8, 4, 5, 6, 7, 3, 2, 1])
+                with self.subTest(sorter=name, kind=kind, reverse=True):
+                    sorter(arr, 1, 6, reverse=True)
+                    self.assertEqual(list(arr), [9, 8, 7, 6, 5, 4, 3, 2, 1])
+
+    def test_range_with_key_is_stable(self):
+        """Test stability within a range sorted by key."""
+        records = [(i % 3, i) for i in range(12)]
+        for name, sorter in RANGE_SORTERS:
+            with self.subTest(sorter=name):
+                arr = list(records)
+                sorter(arr, 3, 10, key=itemgetter(0))
+                expected = records[:3] + sorted(records[3:11], key=itemgetter(0)) + records[11:]
+                self.assertEqual(arr, expected)
+
+    def test_range_defaults(self):
+        """Test that a key sort with only low or only high covers the rest of the array."""
+        for name, sorter in RANGE_SORTERS:
+            with self.subTest(sorter=name):
+                arr = [5, 4, 3, 2, 1]
+                sorter(arr, low=2, key=lambda v: v)
+                self.assertEqual(arr, [5, 4, 1, 2, 3])
+                arr = [5, 4, 3, 2, 1]
+                sorter(arr, high=2, reverse=True)
+                self.assertEqual(arr, [5, 4, 3, 2, 1])
+                sorter(arr, high=2, key=lambda v: v)
+                self.assertEqual(arr, [3, 4, 5, 2, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,170 @@
+# benchmark_graph.py
+
+"""
+Benchmark of the two graph representations in graph_utils.py
+
+Builds a synthetic road network (a grid of intersections with random distances, plus
+a few long roads across it), then compares the dict graph with the CSRGraph:
+- memory held by the built graph (tracemalloc)
+- time to build the graph from the CSV file
+- time for random is_route_possible and find_shortest_path queries, and one plan_delivery
+
+Usage:
+    python benchmark_graph.py --sides 100 300 --queries 30
+"""
+
+import argparse
+import csv
+import gc
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+from graph_utils import build_graph, is_route_possible, find_shortest_path, plan_delivery
+
+
+def write_grid_network(filename, side, seed=0):
+    """
+    Write a side x side grid road network to a CSV file
+
+    Args:
+        filename (str): Path of the CSV file to write
+        side (int): Number of intersections along each side of the grid
+        seed (int): Seed for the random distances
+
+    Returns:
+        int: Number of roads written
+    """
+    rng = random.Random(seed)
+    roads = 0
+    with open(filename, 'w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(['source', 'destination', 'distance'])
+        for row in range(side):
+            for col in range(side):
+                if col + 1 < side:
+                    writer.writerow([f"N{row}_{col}", f"N{row}_{col + 1}", rng.randint(1, 20)])
+                    roads += 1
+                if row + 1 < side:
+                    writer.writerow([f"N{row}_{col}", f"N{row + 1}_{col}", rng.randint(1, 20)])
+                    roads += 1
+        # Long roads between random intersections, like highways
+        for _ in range(side):
+            writer.writerow([f"N{rng.randrange(side)}_{rng.randrange(side)}",
+                             f"N{rng.randrange(side)}_{rng.randrange(side)}", rng.randint(20, 200)])
+            roads += 1
+    return roads
+
+
+def measure_memory(filename, compact):
+    """
+    Measure the memory held by a graph built from filename
+
+    Args:
+        filename (str): Path to the road network CSV file
+        compact (bool): Build a CSRGraph instead of a dictionary
+
+    Returns:
+        int: Bytes still allocated once the graph is built
+    """
+    gc.collect()
+    tracemalloc.start()
+    graph = build_graph(filename, compact=compact)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del graph
+    return retained
+
+
+def time_call(function, *args):
+    """
+    Time one call of function
+
+    Returns:
+        tuple: (result, seconds)
+    """
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def run_benchmark(side, queries, seed=0):
+    """
+    Compare the dict graph and the CSRGraph on one grid network
+
+    Args:
+        side (int): Grid side; the network has side * side locations
+        queries (int): Number of random route and shortest path queries
+        seed (int): Seed for the network and the queries
+
+    Returns:
+        list: One result dictionary per representation
+    """
+    fd, filename = tempfile.mkstemp(suffix='.csv')
+    os.close(fd)
+    try:
+        roads = write_grid_network(filename, side, seed)
+        rng = random.Random(seed)
+        locations = [f"N{rng.randrange(side)}_{rng.randrange(side)}" for _ in range(2 * queries)]
+        pairs = list(zip(locations[::2], locations[1::2]))
+        depot, deliveries = locations[0], locations[1:6]
+
+        results = []
+        distances = {}
+        for name, compact in [('dict', False), ('csr', True)]:
+            graph, build_seconds = time_call(build_graph, filename, compact)
+
+            start = time.perf_counter()
+            for a, b in pairs:
+                is_route_possible(graph, a, b)
+            route_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            distances[name] = [find_shortest_path(graph, a, b)[0] for a, b in pairs]
+            path_seconds = time.perf_counter() - start
+
+            (plan_distance, _), plan_seconds = time_call(plan_delivery, graph, depot, deliveries)
+            distances[name].append(plan_distance)
+            del graph
+
+            results.append({
+                'graph': name,
+                'locations': side * side,
+                'roads': roads,
+                'memory_mb': measure_memory(filename, compact) / 2 ** 20,
+                'build_s': build_seconds,
+                'route_ms': route_seconds / queries * 1000,
+                'path_ms': path_seconds / queries * 1000,
+                'plan_s': plan_seconds,
+            })
+
+        # Both representations must find the same distances
+        for result in results:
+            result['same_distances'] = distances['dict'] == distances['csr']
+        return results
+    finally:
+        os.remove(filename)
+
+
+def main():
+    """Run the benchmark for each grid size and print a table"""
+    parser = argparse.ArgumentParser(description="Compare the dict graph with the CSR graph.")
+    parser.add_argument('--sides', type=int, nargs='+', default=[100, 300],
+                        help="grid sides to benchmark (side * side locations)")
+    parser.add_argument('--queries', type=int, default=30,
+                        help="random queries per grid")
+    args = parser.parse_args()
+
+    columns = ['graph', 'locations', 'roads', 'memory_mb', 'build_s', 'route_ms', 'path_ms',
+               'plan_s', 'same_distances']
+    print(" ".join(f"{column:>14}" for column in columns))
+    for side in args.sides:
+        for result in run_benchmark(side, args.queries):
+            print(" ".join(f"{result[column]:>14.3f}" if isinstance(result[column], float)
+                           else f"{str(result[column]):>14}" for column in columns))
+
+
+if __name__ == "__main__":
+    main()
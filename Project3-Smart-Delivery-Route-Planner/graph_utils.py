@@ -12,13 +12,128 @@ GitHub repo: https://github.com/jurinho17-sv/Data-Structures-and-Advanced-Python
 """
 Graph utilities for Smart Delivery Route Planner
 Handles graph construction and path-finding algorithms
+
+Two graph representations are supported:
+- dict (default): adjacency list as a dictionary of dictionaries keyed by location name
+- CSRGraph (build_graph(filename, compact=True)): compressed sparse row arrays with
+  locations interned as integer ids, for road networks too large for dictionaries
+
+is_route_possible, find_shortest_path and plan_delivery accept either representation.
 """
 
 import csv
 import heapq
+from array import array
 from collections import deque
 
 
+class CSRGraph:
+    """
+    Undirected road network in compressed sparse row (CSR) form
+
+    Every location name is interned once as an integer id (its position in names).
+    The roads leaving node u are targets[offsets[u]:offsets[u + 1]], with their distances
+    at the same positions in weights. Each edge costs 12 bytes per direction in typed
+    arrays, instead of a dictionary entry holding a string key and an int object.
+
+    Roads listed more than once are all kept, so find_shortest_path uses the shortest
+    of them (the dict representation keeps the distance listed last).
+
+    The graph also answers `name in graph`, len(graph), keys() and iteration over
+    location names, like the dict representation.
+    """
+
+    def __init__(self, names, offsets, targets, weights, ids=None):
+        """
+        Args:
+            names (list): Location name of each node id
+            offsets (array): Start of each node's roads in targets, plus the total at the end
+            targets (array): Node id at the other end of each road
+            weights (array): Distance of each road
+            ids (dict): Node id of each location name (optional; built from names if omitted)
+        """
+        self.names = names
+        self.ids = ids if ids is not None else {name: node for node, name in enumerate(names)}
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        # build_graph reads integer distances; report them as ints, like the dict graph
+        self.integer_weights = all(weight.is_integer() for weight in weights)
+
+    def __contains__(self, name):
+        return name in self.ids
+
+    def __len__(self):
+        return len(self.names)
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def keys(self):
+        """Return the location names, in id order"""
+        return list(self.names)
+
+    def edge_count(self):
+        """Return the number of roads, each counted once per direction"""
+        return len(self.targets)
+
+
+def build_csr_graph(edges):
+    """
+    Build a CSRGraph from undirected roads
+    
+    Args:
+        edges (iterable): (source, destination, distance) tuples
+        
+    Returns:
+        CSRGraph: Graph with each road stored in both directions
+    """
+    ids = {}
+    names = []
+    sources = array('i')
+    destinations = array('i')
+    distances = array('d')
+    
+    # Intern location names as integer ids and keep the roads in typed arrays
+    for source, destination, distance in edges:
+        source_id = ids.get(source)
+        if source_id is None:
+            source_id = ids[source] = len(names)
+            names.append(source)
+        destination_id = ids.get(destination)
+        if destination_id is None:
+            destination_id = ids[destination] = len(names)
+            names.append(destination)
+        sources.append(source_id)
+        destinations.append(destination_id)
+        distances.append(distance)
+    
+    # Count the roads at each node (both directions), then turn counts into offsets
+    offsets = array('i', bytes(4 * (len(names) + 1)))
+    for node in sources:
+        offsets[node + 1] += 1
+    for node in destinations:
+        offsets[node + 1] += 1
+    for node in range(len(names)):
+        offsets[node + 1] += offsets[node]
+    
+    # Place every road in its source's row and its reverse in its destination's row
+    targets = array('i', bytes(4 * offsets[-1]))
+    weights = array('d', bytes(8 * offsets[-1]))
+    position = array('i', offsets[:-1])
+    for source, destination, distance in zip(sources, destinations, distances):
+        slot = position[source]
+        targets[slot] = destination
+        weights[slot] = distance
+        position[source] = slot + 1
+        slot = position[destination]
+        targets[slot] = source
+        weights[slot] = distance
+        position[destination] = slot + 1
+    
+    return CSRGraph(names, offsets, targets, weights, ids)
+
+
 def main():
     """Test the graph utility functions"""
     # Build graph from sample input
@@ -34,16 +149,20 @@ def main():
     print(f"\nShortest path from A to F: {path} (distance: {distance})")
 
 
-def build_graph(filename):
+def build_graph(filename, compact=False):
     """
     Build a graph from a CSV file containing road network data
     
     Args:
         filename (str): Path to CSV file with columns: source, destination, distance
+        compact (bool): Build a CSRGraph instead of a dictionary
         
     Returns:
-        dict: Graph as adjacency list with distances
+        dict: Graph as adjacency list with distances (CSRGraph when compact is True)
     """
+    if compact:
+        return build_compact_graph(filename)
+    
     graph = {}
     
     try:
@@ -73,6 +192,61 @@ def build_graph(filename):
     return graph
 
 
+def build_compact_graph(filename):
+    """
+    Build a CSRGraph from a CSV file containing road network data
+    
+    Args:
+        filename (str): Path to CSV file with columns: source, destination, distance
+        
+    Returns:
+        CSRGraph: Graph in compressed sparse row form (empty if the file is missing
+        or has no rows)
+    """
+    try:
+        with open(filename, 'r') as file:
+            reader = csv.reader(file)
+            header = next(reader, None)
+            
+            # An empty file has no header: no roads, like build_graph's dictionary
+            if header is None:
+                return build_csr_graph([])
+            
+            return build_csr_graph(read_roads(reader, header))
+    
+    except FileNotFoundError:
+        print(f"Error: File '{filename}' not found")
+        return build_csr_graph([])
+
+
+def read_roads(reader, header):
+    """
+    Yield the roads in the rows of a CSV reader
+    
+    Rows are looked up the way csv.DictReader does in build_graph: blank lines are
+    skipped, and a missing column raises KeyError with its name at the first row.
+    
+    Args:
+        reader: csv.reader positioned after the header row
+        header (list): Column names from the header row
+        
+    Returns:
+        generator: (source, destination, distance) tuples
+    """
+    columns = {name: index for index, name in enumerate(header)}
+    source = destination = distance = None
+    
+    for row in reader:
+        if not row:
+            continue
+        # Look the columns up by name once instead of building a dict per row
+        if source is None:
+            source = columns['source']
+            destination = columns['destination']
+            distance = columns['distance']
+        yield row[source], row[destination], int(row[distance])
+
+
 def is_route_possible(graph, start, end):
     """
     Check if a route exists between two locations using DFS
@@ -89,6 +263,9 @@ def is_route_possible(graph, start, end):
     if start not in graph or end not in graph:
         return False
     
+    if isinstance(graph, CSRGraph):
+        return is_route_possible_csr(graph, graph.ids[start], graph.ids[end])
+    
     # Initialize visited set and stack for DFS
     visited = set()
     stack = [start]
@@ -113,6 +290,38 @@ def is_route_possible(graph, start, end):
     return False
 
 
+def is_route_possible_csr(graph, start, end):
+    """
+    Check if a route exists between two node ids of a CSRGraph using DFS
+    
+    Args:
+        graph (CSRGraph): Graph representation
+        start (int): Starting node id
+        end (int): Destination node id
+        
+    Returns:
+        bool: True if route exists, False otherwise
+    """
+    offsets = graph.offsets
+    targets = graph.targets
+    
+    # One byte per node; nodes are marked when pushed so each is pushed at most once
+    visited = bytearray(len(graph))
+    visited[start] = 1
+    stack = [start]
+    
+    while stack:
+        current = stack.pop()
+        if current == end:
+            return True
+        for neighbor in targets[offsets[current]:offsets[current + 1]]:
+            if not visited[neighbor]:
+                visited[neighbor] = 1
+                stack.append(neighbor)
+    
+    return False
+
+
 def find_shortest_path(graph, start, end):
     """
     Find shortest path between two locations using Dijkstra's algorithm
@@ -129,6 +338,9 @@ def find_shortest_path(graph, start, end):
     if start not in graph or end not in graph:
         return (float('inf'), [])
     
+    if isinstance(graph, CSRGraph):
+        return find_shortest_path_csr(graph, graph.ids[start], graph.ids[end])
+    
     # Initialize distances and previous nodes
     distances = {node: float('inf') for node in graph}
     distances[start] = 0
@@ -171,12 +383,68 @@ def find_shortest_path(graph, start, end):
     return (float('inf'), [])
 
 
+def find_shortest_path_csr(graph, start, end):
+    """
+    Find shortest path between two node ids of a CSRGraph using Dijkstra's algorithm
+    
+    Equal-length paths may be chosen differently from the dict version, since ties in
+    the priority queue are broken by node id instead of location name.
+    
+    Args:
+        graph (CSRGraph): Graph representation
+        start (int): Starting node id
+        end (int): Destination node id
+        
+    Returns:
+        tuple: (distance, path) where path is a list of location names
+    """
+    offsets = graph.offsets
+    targets = graph.targets
+    weights = graph.weights
+    
+    # Per-node state in typed arrays instead of dictionaries keyed by name
+    distances = array('d', [float('inf')]) * len(graph)
+    distances[start] = 0
+    previous = array('i', [-1]) * len(graph)
+    visited = bytearray(len(graph))
+    
+    pq = [(0.0, start)]
+    
+    while pq:
+        current_dist, current = heapq.heappop(pq)
+        
+        if visited[current]:
+            continue
+        visited[current] = 1
+        
+        if current == end:
+            # Reconstruct path
+            path = []
+            while current != -1:
+                path.append(graph.names[current])
+                current = previous[current]
+            path.reverse()
+            distance = distances[end]
+            return (int(distance) if graph.integer_weights else distance, path)
+        
+        low = offsets[current]
+        high = offsets[current + 1]
+        for neighbor, weight in zip(targets[low:high], weights[low:high]):
+            distance = current_dist + weight
+            if distance < distances[neighbor]:
+                distances[neighbor] = distance
+                previous[neighbor] = current
+                heapq.heappush(pq, (distance, neighbor))
+    
+    return (float('inf'), [])
+
+
 def plan_delivery(graph, depot, deliveries):
     """
     Plan optimal delivery route using greedy nearest neighbor approach
     
     Args:
-        graph (dict): Graph representation
+        graph (dict): Graph representation (a dict or a CSRGraph)
         depot (str): Starting depot location
         deliveries (list): List of delivery locations
         